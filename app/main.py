@@ -3,6 +3,11 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from app.routes import settings as settings_route
 from app.routes import tts as tts_route
+from app.routes import metrics as metrics_route
+from app.routes import video as video_route
+from classes.workspace import Workspace
+from classes.tts_batch import tts_batch
+from classes.render_jobs import render_jobs
 import os
 
 app = FastAPI()
@@ -17,6 +22,19 @@ templates = Jinja2Templates(directory="templates")
 # 라우터 등록
 app.include_router(settings_route.router)
 app.include_router(tts_route.router)
+app.include_router(metrics_route.router)
+app.include_router(video_route.router)
+
+@app.on_event("startup")
+def sweep_workspaces():
+    """비정상 종료된 작업이 남긴 작업 공간 삭제"""
+    Workspace.sweep()
+
+@app.on_event("shutdown")
+async def stop_workers():
+    """일괄 음성 생성 작업자와 영상 생성 작업자(렌더링 프로세스 포함) 종료"""
+    await tts_batch.shutdown()
+    await render_jobs.shutdown()
 
 @app.get("/")
 def root(request: Request):
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from classes.metrics import metrics
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """단계별 소요 시간과 카운터를 Prometheus 텍스트 형식으로 반환"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
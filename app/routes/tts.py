@@ -1,11 +1,18 @@
 from fastapi import APIRouter, Request, Form, HTTPException
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, StreamingResponse
 from classes.tts import TextToSpeech
+from classes.tts_batch import tts_batch
 from classes.settings import Settings
+from classes.workspace import Workspace
+from classes.subtitle_writer import SubtitleWriter
+from starlette.background import BackgroundTask
 import tempfile
 import os
+import json
+import base64
 import asyncio
+import mimetypes
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
@@ -79,6 +86,146 @@ async def generate_audio_api(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"음성 생성 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/api/generate-audio-stream")
+async def generate_audio_stream_api(
+    text: str = Form(...),
+    voice: str = Form(...),
+    speed: str = Form("1.0"),
+    pause: float = Form(0.0)
+):
+    """
+    음성 생성 스트리밍 API (NDJSON)
+    
+    세그먼트가 준비되는 대로 한 줄에 하나씩 JSON 이벤트를 보낸다.
+    segment 이벤트의 audio는 base64로 인코딩된 오디오(format: mp3/wav)이고
+    subtitles에는 그 세그먼트의 자막이 함께 들어 있다.
+    마지막 done 이벤트에 전체 파일의 download_url이 포함된다.
+    """
+    if not text.strip():
+        raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
+    
+    tts = TextToSpeech(output_dir="outputs")
+    tts.set_voice(voice)
+    tts.set_speed(speed)
+    
+    # 쉼 옵션이 있으면 텍스트 끝에 추가
+    if pause > 0:
+        text = text + f" [쉼:{pause}]"
+    
+    async def event_stream():
+        async for event in tts.convert_stream(text):
+            if event['type'] == 'segment':
+                event['audio'] = base64.b64encode(event['audio']).decode('ascii')
+            elif event['type'] == 'done':
+                audio_path = event['audio_path']
+                total_duration = max([sub['end_time'] for sub in event['subtitles']]) if event['subtitles'] else 0
+                event['file_size'] = f"{round(os.path.getsize(audio_path) / (1024 * 1024), 2)} MB"
+                event['duration'] = f"{total_duration:.2f}초"
+                event['download_url'] = f"/download-audio?file={os.path.basename(audio_path)}"
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+@router.post("/api/estimate-duration")
+async def estimate_duration_api(
+    text: str = Form(...),
+    voice: str = Form(...),
+    speed: str = Form("1.0"),
+    pause: float = Form(0.0)
+):
+    """
+    음성 길이 예측 API (합성하지 않음)
+
+    실제 합성 결과로 계속 보정되는 음성별 길이 모델로 예상 길이를 계산한다.
+    """
+    if not text.strip():
+        return JSONResponse(content={"success": True, "duration": 0, "speech_duration": 0,
+                                     "pause_duration": 0, "segments": 0})
+
+    tts = TextToSpeech(output_dir="outputs")
+    tts.set_voice(voice)
+    tts.set_speed(speed)
+
+    # 쉼 옵션이 있으면 텍스트 끝에 추가
+    if pause > 0:
+        text = text + f" [쉼:{pause}]"
+
+    estimate = tts.estimate(text)
+    estimate["success"] = True
+    return JSONResponse(content=estimate)
+
+@router.post("/api/batch-audio")
+async def batch_audio_api(request: Request):
+    """
+    일괄 음성 생성 API
+    
+    JSON 본문 {"items": [{"text", "voice", "speed", "pause", "output_format"}, ...]}을 받아
+    작업을 큐에 넣고 바로 batch_id와 작업 ID 목록을 반환한다.
+    작업은 정해진 수의 작업자가 처리하며 진행 상황은 조회 API나 이벤트 스트림으로 확인한다.
+    """
+    try:
+        body = await request.json()
+    except Exception:
+        raise HTTPException(status_code=400, detail="JSON 본문이 올바르지 않습니다.")
+    
+    items = body.get("items") if isinstance(body, dict) else body
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="items 목록이 필요합니다.")
+    
+    try:
+        batch = await tts_batch.submit(items)
+    except (ValueError, TypeError, AttributeError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청입니다: {str(e)}")
+    
+    batch["success"] = True
+    batch["status_url"] = f"/api/batch-audio/{batch['batch_id']}"
+    batch["events_url"] = f"/api/batch-audio/{batch['batch_id']}/events"
+    return JSONResponse(content=batch)
+
+@router.get("/api/batch-audio/{batch_id}")
+async def batch_audio_status_api(batch_id: str, subtitles: bool = False):
+    """일괄 음성 생성 진행 상황 (subtitles=true면 작업별 자막 포함)"""
+    status = tts_batch.batch_status(batch_id, include_subtitles=subtitles)
+    if status is None:
+        raise HTTPException(status_code=404, detail="일괄 작업을 찾을 수 없습니다.")
+    status["success"] = True
+    return JSONResponse(content=status)
+
+@router.get("/api/batch-audio/{batch_id}/events")
+async def batch_audio_events_api(batch_id: str):
+    """
+    일괄 음성 생성 이벤트 스트림 (Server-Sent Events)
+    
+    작업 상태가 바뀔 때마다 job 이벤트로 작업 정보(완료되면 자막 포함)를 보내고
+    모든 작업이 끝나면 done 이벤트로 진행 상황 요약을 보낸 뒤 종료한다.
+    """
+    jobs = tts_batch.get_batch(batch_id)
+    if jobs is None:
+        raise HTTPException(status_code=404, detail="일괄 작업을 찾을 수 없습니다.")
+    
+    async def event_stream():
+        async for job in tts_batch.subscribe([job.id for job in jobs]):
+            if job is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: job\ndata: {json.dumps(job, ensure_ascii=False)}\n\n"
+        summary = tts_batch.batch_status(batch_id) or {"batch_id": batch_id}
+        summary.pop("jobs", None)
+        yield f"event: done\ndata: {json.dumps(summary, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+@router.get("/api/tts-jobs/{job_id}")
+async def tts_job_api(job_id: str):
+    """일괄 작업 하나의 상태와 결과 (자막 포함)"""
+    job = tts_batch.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    data = job.to_dict()
+    data["success"] = True
+    return JSONResponse(content=data)
+
 @router.get("/download-audio")
 async def download_audio(file: str):
     """생성된 음성 파일 다운로드"""
@@ -95,7 +242,7 @@ async def download_audio(file: str):
     return FileResponse(
         path=file_path,
         filename=file,
-        media_type='audio/mpeg'
+        media_type=mimetypes.guess_type(file_path)[0] or 'audio/mpeg'
     )
 
 @router.post("/api/generate-srt")
@@ -124,15 +271,17 @@ async def generate_srt_api(
         # SRT 파일 생성
         srt_content = tts.subtitles_to_srt(subtitles)
         
-        # 임시 SRT 파일 생성
-        temp_srt = tempfile.mktemp(suffix='.srt')
+        # 임시 SRT 파일 생성 (응답을 보낸 뒤 작업 공간째 삭제)
+        workspace = Workspace()
+        temp_srt = workspace.file('.srt')
         with open(temp_srt, 'w', encoding='utf-8') as f:
             f.write(srt_content)
         
         return FileResponse(
             path=temp_srt,
             filename="subtitles.srt",
-            media_type='text/plain'
+            media_type='text/plain',
+            background=BackgroundTask(workspace.close)
         )
         
     except Exception as e:
@@ -140,9 +289,4 @@ async def generate_srt_api(
 
 def format_srt_time(seconds: float) -> str:
     """초를 SRT 시간 형식(HH:MM:SS,mmm)으로 변환"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millisecs = int((seconds % 1) * 1000)
-    
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+    return SubtitleWriter.srt_time(seconds)
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Request, HTTPException
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from classes.render_jobs import render_jobs
+import os
+import json
+import mimetypes
+
+router = APIRouter()
+
+@router.post("/api/render-jobs")
+async def submit_render_job_api(request: Request):
+    """
+    영상 생성 작업 제출 API
+
+    JSON 본문 {"script_text" 또는 "script_id", "upload", "filename"}을 받아
+    작업을 큐에 넣고 바로 job_id를 반환한다.
+    영상 생성은 별도 프로세스에서 실행되며 진행 상황은 조회 API나 이벤트 스트림으로 확인한다.
+    """
+    try:
+        body = await request.json()
+    except Exception:
+        raise HTTPException(status_code=400, detail="JSON 본문이 올바르지 않습니다.")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="JSON 객체가 필요합니다.")
+
+    try:
+        job = render_jobs.submit(body)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청입니다: {str(e)}")
+
+    job["success"] = True
+    job["status_url"] = f"/api/render-jobs/{job['job_id']}"
+    job["events_url"] = f"/api/render-jobs/{job['job_id']}/events"
+    return JSONResponse(content=job)
+
+@router.get("/api/render-jobs")
+async def render_jobs_api():
+    """영상 생성 작업 목록과 상태별 작업 수"""
+    return JSONResponse(content={"success": True, "stats": render_jobs.stats, "jobs": render_jobs.list_jobs()})
+
+@router.get("/api/render-jobs/{job_id}")
+async def render_job_status_api(job_id: str):
+    """영상 생성 작업 하나의 상태와 진행률"""
+    job = render_jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    data = job.to_dict()
+    data["success"] = True
+    return JSONResponse(content=data)
+
+@router.post("/api/render-jobs/{job_id}/cancel")
+async def cancel_render_job_api(job_id: str):
+    """영상 생성 작업 취소 (대기 중이면 바로, 실행 중이면 렌더링 프로세스를 종료)"""
+    job = render_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    data = job.to_dict()
+    data["success"] = True
+    return JSONResponse(content=data)
+
+@router.get("/api/render-jobs/{job_id}/events")
+async def render_job_events_api(job_id: str):
+    """
+    영상 생성 작업 이벤트 스트림 (Server-Sent Events)
+
+    단계(tts, images, render, mux, upload)나 진행률이 바뀔 때마다 job 이벤트로 작업 정보를 보내고
+    작업이 끝나면 done 이벤트로 최종 상태를 보낸 뒤 종료한다.
+    """
+    if render_jobs.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    async def event_stream():
+        async for job in render_jobs.subscribe(job_id):
+            if job is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: job\ndata: {json.dumps(job, ensure_ascii=False)}\n\n"
+        job = render_jobs.get_job(job_id)
+        summary = job.to_dict() if job is not None else {"job_id": job_id}
+        yield f"event: done\ndata: {json.dumps(summary, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+@router.get("/download-video")
+async def download_video(file: str):
+    """생성된 영상 파일(과 자막 파일) 다운로드"""
+    file_path = os.path.join("outputs", os.path.basename(file))
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    media_type = 'text/vtt' if file_path.endswith('.vtt') else mimetypes.guess_type(file_path)[0]
+    return FileResponse(path=file_path, filename=os.path.basename(file),
+                        media_type=media_type or 'application/octet-stream')
@@ -0,0 +1,152 @@
+import os
+import asyncio
+from typing import List, Optional
+from pydub import AudioSegment
+
+class AudioAssembler:
+    # 무음을 한 번에 쓰는 최대 크기 (bytes) - 긴 쉼도 메모리를 일정하게 사용
+    _SILENCE_CHUNK_BYTES = 64 * 1024
+    # 출력 형식별 ffmpeg 먹서와 코덱 옵션 (wav는 무손실, m4a는 MP4에 그대로 복사할 수 있는 AAC)
+    FORMATS = {
+        'mp3': ['-f', 'mp3'],
+        'wav': ['-c:a', 'pcm_s16le', '-f', 'wav'],
+        'm4a': ['-c:a', 'aac', '-b:a', '192k', '-movflags', '+faststart', '-f', 'ipod'],
+    }
+
+    def __init__(self, output_path: str, output_format: str = "mp3",
+                 sample_rate: int = 24000, channels: int = 1, sample_width: int = 2):
+        """
+        세그먼트와 무음을 순서대로 인코더에 바로 흘려보내는 오디오 조립 클래스
+
+        `final_audio += segment` 반복처럼 커지는 버퍼를 매번 복사하지 않고,
+        PCM을 ffmpeg 인코더의 stdin으로 순서대로 써서 시간은 길이에 비례하고
+        메모리는 세그먼트 하나 크기로 유지된다.
+
+        Args:
+            output_path (str): 출력 파일 경로
+            output_format (str): 출력 형식 ('mp3', 'wav', 'm4a')
+            sample_rate (int): 출력 샘플레이트
+            channels (int): 출력 채널 수
+            sample_width (int): 샘플 크기 (bytes)
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"output_format must be one of {tuple(self.FORMATS)}")
+        self._output_path = output_path
+        self._output_format = output_format
+        self._sample_rate = sample_rate
+        self._channels = channels
+        self._sample_width = sample_width
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._frames_written: int = 0
+
+    @property
+    def output_path(self) -> str:
+        """출력 파일 경로를 반환"""
+        return self._output_path
+
+    @property
+    def duration(self) -> float:
+        """지금까지 쓴 오디오 길이(초)를 반환"""
+        return self._frames_written / self._sample_rate
+
+    def _encoder_command(self) -> List[str]:
+        """raw PCM을 받아 출력 형식으로 인코딩하는 ffmpeg 명령"""
+        sample_format = {1: 'u8', 2: 's16le', 4: 's32le'}[self._sample_width]
+        return [
+            AudioSegment.converter, '-y', '-v', 'error',
+            '-f', sample_format, '-ar', str(self._sample_rate), '-ac', str(self._channels),
+            '-i', 'pipe:0',
+            *self.FORMATS[self._output_format], self._output_path
+        ]
+
+    async def open(self) -> None:
+        """인코더 프로세스 시작"""
+        self._process = await asyncio.create_subprocess_exec(
+            *self._encoder_command(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self._frames_written = 0
+
+    async def _write(self, data: bytes) -> None:
+        """인코더에 PCM을 쓰고 파이프가 비워질 때까지 대기 (역압)"""
+        if not self._process:
+            raise ValueError("인코더가 열려 있지 않습니다")
+        self._process.stdin.write(data)
+        await self._process.stdin.drain()
+        self._frames_written += len(data) // (self._sample_width * self._channels)
+
+    def _normalize(self, segment: AudioSegment) -> AudioSegment:
+        """세그먼트를 출력 PCM 형식으로 맞춤"""
+        if segment.frame_rate != self._sample_rate:
+            segment = segment.set_frame_rate(self._sample_rate)
+        if segment.channels != self._channels:
+            segment = segment.set_channels(self._channels)
+        if segment.sample_width != self._sample_width:
+            segment = segment.set_sample_width(self._sample_width)
+        return segment
+
+    async def add_segment(self, segment: AudioSegment) -> float:
+        """
+        음성 세그먼트를 이어서 씀
+
+        Returns:
+            float: 쓰인 세그먼트 길이(초)
+        """
+        segment = self._normalize(segment)
+        await self._write(segment.raw_data)
+        return segment.frame_count() / self._sample_rate
+
+    async def add_silence(self, seconds: float) -> float:
+        """
+        무음을 이어서 씀 (큰 버퍼를 만들지 않고 조각 단위로 씀)
+
+        Returns:
+            float: 쓰인 무음 길이(초)
+        """
+        frame_size = self._sample_width * self._channels
+        remaining = int(round(seconds * self._sample_rate)) * frame_size
+        silence_byte = b'\x80' if self._sample_width == 1 else b'\x00'
+        chunk = silence_byte * min(remaining, self._SILENCE_CHUNK_BYTES)
+
+        while remaining > 0:
+            part = chunk if remaining >= len(chunk) else chunk[:remaining]
+            await self._write(part)
+            remaining -= len(part)
+
+        return seconds
+
+    async def close(self) -> str:
+        """인코딩을 마무리하고 출력 경로를 반환"""
+        if not self._process:
+            raise ValueError("인코더가 열려 있지 않습니다")
+
+        self._process.stdin.close()
+        error = await self._process.stderr.read()
+        returncode = await self._process.wait()
+        self._process = None
+
+        if returncode != 0:
+            raise Exception(f"오디오 인코딩 실패: {error.decode('utf-8', errors='ignore')}")
+        return self._output_path
+
+    async def abort(self) -> None:
+        """인코더를 중단하고 만들다 만 출력 파일을 삭제"""
+        if self._process:
+            if self._process.returncode is None:
+                self._process.kill()
+            await self._process.wait()
+            self._process = None
+        if os.path.exists(self._output_path):
+            os.remove(self._output_path)
+
+    async def __aenter__(self) -> "AudioAssembler":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.abort()
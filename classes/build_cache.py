@@ -0,0 +1,147 @@
+import os
+import json
+import uuid
+import shutil
+import hashlib
+from typing import Dict, Iterable, Optional
+from classes.settings import Settings
+from classes.lru_directory import LRUDirectory
+
+class BuildCache:
+    # 키 형식이 바뀌면 올려서 이전 빌드의 구간을 쓰지 않도록 함
+    VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: Optional[float] = None):
+        """
+        렌더링이 끝난 영상 구간(MP4)을 디스크에 보관하는 LRU 캐시
+
+        구간은 화면에 보이는 입력값(검색어, 자막 텍스트와 구간 안의 시간, 길이, 스타일, 인코딩 설정)의
+        해시로 저장되므로 대본에서 한 줄만 고치면 그 줄이 들어 있는 구간만 다시 렌더링된다.
+
+        Args:
+            cache_dir (Optional[str]): 캐시 디렉토리. None이면 설정값 사용
+            max_size_mb (Optional[float]): 캐시 최대 용량(MB). None이면 설정값 사용
+        """
+        self._settings = Settings()
+        self._cache_dir: str = cache_dir or self._settings.video_build_cache_dir
+        if max_size_mb is None:
+            max_size_mb = self._settings.video_build_cache_max_size_mb
+        self._max_size_bytes: int = int(max_size_mb * 1024 * 1024)
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._entries = LRUDirectory(self._cache_dir, '.mp4')
+
+    @property
+    def cache_dir(self) -> str:
+        """캐시 디렉토리를 반환"""
+        return self._cache_dir
+
+    @property
+    def hits(self) -> int:
+        """캐시 적중 횟수를 반환"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """캐시 미스 횟수를 반환"""
+        return self._misses
+
+    @property
+    def stats(self) -> Dict:
+        """캐시 통계를 반환"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'entries': self._entries.entries,
+            'size_bytes': self._entries.size_bytes,
+            'max_size_bytes': self._max_size_bytes
+        }
+
+    @classmethod
+    def make_key(cls, inputs: Dict) -> str:
+        """구간 입력값으로 캐시 키(sha256) 생성"""
+        payload = json.dumps([cls.VERSION, inputs], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        """캐시 키에 해당하는 파일 경로"""
+        return self._entries.path(key)
+
+    def get(self, key: str, dest: Optional[str] = None) -> Optional[str]:
+        """
+        캐시에서 구간을 찾음
+
+        dest를 주면 구간을 dest에 하드 링크(다른 파일 시스템이면 복사)해서 그 경로를 반환한다.
+        이후에 다른 작업이 캐시를 정리해도 이 작업이 쓰는 구간은 지워지지 않는다.
+
+        Returns:
+            Optional[str]: 캐시에 있으면 구간 MP4 경로 (dest가 있으면 dest), 없으면 None
+        """
+        path = self.entry_path(key)
+        # 최근 사용 시각 갱신 (LRU 기준은 파일 수정 시각)
+        found = self._entries.touch(path)
+        if found and dest is not None:
+            try:
+                try:
+                    os.link(path, dest)
+                except OSError as e:
+                    if isinstance(e, FileNotFoundError):
+                        raise
+                    shutil.copyfile(path, dest)
+                path = dest
+            except FileNotFoundError:
+                # 찾은 뒤 가져오기 전에 다른 작업이 정리한 경우
+                found = False
+
+        if not found:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return path
+
+    def put(self, key: str, video_path: str, evict: bool = True) -> str:
+        """
+        구간을 캐시에 복사
+
+        Args:
+            key (str): 캐시 키
+            video_path (str): 렌더링한 구간 MP4
+            evict (bool): 저장 후 바로 용량 정리. 한 빌드에서 여러 구간을 저장할 때는 False로 두고
+                빌드가 끝난 뒤 evict()를 한 번 부름
+
+        Returns:
+            str: 캐시에 저장된 구간 MP4 경로
+        """
+        path = self.entry_path(key)
+        # 같은 프로세스의 여러 스레드가 같은 구간을 동시에 저장해도 임시 파일이 겹치지 않게 함
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            shutil.copyfile(video_path, temp_path)
+            self._entries.commit(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        if evict:
+            self.evict(keep=[key])
+        return path
+
+    def evict(self, keep: Iterable[str] = ()) -> int:
+        """
+        최대 용량을 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+
+        Args:
+            keep (Iterable[str]): 지우지 않을 캐시 키 (방금 끝난 빌드가 쓴 구간)
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        evicted = self._entries.evict(self._max_size_bytes, keep=[self.entry_path(key) for key in keep])
+        self._evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """캐시 항목을 모두 삭제"""
+        self._entries.clear()
@@ -0,0 +1,194 @@
+import os
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from classes.settings import Settings
+
+# 글꼴 경로를 지정하지 않았을 때 찾아볼 한글 굵은 글꼴 (Linux, macOS, Windows)
+_FONT_CANDIDATES = (
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc',
+    '/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc',
+    '/usr/share/fonts/google-noto-cjk/NotoSansCJK-Bold.ttc',
+    '/usr/share/fonts/truetype/noto/NotoSansKR-Bold.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+    '/System/Library/Fonts/AppleSDGothicNeo.ttc',
+    'C:/Windows/Fonts/malgunbd.ttf',
+)
+
+class CaptionRenderer:
+    # 프로세스 전체에서 공유하는 글꼴 캐시 ((경로, 크기) → 글꼴)
+    _fonts: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+    # 프로세스 전체에서 공유하는 자막 이미지 LRU 캐시 ((텍스트, 스타일, 최대 너비) → RGBA 배열)
+    _captions: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+    _captions_bytes: List[int] = [0]
+    _lock = threading.Lock()
+    # 기본 글꼴 경고를 이미 출력했는지 (프로세스마다 한 번만, 크기마다 반복하지 않음)
+    _default_font_warned: bool = False
+    CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, font_path: Optional[str] = None, font_size: int = 48, color: str = 'white',
+                 stroke_color: str = 'black', stroke_width: int = 2, max_width: int = 1728):
+        """
+        자막 이미지를 Pillow로 직접 그리는 클래스 (ImageMagick 불필요)
+
+        글꼴은 한 번만 읽고, 그린 자막 이미지는 (텍스트, 스타일, 최대 너비)별로
+        프로세스 전체의 LRU 캐시(최대 CACHE_MAX_BYTES)에 보관해서
+        같은 자막이나 같은 영상을 다시 만들 때 다시 그리지 않는다.
+
+        Args:
+            font_path (Optional[str]): 글꼴 파일 경로. None이면 설정값, 그다음 시스템 한글 글꼴
+            font_size (int): 글자 크기(px)
+            color (str): 글자 색
+            stroke_color (str): 테두리 색
+            stroke_width (int): 테두리 두께(px)
+            max_width (int): 한 줄의 최대 너비(px). 넘으면 줄바꿈
+        """
+        self._settings = Settings()
+        self._font_path: str = font_path or self._settings.video_subtitle_font_path or self._find_font()
+        self._font_size = font_size
+        self._color = color
+        self._stroke_color = stroke_color
+        self._stroke_width = stroke_width
+        self._max_width = max_width
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @staticmethod
+    def _find_font() -> str:
+        """시스템에서 한글 글꼴 찾기 (없으면 빈 문자열: Pillow 기본 글꼴 사용)"""
+        for path in _FONT_CANDIDATES:
+            if os.path.exists(path):
+                return path
+        return ''
+
+    @property
+    def font_path(self) -> str:
+        """사용 중인 글꼴 파일 경로를 반환"""
+        return self._font_path
+
+    @property
+    def max_width(self) -> int:
+        """한 줄의 최대 너비를 반환"""
+        return self._max_width
+
+    @max_width.setter
+    def max_width(self, value: int) -> None:
+        """한 줄의 최대 너비를 설정"""
+        if value < 1:
+            raise ValueError("max_width must be greater than 0")
+        self._max_width = value
+
+    @property
+    def stats(self) -> Dict:
+        """이 렌더러의 캐시 적중/미스 횟수와 공유 캐시 크기를 반환"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'entries': len(self._captions),
+            'bytes': self._captions_bytes[0]
+        }
+
+    @property
+    def font(self) -> ImageFont.FreeTypeFont:
+        """글꼴 (프로세스에서 경로/크기별로 한 번만 읽음)"""
+        key = (self._font_path, self._font_size)
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    if self._font_path:
+                        font = ImageFont.truetype(self._font_path, self._font_size)
+                    else:
+                        if not CaptionRenderer._default_font_warned:
+                            CaptionRenderer._default_font_warned = True
+                            print("⚠️ 한글 글꼴을 찾지 못해 기본 글꼴을 사용합니다 (video_settings.subtitle_font_path 설정)")
+                        font = ImageFont.load_default(self._font_size)
+                    self._fonts[key] = font
+        return font
+
+    def _style_key(self) -> Tuple:
+        """캐시 키에 들어가는 스타일 값"""
+        return (self._font_path, self._font_size, self._color, self._stroke_color, self._stroke_width)
+
+    def wrap(self, text: str) -> List[str]:
+        """
+        최대 너비에 맞춰 줄바꿈
+
+        띄어쓰기 단위로 나누고, 한 단어가 너무 길면(띄어쓰기 없는 한글 등) 글자 단위로 나눈다.
+        """
+        font = self.font
+        limit = self._max_width - 2 * self._stroke_width
+        lines: List[str] = []
+
+        for paragraph in text.splitlines() or ['']:
+            current = ''
+            for word in paragraph.split(' '):
+                candidate = f"{current} {word}" if current else word
+                if font.getlength(candidate) <= limit:
+                    current = candidate
+                    continue
+                if current:
+                    lines.append(current)
+                current = ''
+                # 단어 하나가 한 줄보다 길면 글자 단위로 나눔
+                for char in word:
+                    if current and font.getlength(current + char) > limit:
+                        lines.append(current)
+                        current = ''
+                    current += char
+            lines.append(current)
+        return lines
+
+    def _draw(self, text: str) -> np.ndarray:
+        """자막 이미지 그리기 (RGBA, 글자 영역에 맞춰 자름)"""
+        font = self.font
+        content = '\n'.join(self.wrap(text))
+        spacing = max(4, self._font_size // 6)
+
+        measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        left, top, right, bottom = measure.multiline_textbbox(
+            (0, 0), content, font=font, spacing=spacing, align='center', stroke_width=self._stroke_width
+        )
+        left, top, right, bottom = math.floor(left), math.floor(top), math.ceil(right), math.ceil(bottom)
+        image = Image.new('RGBA', (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        ImageDraw.Draw(image).multiline_text(
+            (-left, -top), content, font=font, fill=self._color, spacing=spacing, align='center',
+            stroke_width=self._stroke_width, stroke_fill=self._stroke_color
+        )
+        return np.asarray(image)
+
+    def render(self, text: str) -> np.ndarray:
+        """
+        자막 이미지를 반환 (캐시에 있으면 그대로 사용)
+
+        Returns:
+            np.ndarray: (높이, 너비, 4) RGBA 배열 (읽기 전용, 여러 클립이 공유)
+        """
+        key = (text, self._style_key(), self._max_width)
+        with self._lock:
+            cached = self._captions.get(key)
+            if cached is not None:
+                self._captions.move_to_end(key)
+                self._hits += 1
+                return cached
+
+        self._misses += 1
+        bitmap = self._draw(text)
+        bitmap.flags.writeable = False
+        with self._lock:
+            if key not in self._captions:
+                self._captions[key] = bitmap
+                self._captions_bytes[0] += bitmap.nbytes
+            # 캐시가 최대 크기를 넘으면 오래 쓰지 않은 자막부터 삭제
+            while self._captions_bytes[0] > self.CACHE_MAX_BYTES and len(self._captions) > 1:
+                _, evicted = self._captions.popitem(last=False)
+                self._captions_bytes[0] -= evicted.nbytes
+        return bitmap
+
+    def render_image(self, text: str) -> Image.Image:
+        """자막 이미지를 PIL 이미지로 반환"""
+        return Image.fromarray(self.render(text), 'RGBA')
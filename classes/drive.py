@@ -3,6 +3,7 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 from typing import Optional
 from classes.settings import Settings
+from classes.metrics import metrics
 
 class DriveUpload:
     def __init__(self):
@@ -96,11 +97,13 @@ class DriveUpload:
                 resumable=True
             )
             
-            file = service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name, size, mimeType'
-            ).execute()
+            with metrics.span('drive_upload'):
+                file = service.files().create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields='id, name, size, mimeType'
+                ).execute()
+            metrics.inc('drive_upload_bytes_total', int(file.get('size') or 0))
             
             # anyoneWithLink 권한 부여 제거 (서비스 어카운트 인증만 사용)
             # 업로드 후 권한 부여 코드 삭제
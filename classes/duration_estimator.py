@@ -0,0 +1,234 @@
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+from classes.settings import Settings
+from classes.readfile import ReadFile
+from classes.writefile import WriteFile
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 원자적 교체만 함
+    fcntl = None
+
+# 발음되지 않는 문자 (공백, 문장 부호)
+_SILENT_CHARS = re.compile(r"[\s.,!?…~\-'\"()\[\]:;·、。]")
+# 쉼표/마침표 등 잠깐 쉬게 되는 문장 부호
+_BREAK_CHARS = re.compile(r"[.,!?…。、]")
+
+class DurationEstimator:
+    # 학습 데이터가 없을 때 쓰는 기본값 (한국어 기본 속도 기준)
+    DEFAULT_SECONDS_PER_CHAR = 0.17
+    DEFAULT_INTERCEPT = 0.3
+    # 음성별 직선을 따로 쓰기 위한 최소 표본 수
+    MIN_SAMPLES = 5
+    # 누적 통계를 조금씩 잊어서 서비스 변화에 따라가도록 함
+    DECAY = 0.995
+    _GLOBAL_KEY = '*'
+    # 모델 파일별로 프로세스에 하나씩 두는 공유 인스턴스
+    _instances: Dict[str, 'DurationEstimator'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, model_path: Optional[str] = None):
+        """
+        합성 전에 세그먼트/대본 길이를 예측하는 클래스
+
+        음성마다 `길이 = 절편 + 초당 글자 기울기 × 발음 글자 수` 직선을 두고
+        실제 합성 결과가 나올 때마다 누적 통계를 갱신한다 (온라인 최소제곱).
+        길이는 속도 1.0배 기준으로 저장하므로 rate/속도가 달라도 같은 모델을 쓴다.
+        작업마다 새로 만들지 말고 shared()로 프로세스 공용 인스턴스를 쓴다.
+
+        Args:
+            model_path (Optional[str]): 모델 파일 경로. None이면 설정값 사용
+        """
+        self._settings = Settings()
+        self._model_path: str = model_path or self._settings.tts_duration_model_path
+        self._models: Dict[str, Dict[str, float]] = {}
+        # 마지막 저장 이후의 관측값 (키, 길이 척도, 1.0배 기준 길이). 저장할 때 파일 내용에 다시 반영
+        self._pending: List[Tuple[str, float, float]] = []
+        self._lock = threading.Lock()
+        self._models = self._read()
+
+    @classmethod
+    def shared(cls, model_path: Optional[str] = None) -> 'DurationEstimator':
+        """
+        모델 파일별 프로세스 공용 인스턴스를 반환
+
+        동시에 도는 작업들이 각자 모델을 읽고 저장하면 마지막에 저장한 작업의 관측값만 남으므로
+        한 프로세스 안에서는 같은 인스턴스로 보정하고 저장한다.
+        """
+        path = os.path.abspath(model_path or Settings().tts_duration_model_path)
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    @property
+    def model_path(self) -> str:
+        """모델 파일 경로를 반환"""
+        return self._model_path
+
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        """음성별 표본 수, 기울기, 절편, 평균 오차율을 반환"""
+        result = {}
+        with self._lock:
+            models = dict(self._models)
+        for voice, model in models.items():
+            intercept, slope = self._fit(model)
+            result[voice] = {
+                'samples': int(round(model['n'])),
+                'seconds_per_char': round(slope, 4),
+                'intercept': round(intercept, 4),
+                'mean_error': round(model.get('error', 0.0), 4)
+            }
+        return result
+
+    def _read(self) -> Dict[str, Dict[str, float]]:
+        """저장된 모델을 읽음 (없거나 깨졌으면 빈 모델)"""
+        if not os.path.exists(self._model_path):
+            return {}
+        try:
+            return ReadFile(self._model_path, 'json').read().get('models', {})
+        except Exception as e:
+            print(f"⚠️ 길이 예측 모델을 읽지 못했습니다: {e}")
+            return {}
+
+    def save(self) -> None:
+        """
+        갱신된 모델을 파일로 저장
+
+        다른 프로세스(영상 작업 등)가 그 사이에 저장한 내용을 덮어쓰지 않도록
+        파일 잠금을 잡고 파일의 최신 모델을 다시 읽어 이번 관측값만 반영한 뒤
+        임시 파일에 써서 os.replace로 교체한다.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+
+        try:
+            directory = os.path.dirname(self._model_path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            with open(f"{self._model_path}.lock", 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                models = self._read()
+                for key, size, duration in pending:
+                    self._update(models, key, size, duration)
+                temp_path = f"{self._model_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                try:
+                    WriteFile({'models': models}, 'json', temp_path).write()
+                    os.replace(temp_path, self._model_path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+        except Exception:
+            # 다음 저장 때 다시 반영
+            with self._lock:
+                self._pending = pending + self._pending
+            raise
+
+        with self._lock:
+            # 저장하는 동안 들어온 관측값은 새 모델 위에 다시 쌓음
+            for key, size, duration in self._pending:
+                self._update(models, key, size, duration)
+            self._models = models
+
+    @staticmethod
+    def features(text: str) -> Dict[str, int]:
+        """텍스트에서 길이 예측에 쓰는 값 (발음 글자 수, 끊어 읽는 문장 부호 수)"""
+        return {
+            'chars': len(_SILENT_CHARS.sub('', text)),
+            'breaks': len(_BREAK_CHARS.findall(text))
+        }
+
+    @classmethod
+    def _size(cls, text: str) -> float:
+        """발음 길이의 척도 (문장 부호 하나를 글자 두 개로 계산)"""
+        features = cls.features(text)
+        return features['chars'] + 2 * features['breaks']
+
+    def _fit(self, model: Dict[str, float]) -> Tuple[float, float]:
+        """누적 통계로 (절편, 기울기) 계산"""
+        n, sx, sy = model['n'], model['sx'], model['sy']
+        variance = n * model['sxx'] - sx * sx
+        if n >= self.MIN_SAMPLES and variance > 1e-9:
+            slope = (n * model['sxy'] - sx * sy) / variance
+            intercept = (sy - slope * sx) / n
+            if slope > 0:
+                return max(0.0, intercept), slope
+        if sx > 0:
+            # 표본이 적거나 길이가 모두 같으면 기본 절편을 두고 기울기만 맞춤
+            slope = max(sy - self.DEFAULT_INTERCEPT * n, 0.0) / sx
+            return self.DEFAULT_INTERCEPT, slope or self.DEFAULT_SECONDS_PER_CHAR
+        return self.DEFAULT_INTERCEPT, self.DEFAULT_SECONDS_PER_CHAR
+
+    def _model_for(self, voice: str) -> Optional[Dict[str, float]]:
+        """예측에 쓸 모델 (음성 표본이 부족하면 전체 모델)"""
+        model = self._models.get(voice)
+        if model and model['n'] >= self.MIN_SAMPLES:
+            return model
+        return self._models.get(self._GLOBAL_KEY) or model
+
+    def predict(self, text: str, voice: str, speed: float = 1.0) -> float:
+        """
+        세그먼트 하나의 합성 길이(초) 예측
+
+        Args:
+            text (str): 세그먼트 텍스트
+            voice (str): 음성 ID
+            speed (float): 실제 속도 배수 (rate와 시간 신축을 합친 값)
+
+        Returns:
+            float: 예상 길이(초)
+        """
+        size = self._size(text)
+        if size == 0:
+            return 0.0
+        model = self._model_for(voice)
+        intercept, slope = self._fit(model) if model else (self.DEFAULT_INTERCEPT, self.DEFAULT_SECONDS_PER_CHAR)
+        return (intercept + slope * size) / max(speed, 0.01)
+
+    def _update(self, models: Dict[str, Dict[str, float]], key: str, size: float, duration: float) -> None:
+        """모델 하나의 누적 통계 갱신"""
+        model = models.setdefault(
+            key, {'n': 0.0, 'sx': 0.0, 'sy': 0.0, 'sxx': 0.0, 'sxy': 0.0, 'error': 0.0, 'scored': 0}
+        )
+        if model['n'] > 0:
+            # 갱신 전 예측의 오차율을 지수 이동 평균으로 유지
+            intercept, slope = self._fit(model)
+            error = abs(intercept + slope * size - duration) / duration
+            model['error'] = error if not model['scored'] else model['error'] * 0.9 + error * 0.1
+            model['scored'] += 1
+        for field in ('n', 'sx', 'sy', 'sxx', 'sxy'):
+            model[field] *= self.DECAY
+        model['n'] += 1
+        model['sx'] += size
+        model['sy'] += duration
+        model['sxx'] += size * size
+        model['sxy'] += size * duration
+
+    def observe(self, text: str, voice: str, speed: float, duration: float) -> None:
+        """
+        실제 합성 결과로 모델 보정
+
+        Args:
+            text (str): 합성한 텍스트
+            voice (str): 음성 ID
+            speed (float): 적용된 속도 배수
+            duration (float): 실제 길이(초, 쉼 제외)
+        """
+        size = self._size(text)
+        if size == 0 or duration <= 0:
+            return
+        normalized = duration * speed  # 1.0배 기준 길이로 저장
+        with self._lock:
+            for key in (voice, self._GLOBAL_KEY):
+                self._update(self._models, key, size, normalized)
+                self._pending.append((key, size, normalized))
+
+    @staticmethod
+    def shortest_first(jobs: List[Dict], key: str = 'estimated_duration') -> List[Dict]:
+        """예상 길이가 짧은 작업부터 정렬 (대기 시간의 평균을 줄임)"""
+        return sorted(jobs, key=lambda job: job.get(key, 0.0))
@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional
+from classes.settings import Settings
+
+class EncodeProfile:
+    # 영상 인코딩 프로필 (libx264)
+    # - default: moviepy 기본값과 같음 (고정 프레임레이트, medium, CRF 23)
+    # - still/fast/quality: 정지 이미지 + 자막 영상용. 같은 프레임은 버리고(가변 프레임레이트)
+    #   stillimage 튜닝과 긴 GOP를 사용
+    PROFILES: Dict[str, Dict] = {
+        'default': {'preset': 'medium', 'crf': 23, 'tune': None, 'keyframe_seconds': 0, 'vfr': False},
+        'still': {'preset': 'veryfast', 'crf': 23, 'tune': 'stillimage', 'keyframe_seconds': 10, 'vfr': True},
+        'fast': {'preset': 'ultrafast', 'crf': 26, 'tune': 'stillimage', 'keyframe_seconds': 10, 'vfr': True},
+        'quality': {'preset': 'slow', 'crf': 18, 'tune': 'stillimage', 'keyframe_seconds': 5, 'vfr': True},
+    }
+
+    def __init__(self, name: Optional[str] = None, crf: Optional[int] = None, preset: Optional[str] = None):
+        """
+        영상 인코딩 설정 (프리셋, CRF, 튜닝, 키프레임 간격, 가변 프레임레이트)
+
+        Args:
+            name (Optional[str]): 프로필 이름. None이면 설정값 (video_settings.encode_profile)
+            crf (Optional[int]): 프로필의 CRF 대신 쓸 값. None이면 설정값 (0이면 프로필 값)
+            preset (Optional[str]): 프로필의 프리셋 대신 쓸 값. None이면 설정값 (빈 값이면 프로필 값)
+        """
+        self._settings = Settings()
+        self._name: str = 'default'
+        self.name = name or self._settings.video_encode_profile
+
+        profile = self.PROFILES[self._name]
+        crf = crf if crf is not None else self._settings.video_encode_crf
+        preset = preset if preset is not None else self._settings.video_encode_preset
+        self._crf: int = crf or profile['crf']
+        self._preset: str = preset or profile['preset']
+        self._tune: Optional[str] = profile['tune']
+        self._keyframe_seconds: float = profile['keyframe_seconds']
+        self._vfr: bool = profile['vfr']
+
+    @property
+    def name(self) -> str:
+        """프로필 이름을 반환"""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """프로필 이름을 설정"""
+        if value not in self.PROFILES:
+            raise ValueError(f"encode profile must be one of {tuple(self.PROFILES)}")
+        self._name = value
+
+    @property
+    def crf(self) -> int:
+        """CRF를 반환"""
+        return self._crf
+
+    @property
+    def preset(self) -> str:
+        """x264 프리셋을 반환"""
+        return self._preset
+
+    @property
+    def vfr(self) -> bool:
+        """가변 프레임레이트 사용 여부를 반환"""
+        return self._vfr
+
+    def decimate_filter(self, fps: int) -> Optional[str]:
+        """
+        이전 프레임과 같은 프레임을 버리는 필터 (가변 프레임레이트가 아니면 None)
+
+        자막이 바뀌지 않는 동안은 프레임을 만들지 않지만, 탐색과 마지막 프레임 길이를 위해
+        적어도 1초에 한 프레임은 남긴다.
+        """
+        if not self._vfr:
+            return None
+        return f"mpdecimate=max={fps}"
+
+    def codec_args(self, fps: int) -> List[str]:
+        """libx264 인코딩 인자 (코덱, 픽셀 형식 제외)"""
+        args = ['-preset', self._preset, '-crf', str(self._crf)]
+        if self._tune:
+            args += ['-tune', self._tune]
+        if self._keyframe_seconds:
+            # 프레임 수가 아니라 시간 기준으로 키프레임을 넣음 (가변 프레임레이트에서도 간격 유지)
+            args += ['-g', str(int(fps * self._keyframe_seconds)),
+                     '-force_key_frames', f"expr:gte(t,n_forced*{self._keyframe_seconds})"]
+        return args
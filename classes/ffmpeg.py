@@ -0,0 +1,183 @@
+import os
+import re
+import json
+import shutil
+import tempfile
+import subprocess
+from typing import Callable, Dict, List, Optional
+
+class FFmpeg:
+    def __init__(self, binary: Optional[str] = None):
+        """
+        ffmpeg/ffprobe 실행을 모아둔 클래스 (정보 확인, 스트림 복사 먹싱)
+
+        Args:
+            binary (Optional[str]): ffmpeg 실행 파일. None이면 PATH에서 찾고,
+                없으면 moviepy가 사용하는 imageio-ffmpeg 바이너리를 사용
+        """
+        self._binary: str = binary or self._find_binary()
+        self._probe_binary: Optional[str] = shutil.which('ffprobe')
+        self._filters: Optional[set] = None
+        self._supports_fps_mode: Optional[bool] = None
+
+    @staticmethod
+    def _find_binary() -> str:
+        """사용할 ffmpeg 실행 파일 경로"""
+        found = shutil.which('ffmpeg')
+        if found:
+            return found
+        try:
+            import imageio_ffmpeg
+            return imageio_ffmpeg.get_ffmpeg_exe()
+        except Exception:
+            return 'ffmpeg'
+
+    @property
+    def binary(self) -> str:
+        """ffmpeg 실행 파일 경로를 반환"""
+        return self._binary
+
+    def run(self, args: List[str], progress: Optional[Callable[[float], None]] = None,
+            duration: float = 0.0) -> subprocess.CompletedProcess:
+        """
+        ffmpeg 실행 (실패하면 stderr를 담아 예외 발생)
+
+        Args:
+            args (List[str]): ffmpeg 인자 (실행 파일 제외)
+            progress (Optional[Callable[[float], None]]): 진행률(0~1)을 받을 함수.
+                있으면 ffmpeg의 -progress 출력에서 처리한 시간 / duration을 계속 전달
+            duration (float): 출력 길이(초). progress의 기준
+        """
+        if progress is None or duration <= 0:
+            result = subprocess.run([self._binary, '-hide_banner', '-y', *args], capture_output=True, text=True)
+            if result.returncode != 0:
+                raise Exception(f"ffmpeg 오류: {result.stderr.strip()[-2000:]}")
+            return result
+
+        command = [self._binary, '-hide_banner', '-y', '-nostats', '-progress', 'pipe:1', *args]
+        # stderr는 파이프가 차서 멈추지 않도록 파일로 받음
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8', errors='replace') as stderr:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, text=True)
+            for line in process.stdout:
+                key, _, value = line.strip().partition('=')
+                if key == 'out_time_us' and value.isdigit():
+                    progress(min(1.0, int(value) / 1_000_000 / duration))
+            returncode = process.wait()
+            stderr.seek(0)
+            error_output = stderr.read()
+        if returncode != 0:
+            raise Exception(f"ffmpeg 오류: {error_output.strip()[-2000:]}")
+        return subprocess.CompletedProcess(command, returncode, '', error_output)
+
+    def probe(self, path: str) -> Dict:
+        """
+        미디어 파일 정보 확인
+
+        Returns:
+            Dict: duration(초), audio_codec, video_codec (없으면 None)
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"파일이 존재하지 않습니다: {path}")
+        if self._probe_binary:
+            return self._probe_with_ffprobe(path)
+        return self._probe_with_ffmpeg(path)
+
+    def _probe_with_ffprobe(self, path: str) -> Dict:
+        """ffprobe JSON 출력으로 정보 확인"""
+        result = subprocess.run(
+            [self._probe_binary, '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', path],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise Exception(f"ffprobe 오류: {result.stderr.strip()}")
+        data = json.loads(result.stdout or '{}')
+        info = {'duration': float(data.get('format', {}).get('duration') or 0.0), 'audio_codec': None, 'video_codec': None}
+        for stream in data.get('streams', []):
+            key = f"{stream.get('codec_type')}_codec"
+            if key in info and info[key] is None:
+                info[key] = stream.get('codec_name')
+        return info
+
+    def _probe_with_ffmpeg(self, path: str) -> Dict:
+        """ffprobe가 없으면 `ffmpeg -i` 출력에서 정보 확인"""
+        result = subprocess.run([self._binary, '-hide_banner', '-i', path], capture_output=True, text=True)
+        output = result.stderr
+        info = {'duration': 0.0, 'audio_codec': None, 'video_codec': None}
+        match = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', output)
+        if match:
+            hours, minutes, seconds = match.groups()
+            info['duration'] = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        for kind in ('audio', 'video'):
+            match = re.search(rf'Stream #\S+.*?: {kind.capitalize()}: (\w+)', output)
+            if match:
+                info[f'{kind}_codec'] = match.group(1)
+        return info
+
+    def has_filter(self, name: str) -> bool:
+        """ffmpeg 빌드에 필터가 있는지 확인 (예: libass를 쓰는 'ass')"""
+        if self._filters is None:
+            result = subprocess.run([self._binary, '-hide_banner', '-filters'], capture_output=True, text=True)
+            self._filters = set(re.findall(r'^\s*\S+\s+(\w+)\s', result.stdout, re.MULTILINE))
+        return name in self._filters
+
+    def vfr_args(self) -> List[str]:
+        """가변 프레임레이트 출력 인자 (ffmpeg 5.1부터 -fps_mode, 그 전에는 -vsync)"""
+        if self._supports_fps_mode is None:
+            result = subprocess.run([self._binary, '-hide_banner', '-h', 'long'], capture_output=True, text=True)
+            self._supports_fps_mode = '-fps_mode' in result.stdout
+        return ['-fps_mode', 'vfr'] if self._supports_fps_mode else ['-vsync', 'vfr']
+
+    def audio_codec_for(self, audio_path: str) -> str:
+        """MP4에 넣을 음성 코덱 (이미 AAC면 'copy', 아니면 'aac'로 한 번 인코딩)"""
+        return 'copy' if self.probe(audio_path)['audio_codec'] == 'aac' else 'aac'
+
+    @staticmethod
+    def audio_args(audio_codec: str) -> List[str]:
+        """음성 코덱 인자"""
+        args = ['-c:a', audio_codec]
+        if audio_codec == 'aac':
+            args += ['-b:a', '192k']
+        return args
+
+    def mux(self, video_path: str, audio_path: str, output_path: str, audio_codec: Optional[str] = None,
+            duration: Optional[float] = None, subtitle_path: Optional[str] = None,
+            subtitle_language: str = 'kor') -> str:
+        """
+        영상과 음성(과 자막 트랙)을 하나의 MP4로 합침 (영상은 다시 인코딩하지 않음)
+
+        Args:
+            video_path (str): 음성이 없는 영상 파일
+            audio_path (str): 음성 파일
+            output_path (str): 출력 MP4 경로
+            audio_codec (Optional[str]): 음성 코덱. None이면 이미 AAC일 때 스트림 복사,
+                아니면 AAC로 한 번만 인코딩
+            duration (Optional[float]): 출력 길이(초). None이면 짧은 쪽에 맞춤
+                (가변 프레임레이트 영상은 마지막 프레임 이후가 잘려 있으므로 음성 길이를 넘겨야 음성이 잘리지 않음)
+            subtitle_path (Optional[str]): 자막 파일(SRT 등). 있으면 플레이어에서 켜고 끌 수 있는 mov_text 트랙으로 넣음
+            subtitle_language (str): 자막 트랙 언어 (ISO 639-2)
+
+        Returns:
+            str: 출력 경로
+        """
+        if audio_codec is None:
+            audio_codec = self.audio_codec_for(audio_path)
+
+        subtitle_args: List[str] = []
+        if subtitle_path:
+            subtitle_args = [
+                '-map', '2:s:0', '-c:s', 'mov_text',
+                '-metadata:s:s:0', f"language={subtitle_language}"
+            ]
+        args = [
+            '-i', video_path, '-i', audio_path,
+            *(['-i', subtitle_path] if subtitle_path else []),
+            '-map', '0:v:0', '-map', '1:a:0',
+            '-c:v', 'copy', *self.audio_args(audio_codec), *subtitle_args,
+            *(['-t', f"{duration:.3f}"] if duration else ['-shortest']),
+            '-movflags', '+faststart', output_path
+        ]
+
+        print(f"🎞️ 영상/음성 먹싱 중... (음성: {'스트림 복사' if audio_codec == 'copy' else audio_codec}"
+              f"{', 자막 트랙' if subtitle_path else ''})")
+        self.run(args)
+        return output_path
@@ -0,0 +1,192 @@
+import os
+import re
+import tempfile
+from typing import Callable, List, Optional, Tuple
+from PIL import Image
+from classes.ffmpeg import FFmpeg
+from classes.encode_profile import EncodeProfile
+
+class FFmpegRenderer:
+    # 이미지 형식별 ffmpeg 디코더 (임시 파일 확장자와 실제 형식이 달라도 올바르게 디코딩)
+    DECODERS = {'JPEG': 'mjpeg', 'PNG': 'png', 'BMP': 'bmp', 'WEBP': 'webp'}
+    # 움직이는 배경으로 쓰는 영상 클립 확장자 (Giphy MP4 렌디션 등)
+    VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov')
+
+    def __init__(self, temp_dir: str, width: int = 1920, height: int = 1080, fps: int = 30,
+                 background_color: str = "#000000", ffmpeg: Optional[FFmpeg] = None,
+                 profile: Optional[EncodeProfile] = None, threads: int = 0):
+        """
+        정지 이미지 + 자막 영상을 ffmpeg 한 번의 실행으로 렌더링하는 클래스
+
+        moviepy처럼 프레임마다 파이썬에서 합성하지 않고 타임라인을 필터 그래프로 바꿔서
+        ffmpeg이 직접 처리한다.
+        - 이미지마다 화면을 채우도록 한 번만 확대 후 가운데를 자르고 그 프레임을 반복 (loop)
+        - 영상 클립(MP4 등)은 움직이는 배경으로 반복 재생하면서 표시 시간만큼 자름
+        - 이미지들을 순서대로 이어 붙임 (concat)
+        - 자막은 ASS 파일을 libass로 입힘 (ass 필터)
+        - 음성이 있으면 같은 실행에서 먹싱 (AAC면 스트림 복사)
+        - 가변 프레임레이트 프로필이면 자막이 바뀌지 않는 동안의 같은 프레임은 인코딩하지 않음
+
+        Args:
+            temp_dir (str): 변환한 이미지를 저장할 디렉토리 (작업의 작업 공간)
+            width (int): 영상 너비
+            height (int): 영상 높이
+            fps (int): 초당 프레임 수
+            background_color (str): 이미지가 없을 때의 배경색
+            ffmpeg (Optional[FFmpeg]): 사용할 ffmpeg 실행기
+            profile (Optional[EncodeProfile]): 인코딩 프로필. None이면 설정값
+            threads (int): 필터/인코더 스레드 수. 0이면 ffmpeg이 정함 (구간 병렬 렌더링에서 코어를 나눠 씀)
+        """
+        if not temp_dir or not os.path.isdir(temp_dir):
+            raise FileNotFoundError(f"임시 디렉토리가 존재하지 않습니다: {temp_dir}")
+        self._width = width
+        self._height = height
+        self._fps = fps
+        self._background_color = background_color
+        self._ffmpeg = ffmpeg or FFmpeg()
+        self._profile = profile or EncodeProfile()
+        self._threads = threads
+        self._temp_dir = temp_dir
+        self._temp_files: List[str] = []
+
+    def available(self) -> bool:
+        """ffmpeg에 자막 렌더링(libass) 필터가 있는지 확인"""
+        try:
+            return self._ffmpeg.has_filter('ass') and self._ffmpeg.has_filter('concat')
+        except OSError:
+            return False
+
+    @staticmethod
+    def _escape_filter_path(path: str) -> str:
+        """필터 그래프에 넣을 경로 이스케이프 (옵션 값, 필터 그래프 두 단계)"""
+        escaped = re.sub(r"([\\':])", r"\\\1", path.replace('\\', '/'))
+        return re.sub(r"([\\'\[\],;])", r"\\\1", escaped)
+
+    @classmethod
+    def is_video(cls, path: str) -> bool:
+        """움직이는 배경(영상 클립)인지 확인"""
+        return os.path.splitext(path)[1].lower() in cls.VIDEO_EXTENSIONS
+
+    def _image_input(self, image_path: str) -> Tuple[str, str]:
+        """
+        이미지 입력 (경로, 디코더)
+
+        ffmpeg이 바로 디코딩하기 어려운 형식(GIF 등)은 첫 프레임을 PNG로 저장해서 사용한다.
+        """
+        with Image.open(image_path) as img:
+            decoder = self.DECODERS.get(img.format or '')
+            if decoder:
+                return image_path, decoder
+            fd, converted_path = tempfile.mkstemp(suffix='.png', dir=self._temp_dir)
+            os.close(fd)
+            img.convert('RGB').save(converted_path)
+        self._temp_files.append(converted_path)
+        return converted_path, 'png'
+
+    def build_command(self, slides: List[Tuple[str, float]], duration: float, output_path: str,
+                      subtitle_path: Optional[str] = None, audio_path: Optional[str] = None,
+                      audio_codec: str = 'copy') -> List[str]:
+        """
+        렌더링 명령 인자 생성
+
+        Args:
+            slides (List[Tuple[str, float]]): (이미지/영상 경로, 표시 시간(초)) 목록. 비어 있으면 배경색
+            duration (float): 전체 길이(초)
+            output_path (str): 출력 MP4 경로
+            subtitle_path (Optional[str]): ASS 자막 파일
+            audio_path (Optional[str]): 함께 먹싱할 음성 파일
+            audio_codec (str): 음성 코덱 ('copy' 또는 'aac')
+
+        Returns:
+            List[str]: ffmpeg 인자 (실행 파일 제외)
+        """
+        size = f"{self._width}:{self._height}"
+        args: List[str] = []
+        filters: List[str] = []
+
+        if slides:
+            elapsed = 0.0
+            frame_start = 0
+            for index, (image_path, slide_duration) in enumerate(slides):
+                # 누적 시간으로 프레임 수를 정해서 반올림 오차가 쌓이지 않게 함
+                elapsed += slide_duration
+                frame_end = max(frame_start + 1, int(round(elapsed * self._fps)))
+                frames = frame_end - frame_start
+                frame_start = frame_end
+
+                cover = f"scale={size}:force_original_aspect_ratio=increase:flags=lanczos,crop={size},setsar=1"
+                if self.is_video(image_path):
+                    # 영상 클립은 끝나면 처음부터 다시 재생하고 표시 시간만큼만 사용
+                    args += ['-stream_loop', '-1', '-i', image_path]
+                    filters.append(
+                        f"[{index}:v]{cover},fps={self._fps},format=yuv420p,"
+                        f"trim=end_frame={frames},settb=1/{self._fps},setpts=N[s{index}]"
+                    )
+                    continue
+
+                input_path, decoder = self._image_input(image_path)
+                args += ['-c:v', decoder, '-i', input_path]
+                # 비율을 유지하면서 화면을 채우도록 확대하고 가운데를 자름 (moviepy 백엔드와 같은 배치)
+                # 확대/변환은 한 번만 하고 그 프레임을 반복 (loop)
+                filters.append(
+                    f"[{index}:v]{cover},format=yuv420p,"
+                    f"loop=loop={frames - 1}:size=1:start=0,settb=1/{self._fps},setpts=N[s{index}]"
+                )
+            inputs = ''.join(f"[s{index}]" for index in range(len(slides)))
+            filters.append(f"{inputs}concat=n={len(slides)}:v=1:a=0[base]")
+        else:
+            args += ['-f', 'lavfi', '-i',
+                     f"color=c={self._background_color}:s={self._width}x{self._height}:r={self._fps}:d={duration:.3f}"]
+            filters.append("[0:v]format=yuv420p[base]")
+
+        video_filters: List[str] = []
+        if subtitle_path:
+            video_filters.append(f"ass={self._escape_filter_path(subtitle_path)}")
+        # 움직이는 배경은 프레임이 계속 바뀌므로 같은 프레임 제거를 하지 않음
+        decimate = self._profile.decimate_filter(self._fps)
+        if decimate and not any(self.is_video(path) for path, _ in slides):
+            video_filters.append(decimate)
+        filters.append(f"[base]{','.join(video_filters) or 'null'}[video]")
+
+        # 음성 입력은 이미지 입력들 뒤에 둠
+        audio_index = len(slides) or 1
+        if audio_path:
+            args += ['-i', audio_path]
+
+        if self._threads:
+            args += ['-filter_complex_threads', str(self._threads), '-threads', str(self._threads)]
+        args += ['-filter_complex', ';'.join(filters), '-map', '[video]']
+        if audio_path:
+            args += ['-map', f"{audio_index}:a:0", *self._ffmpeg.audio_args(audio_codec)]
+        else:
+            args += ['-an']
+
+        args += ['-c:v', 'libx264', *self._profile.codec_args(self._fps), '-pix_fmt', 'yuv420p']
+        args += self._ffmpeg.vfr_args() if self._profile.vfr else ['-r', str(self._fps)]
+        args += ['-t', f"{duration:.3f}", '-movflags', '+faststart', output_path]
+        return args
+
+    def render(self, slides: List[Tuple[str, float]], duration: float, output_path: str,
+               subtitle_path: Optional[str] = None, audio_path: Optional[str] = None,
+               progress: Optional[Callable[[float], None]] = None) -> str:
+        """
+        영상 렌더링 (음성이 있으면 먹싱까지)
+
+        progress가 있으면 렌더링한 비율(0~1)을 진행될 때마다 전달한다.
+
+        Returns:
+            str: 출력 경로
+        """
+        audio_codec = self._ffmpeg.audio_codec_for(audio_path) if audio_path else 'copy'
+        try:
+            args = self.build_command(slides, duration, output_path, subtitle_path, audio_path, audio_codec)
+            print(f"🎞️ ffmpeg 렌더링 중... (이미지 {len(slides)}개, {duration:.1f}초, 프로필 {self._profile.name})")
+            self._ffmpeg.run(args, progress=progress, duration=duration)
+        finally:
+            for path in self._temp_files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._temp_files = []
+        return output_path
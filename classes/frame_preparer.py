@@ -0,0 +1,115 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+import numpy as np
+from PIL import Image, ImageColor
+
+class FramePreparer:
+    # 프로세스 전체에서 공유하는 프레임 LRU 캐시 ((원본 해시, 해상도, 배경색) → RGB 배열)
+    _frames: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+    _frames_bytes: List[int] = [0]
+    _lock = threading.Lock()
+    CACHE_MAX_BYTES = 192 * 1024 * 1024
+
+    def __init__(self, width: int = 1920, height: int = 1080, background_color: str = "#000000"):
+        """
+        이미지를 영상 프레임(화면을 채우도록 확대 후 가운데 자름)으로 바꾸는 클래스
+
+        - JPEG는 필요한 크기까지만 축소 디코딩 (draft)
+        - 화면에 보이는 영역만 잘라서 한 번에 리사이즈 (LANCZOS)
+        - 투명한 이미지는 배경색 위에 합성
+        - 결과는 파일로 저장하지 않고 RGB 배열로 반환
+        - (원본 내용 해시, 해상도, 배경색)별로 캐시해서 같은 이미지는 한 번만 준비
+
+        Args:
+            width (int): 프레임 너비
+            height (int): 프레임 높이
+            background_color (str): 배경색
+        """
+        self._width = width
+        self._height = height
+        self._background_color = background_color
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def stats(self) -> Dict:
+        """이 준비기의 캐시 적중/미스 횟수와 공유 캐시 크기를 반환"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'entries': len(self._frames),
+            'bytes': self._frames_bytes[0]
+        }
+
+    @staticmethod
+    def _file_hash(image_path: str) -> str:
+        """원본 파일 내용의 해시 (경로가 달라도 같은 이미지면 같은 값)"""
+        digest = hashlib.sha1()
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _cached(self, key: Tuple, build) -> np.ndarray:
+        """캐시에서 프레임을 찾고 없으면 만들어서 보관"""
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self._hits += 1
+                return frame
+
+        self._misses += 1
+        frame = build()
+        frame.flags.writeable = False
+        with self._lock:
+            if key not in self._frames:
+                self._frames[key] = frame
+                self._frames_bytes[0] += frame.nbytes
+            # 캐시가 최대 크기를 넘으면 오래 쓰지 않은 프레임부터 삭제
+            while self._frames_bytes[0] > self.CACHE_MAX_BYTES and len(self._frames) > 1:
+                _, evicted = self._frames.popitem(last=False)
+                self._frames_bytes[0] -= evicted.nbytes
+        return frame
+
+    def _build(self, image_path: str) -> np.ndarray:
+        """이미지를 디코딩해서 프레임 배열 생성"""
+        with Image.open(image_path) as img:
+            # 화면을 채우는 배율과 원본에서 보이는 영역 (가운데)
+            scale = max(self._width / img.width, self._height / img.height)
+            if img.format == 'JPEG':
+                # 필요한 크기 이상을 유지하는 가장 작은 배율(1/2, 1/4, 1/8)로 디코딩
+                img.draft('RGB', (int(img.width * scale) + 1, int(img.height * scale) + 1))
+                scale = max(self._width / img.width, self._height / img.height)
+
+            if img.mode in ('RGBA', 'LA', 'P'):
+                img = img.convert('RGBA')
+                background = Image.new('RGBA', img.size, ImageColor.getrgb(self._background_color))
+                img = Image.alpha_composite(background, img)
+            img = img.convert('RGB')
+
+            box_width = self._width / scale
+            box_height = self._height / scale
+            left = (img.width - box_width) / 2
+            top = (img.height - box_height) / 2
+            frame = img.resize((self._width, self._height), Image.Resampling.LANCZOS,
+                               box=(left, top, left + box_width, top + box_height))
+            return np.asarray(frame)
+
+    def prepare(self, image_path: str) -> np.ndarray:
+        """
+        이미지 파일로 프레임 준비
+
+        Returns:
+            np.ndarray: (높이, 너비, 3) RGB 배열 (읽기 전용, 여러 클립이 공유)
+        """
+        key = (self._file_hash(image_path), (self._width, self._height), self._background_color)
+        return self._cached(key, lambda: self._build(image_path))
+
+    def background(self) -> np.ndarray:
+        """배경색만 있는 프레임"""
+        key = ('background', (self._width, self._height), self._background_color)
+        color = ImageColor.getrgb(self._background_color)[:3]
+        return self._cached(key, lambda: np.full((self._height, self._width, 3), color, dtype=np.uint8))
@@ -1,14 +1,37 @@
 import httpx
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from classes.settings import Settings
+from classes.metrics import metrics
 
 class GiphySearch:
+    # 렌디션 종류별 후보 (images의 키, 해당 형식의 URL/크기 필드)
+    # still: 한 장만 쓰는 배경 (정지 이미지, WebP, GIF), video: 움직이는 배경 (MP4)
+    RENDITIONS: Dict[str, List[Tuple[str, str, str]]] = {
+        'still': [
+            ('480w_still', 'url', 'size'),
+            ('original_still', 'url', 'size'),
+            ('downsized_still', 'url', 'size'),
+            ('fixed_height_still', 'url', 'size'),
+            ('fixed_height', 'webp', 'webp_size'),
+            ('downsized', 'url', 'size'),
+            ('original', 'webp', 'webp_size'),
+            ('original', 'url', 'size'),
+        ],
+        'video': [
+            ('fixed_height', 'mp4', 'mp4_size'),
+            ('downsized_small', 'mp4', 'mp4_size'),
+            ('original_mp4', 'mp4', 'mp4_size'),
+            ('original', 'mp4', 'mp4_size'),
+        ],
+    }
+
     def __init__(self):
         """Giphy API를 사용하여 이미지를 검색하는 클래스"""
         self._settings = Settings()
         self._search_query: str = ""
         self._limit: int = 10
         self._api_key: str = self._settings.giphy_api_key
+        self._target_size: Tuple[int, int] = (1920, 1080)  # 렌디션 선택 기준 해상도
     
     @property
     def search_query(self) -> str:
@@ -44,12 +67,80 @@ class GiphySearch:
         # Settings에도 저장
         self._settings.giphy_api_key = value
     
+    @property
+    def target_size(self) -> Tuple[int, int]:
+        """렌디션 선택 기준 해상도(너비, 높이)를 반환"""
+        return self._target_size
+    
+    @target_size.setter
+    def target_size(self, value: Tuple[int, int]) -> None:
+        """렌디션 선택 기준 해상도(너비, 높이)를 설정"""
+        if value[0] < 1 or value[1] < 1:
+            raise ValueError("Target size must be greater than 0")
+        self._target_size = (int(value[0]), int(value[1]))
+    
+    @staticmethod
+    def _to_int(value: Any) -> int:
+        """API의 문자열 숫자를 정수로 변환 (없으면 0)"""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+    
+    def select_rendition(self, images: Dict[str, Dict], kind: str = 'still') -> Optional[Dict[str, Any]]:
+        """
+        기준 해상도를 덮는(화면을 채우는) 렌디션 중 가장 작은 파일을 선택
+        
+        덮는 렌디션이 없으면 해상도가 가장 큰 렌디션 중 가장 작은 파일을 선택한다.
+        (크기 정보가 없는 렌디션은 같은 조건에서 뒤로 밀림)
+        
+        Args:
+            images (Dict[str, Dict]): Giphy 결과의 images
+            kind (str): 'still'(정지 배경) 또는 'video'(움직이는 배경, MP4)
+            
+        Returns:
+            Optional[Dict[str, Any]]: url, width, height, size, rendition, format (후보가 없으면 None)
+        """
+        if kind not in self.RENDITIONS:
+            raise ValueError(f"kind must be one of {tuple(self.RENDITIONS)}")
+        
+        target_width, target_height = self._target_size
+        candidates = []
+        for name, url_field, size_field in self.RENDITIONS[kind]:
+            rendition = images.get(name) or {}
+            url = rendition.get(url_field)
+            width = self._to_int(rendition.get('width'))
+            height = self._to_int(rendition.get('height'))
+            if not url or not width or not height:
+                continue
+            size = self._to_int(rendition.get(size_field)) or float('inf')
+            candidates.append({
+                'url': url,
+                'width': width,
+                'height': height,
+                'size': size,
+                'rendition': name,
+                'format': url_field if url_field != 'url' else 'gif' if url.split('?')[0].endswith('.gif') else 'image'
+            })
+        if not candidates:
+            return None
+        
+        covering = [c for c in candidates if c['width'] >= target_width and c['height'] >= target_height]
+        if covering:
+            best = min(covering, key=lambda c: c['size'])
+        else:
+            best = min(candidates, key=lambda c: (-c['width'] * c['height'], c['size']))
+        if best['size'] == float('inf'):
+            best['size'] = None
+        return best
+    
     def search(self) -> List[Dict[str, Any]]:
         """
         Giphy API를 사용하여 이미지를 검색
         
         Returns:
             List[Dict[str, Any]]: 검색된 이미지 정보 리스트
+                (url은 원본 GIF, still/video는 target_size에 맞춰 고른 렌디션)
             
         Raises:
             ValueError: 필수 설정이 누락된 경우
@@ -72,7 +163,8 @@ class GiphySearch:
                 "lang": "ko"
             }
             
-            with httpx.Client() as client:
+            with httpx.Client() as client, metrics.span('giphy_search'):
+                metrics.inc('giphy_requests_total')
                 response = client.get(url, params=params)
                 response.raise_for_status()
                 data = response.json()
@@ -86,7 +178,10 @@ class GiphySearch:
                         "url": gif["images"]["original"]["url"],
                         "width": gif["images"]["original"]["width"],
                         "height": gif["images"]["original"]["height"],
-                        "size": gif["images"]["original"]["size"]
+                        "size": gif["images"]["original"]["size"],
+                        # 실제로 내려받을 렌디션 (target_size 기준)
+                        "still": self.select_rendition(gif["images"], 'still'),
+                        "video": self.select_rendition(gif["images"], 'video')
                     })
                 
                 return results
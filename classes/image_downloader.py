@@ -0,0 +1,107 @@
+import os
+import asyncio
+from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple
+import httpx
+from classes.settings import Settings
+from classes.metrics import metrics
+
+class ImageDownloader:
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, max_connections: Optional[int] = None, per_host_connections: Optional[int] = None,
+                 max_size_mb: Optional[float] = None, timeout: Optional[float] = None):
+        """
+        여러 이미지를 연결 풀 하나로 동시에 다운로드하는 클래스
+
+        - 전체 동시 연결 수와 호스트별 동시 요청 수를 제한
+        - 이미지 하나의 최대 크기를 넘으면 받다가 중단
+        - 연결/읽기 시간 제한
+        - 같은 URL은 한 번만 받음
+
+        Args:
+            max_connections (Optional[int]): 전체 최대 동시 연결 수
+            per_host_connections (Optional[int]): 호스트별 최대 동시 요청 수
+            max_size_mb (Optional[float]): 이미지 하나의 최대 크기(MB)
+            timeout (Optional[float]): 연결/읽기 제한 시간(초)
+            (None인 값은 설정값 사용)
+        """
+        self._settings = Settings()
+        self._max_connections = max_connections or self._settings.download_max_connections
+        self._per_host_connections = per_host_connections or self._settings.download_per_host_connections
+        self._max_bytes = int((max_size_mb or self._settings.download_max_size_mb) * 1024 * 1024)
+        self._timeout = timeout or self._settings.download_timeout
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def max_bytes(self) -> int:
+        """이미지 하나의 최대 크기(바이트)를 반환"""
+        return self._max_bytes
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 요청 제한"""
+        host = urlparse(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self._per_host_connections)
+        return self._host_limits[host]
+
+    async def _download(self, client: httpx.AsyncClient, url: str, output_path: str) -> str:
+        """이미지 하나를 파일로 저장 (최대 크기를 넘으면 중단)"""
+        async with self._host_limit(url):
+            with metrics.span('image_download'):
+                async with client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    content_length = int(response.headers.get('content-length') or 0)
+                    if content_length > self._max_bytes:
+                        raise ValueError(f"이미지가 너무 큽니다 ({content_length} bytes): {url}")
+
+                    received = 0
+                    with open(output_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                            received += len(chunk)
+                            if received > self._max_bytes:
+                                raise ValueError(f"이미지가 너무 큽니다 ({self._max_bytes} bytes 초과): {url}")
+                            f.write(chunk)
+                    metrics.inc('image_download_bytes_total', received)
+        return output_path
+
+    async def download_all(self, targets: List[Tuple[str, str]]) -> List[str]:
+        """
+        이미지들을 동시에 다운로드
+
+        하나라도 실패하면 나머지를 취소하고 받다 만 파일을 지운 뒤 원래 예외를 그대로 다시 발생시킨다.
+        (HTTP 오류는 httpx.HTTPStatusError, 크기 초과는 ValueError)
+
+        Args:
+            targets (List[Tuple[str, str]]): (URL, 저장 경로) 목록
+
+        Returns:
+            List[str]: 입력 순서대로의 파일 경로 (같은 URL은 처음 경로를 공유)
+        """
+        if not targets:
+            return []
+
+        # 같은 URL은 한 번만 받음
+        first_paths: Dict[str, str] = {}
+        for url, output_path in targets:
+            first_paths.setdefault(url, output_path)
+
+        limits = httpx.Limits(max_connections=self._max_connections,
+                              max_keepalive_connections=self._max_connections)
+        timeout = httpx.Timeout(self._timeout)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as client:
+            tasks = [asyncio.create_task(self._download(client, url, output_path))
+                     for url, output_path in first_paths.items()]
+            try:
+                await asyncio.gather(*tasks)
+            except Exception as e:
+                print(f"⚠️ 이미지 다운로드 실패: {e}")
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for output_path in first_paths.values():
+                    if os.path.exists(output_path):
+                        os.remove(output_path)
+                raise
+
+        return [first_paths[url] for url, _ in targets]
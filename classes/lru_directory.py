@@ -0,0 +1,157 @@
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class LRUDirectory:
+    # 프로세스 전체에서 공유하는 디렉토리별 용량/항목 수 (캐시 객체를 작업마다 만들어도 한 번만 훑음)
+    _states: Dict[str, Dict[str, int]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, directory: str, extension: str, companions: Iterable[str] = ()):
+        """
+        파일 하나가 항목 하나인 디렉토리를 파일 수정 시각 기준 LRU로 관리하는 클래스
+
+        - 최근 사용 시각은 파일 수정 시각 (읽을 때 touch()로 갱신)
+        - 현재 용량과 항목 수는 처음 한 번만 디렉토리를 훑고 이후에는 저장/삭제할 때 갱신
+        - 정리(evict)할 때만 다시 훑어서 다른 프로세스가 쓴 항목까지 반영
+
+        Args:
+            directory (str): 항목을 저장하는 디렉토리
+            extension (str): 항목 파일 확장자 (예: '.wav'). 다른 파일(쓰는 중인 .tmp 등)은 무시
+            companions (Iterable[str]): 항목과 함께 지울 파일 확장자 (예: 메타데이터 '.json')
+        """
+        self._directory = directory
+        self._extension = extension
+        self._companions = tuple(companions)
+        os.makedirs(directory, exist_ok=True)
+
+        key = os.path.abspath(directory)
+        with self._lock:
+            if key not in self._states:
+                entries = self.scan()
+                self._states[key] = {'size': sum(size for _, size, _ in entries), 'entries': len(entries)}
+            self._state = self._states[key]
+
+    @property
+    def directory(self) -> str:
+        """디렉토리를 반환"""
+        return self._directory
+
+    @property
+    def size_bytes(self) -> int:
+        """추적 중인 전체 용량(바이트)을 반환"""
+        return self._state['size']
+
+    @property
+    def entries(self) -> int:
+        """추적 중인 항목 수를 반환"""
+        return self._state['entries']
+
+    def path(self, name: str) -> str:
+        """항목 이름에 해당하는 파일 경로"""
+        return os.path.join(self._directory, f"{name}{self._extension}")
+
+    def scan(self) -> List[Tuple[str, int, float]]:
+        """항목 목록 (경로, 크기, 최근 사용 시각)"""
+        entries = []
+        try:
+            with os.scandir(self._directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(self._extension):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    @staticmethod
+    def touch(path: str) -> bool:
+        """최근 사용 시각 갱신 (항목이 없으면 False)"""
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def commit(self, temp_path: str, path: str) -> None:
+        """
+        다 쓴 임시 파일을 항목 경로로 교체하고 용량 갱신
+
+        같은 항목을 덮어쓰면 이전 파일 크기를 빼서 용량이 두 번 더해지지 않게 한다.
+        다른 작업이 같은 항목을 읽는 중이어도 깨진 파일이 보이지 않도록 os.replace로 교체한다.
+        """
+        new_size = os.path.getsize(temp_path)
+        try:
+            old_size: Optional[int] = os.path.getsize(path)
+        except FileNotFoundError:
+            old_size = None
+        os.replace(temp_path, path)
+        with self._lock:
+            self._state['size'] += new_size - (old_size or 0)
+            if old_size is None:
+                self._state['entries'] += 1
+
+    def remove(self, path: str) -> int:
+        """
+        항목과 함께 저장된 파일 삭제
+
+        Returns:
+            int: 삭제한 항목 파일 크기 (이미 없으면 0)
+        """
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            size = 0
+        base_path = path[:-len(self._extension)] if path.endswith(self._extension) else path
+        for extension in self._companions:
+            try:
+                os.remove(f"{base_path}{extension}")
+            except FileNotFoundError:
+                pass
+        return size
+
+    def evict(self, max_size_bytes: int, keep: Iterable[str] = ()) -> int:
+        """
+        최대 용량을 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+
+        Args:
+            max_size_bytes (int): 최대 용량(바이트)
+            keep (Iterable[str]): 지우면 안 되는 항목 경로 (지금 작업에서 쓰는 항목)
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        if self._state['size'] <= max_size_bytes:
+            return 0
+
+        entries = self.scan()
+        total_size = sum(size for _, size, _ in entries)
+        evicted = 0
+        keep = {os.path.abspath(path) for path in keep}
+        if total_size > max_size_bytes:
+            for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                if os.path.abspath(path) in keep:
+                    continue
+                self.remove(path)
+                total_size -= size
+                evicted += 1
+                if total_size <= max_size_bytes:
+                    break
+
+        with self._lock:
+            self._state['size'] = total_size
+            self._state['entries'] = len(entries) - evicted
+        return evicted
+
+    def clear(self) -> None:
+        """항목을 모두 삭제"""
+        for path, _, _ in self.scan():
+            self.remove(path)
+        with self._lock:
+            self._state['size'] = 0
+            self._state['entries'] = 0
@@ -0,0 +1,180 @@
+import time
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# 단계별 소요 시간 히스토그램 구간 (초)
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+class Metrics:
+    PREFIX = 'mp4creator_'
+
+    def __init__(self):
+        """
+        단계별 소요 시간(span)과 카운터를 모아 Prometheus 텍스트로 내보내는 클래스
+
+        기록은 dict 갱신과 잠금 한 번뿐이라 운영 중에 켜 두어도 부담이 없다.
+        스레드(moviepy, 구글 API 클라이언트 등)와 asyncio 코드 모두에서 사용할 수 있다.
+        """
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        # (구간별 개수, 합계, 개수)
+        self._histograms: Dict[str, Dict[LabelKey, Tuple[List[int], float, int]]] = {}
+        self._help: Dict[str, str] = {
+            'stage_seconds': '단계별 소요 시간(초)',
+            'stage_errors_total': '예외로 끝난 단계 수',
+            'tts_jobs_total': 'TTS 변환 작업 수 (result: success/error)',
+            'tts_network_requests_total': 'Edge-TTS 요청 수 (재시도/헤징 포함)',
+            'tts_network_bytes_total': 'Edge-TTS에서 받은 MP3 바이트',
+            'tts_cache_requests_total': 'TTS 세그먼트 캐시 조회 수 (result: hit/miss)',
+            'build_cache_requests_total': '영상 구간 빌드 캐시 조회 수 (result: hit/miss)',
+            'giphy_requests_total': 'Giphy 검색 요청 수',
+            'image_download_bytes_total': '다운로드한 이미지 바이트',
+            'drive_upload_bytes_total': '구글 드라이브에 업로드한 바이트',
+            'workspace_peak_bytes_total': '작업 공간 최대 사용량 합계 (작업이 끝날 때마다 더함)',
+            'tts_batch_jobs': '일괄 음성 생성 작업 수 (status: queued/running)',
+            'tts_batch_jobs_total': '제출된 일괄 음성 생성 작업 수',
+            'tts_batch_finished_total': '끝난 일괄 음성 생성 작업 수 (status: done/error)',
+            'render_jobs': '영상 생성 작업 수 (status: queued/running)',
+            'render_jobs_total': '제출된 영상 생성 작업 수',
+            'render_jobs_finished_total': '끝난 영상 생성 작업 수 (status: done/error/cancelled)',
+        }
+
+    @staticmethod
+    def _labels(labels: Dict[str, object]) -> LabelKey:
+        """라벨 dict를 정렬된 키로 변환"""
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def describe(self, name: str, help_text: str) -> None:
+        """지표 설명 등록 (Prometheus HELP 줄)"""
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        """카운터 증가 (이름은 보통 _total로 끝남)"""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels) -> None:
+        """게이지 값 설정"""
+        key = self._labels(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """히스토그램에 값 기록"""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            buckets, total, count = series.get(key) or ([0] * len(_BUCKETS), 0.0, 0)
+            for index, bound in enumerate(_BUCKETS):
+                if seconds <= bound:
+                    buckets[index] += 1
+                    break
+            series[key] = (buckets, total + seconds, count + 1)
+
+    @contextmanager
+    def span(self, stage: str, **labels) -> Iterator[None]:
+        """
+        블록의 소요 시간을 stage_seconds{stage=...}에 기록
+
+        예외로 끝나면 stage_errors_total도 함께 증가한다.
+        (취소(CancelledError)나 제너레이터 종료(GeneratorExit)는 오류로 세지 않음)
+
+        Example:
+            with metrics.span('tts_decode'):
+                ...
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc('stage_errors_total', stage=stage, **labels)
+            raise
+        finally:
+            self.observe('stage_seconds', time.perf_counter() - started, stage=stage, **labels)
+
+    def timed(self, stage: str, **labels) -> Callable:
+        """함수 전체를 span으로 감싸는 데코레이터 (async 함수 지원)"""
+        def decorator(function: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(stage, **labels):
+                        return await function(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(stage, **labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        """Prometheus 라벨 문자열 생성"""
+        pairs = key + extra
+        if not pairs:
+            return ''
+        escaped = []
+        for name, value in pairs:
+            value = value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+            escaped.append(f'{name}="{value}"')
+        return '{' + ','.join(escaped) + '}'
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        """값을 정밀도 손실 없이 문자열로 변환 (정수면 소수점 없이)"""
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+    def _header(self, lines: List[str], name: str, metric_type: str) -> str:
+        """HELP/TYPE 줄을 추가하고 접두사가 붙은 이름을 반환"""
+        full_name = self.PREFIX + name
+        if name in self._help:
+            lines.append(f"# HELP {full_name} {self._help[name]}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+        return full_name
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 모든 지표를 반환"""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full_name = self._header(lines, name, 'counter')
+                for key, value in series.items():
+                    lines.append(f"{full_name}{self._format_labels(key)} {self._format_value(value)}")
+
+            for name, series in sorted(self._gauges.items()):
+                full_name = self._header(lines, name, 'gauge')
+                for key, value in series.items():
+                    lines.append(f"{full_name}{self._format_labels(key)} {self._format_value(value)}")
+
+            for name, series in sorted(self._histograms.items()):
+                full_name = self._header(lines, name, 'histogram')
+                for key, (buckets, total, count) in series.items():
+                    cumulative = 0
+                    for bound, bucket_count in zip(_BUCKETS, buckets):
+                        cumulative += bucket_count
+                        lines.append(f"{full_name}_bucket{self._format_labels(key, (('le', f'{bound:g}'),))} {cumulative}")
+                    lines.append(f"{full_name}_bucket{self._format_labels(key, (('le', '+Inf'),))} {count}")
+                    lines.append(f"{full_name}_sum{self._format_labels(key)} {self._format_value(total)}")
+                    lines.append(f"{full_name}_count{self._format_labels(key)} {count}")
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """모든 지표 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+# 프로세스 전체에서 공유하는 지표 저장소
+metrics = Metrics()
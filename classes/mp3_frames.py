@@ -0,0 +1,148 @@
+from typing import List, Optional, Tuple
+
+# MPEG 버전별 Layer III 비트레이트 표 (kbps)
+_BITRATES = {
+    'mpeg1': [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    'mpeg2': [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+# MPEG 버전별 샘플레이트 표 (Hz)
+_SAMPLE_RATES = {
+    'mpeg1': [44100, 48000, 32000],
+    'mpeg2': [22050, 24000, 16000],
+    'mpeg2.5': [11025, 12000, 8000],
+}
+
+class MP3Frames:
+    # Layer III 디코더 지연 (합성 필터뱅크, 샘플). 디코딩 결과는 이만큼 뒤로 밀려서 나옴
+    DECODER_DELAY = 529
+
+    def __init__(self, data: bytes):
+        """
+        MP3 바이트열의 프레임 헤더를 해석하는 클래스 (Layer III만 지원)
+
+        디코딩 없이 프레임 수로 샘플 수와 재생 시간을 계산한다.
+        ID3v2 태그와 Xing/Info 메타 프레임은 audio_data에서 제외된다.
+
+        Args:
+            data (bytes): MP3 바이트열
+        """
+        self._data = data
+        self._frames: List[Tuple[int, int]] = []  # (시작 위치, 길이)
+        self._sample_rate: Optional[int] = None
+        self._channels: Optional[int] = None
+        self._samples_per_frame: int = 0
+        self._valid: bool = False
+        self._parse()
+
+    @property
+    def valid(self) -> bool:
+        """프레임 해석 성공 여부를 반환"""
+        return self._valid
+
+    @property
+    def sample_rate(self) -> Optional[int]:
+        """샘플레이트를 반환"""
+        return self._sample_rate
+
+    @property
+    def channels(self) -> Optional[int]:
+        """채널 수를 반환"""
+        return self._channels
+
+    @property
+    def frame_count(self) -> int:
+        """오디오 프레임 수를 반환"""
+        return len(self._frames)
+
+    @property
+    def sample_count(self) -> int:
+        """채널당 샘플 수를 반환"""
+        return len(self._frames) * self._samples_per_frame
+
+    @property
+    def duration(self) -> float:
+        """재생 시간(초)을 반환"""
+        if not self._valid:
+            return 0.0
+        return self.sample_count / self._sample_rate
+
+    @property
+    def audio_data(self) -> bytes:
+        """태그와 메타 프레임을 제외한 오디오 프레임만 반환"""
+        if not self._valid:
+            return self._data
+        return b''.join(self._data[start:start + length] for start, length in self._frames)
+
+    def _skip_id3(self) -> int:
+        """ID3v2 태그가 있으면 그 다음 위치를 반환"""
+        data = self._data
+        if len(data) >= 10 and data[:3] == b'ID3':
+            size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+            return 10 + size
+        return 0
+
+    def _parse(self) -> None:
+        """프레임 헤더를 순서대로 읽어 프레임 목록 생성"""
+        data = self._data
+        pos = self._skip_id3()
+        end = len(data)
+
+        while pos + 4 <= end:
+            header = int.from_bytes(data[pos:pos + 4], 'big')
+            if (header >> 21) & 0x7FF != 0x7FF:
+                if data[pos:pos + 3] == b'TAG':
+                    break  # 파일 끝의 ID3v1 태그
+                # 동기 비트가 아니면 프레임이 깨진 것으로 보고 중단
+                return
+
+            version_bits = (header >> 19) & 0x3
+            layer_bits = (header >> 17) & 0x3
+            bitrate_index = (header >> 12) & 0xF
+            sample_rate_index = (header >> 10) & 0x3
+            padding = (header >> 9) & 0x1
+            channel_mode = (header >> 6) & 0x3
+
+            if version_bits == 0b01 or layer_bits != 0b01:
+                return  # 예약된 버전이거나 Layer III가 아님
+            if bitrate_index in (0, 15) or sample_rate_index == 3:
+                return
+
+            version = {0b11: 'mpeg1', 0b10: 'mpeg2', 0b00: 'mpeg2.5'}[version_bits]
+            table = 'mpeg1' if version == 'mpeg1' else 'mpeg2'
+            bitrate = _BITRATES[table][bitrate_index] * 1000
+            sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+
+            if version == 'mpeg1':
+                samples_per_frame = 1152
+                frame_length = 144 * bitrate // sample_rate + padding
+            else:
+                samples_per_frame = 576
+                frame_length = 72 * bitrate // sample_rate + padding
+
+            if pos + frame_length > end:
+                break  # 마지막 프레임이 잘린 경우
+
+            channels = 1 if channel_mode == 0b11 else 2
+            if self._sample_rate is None:
+                self._sample_rate = sample_rate
+                self._channels = channels
+                self._samples_per_frame = samples_per_frame
+            elif (sample_rate, channels) != (self._sample_rate, self._channels):
+                return  # 중간에 형식이 바뀌는 스트림은 지원하지 않음
+
+            if not self._frames:
+                # 첫 프레임의 Xing/Info 메타 프레임은 오디오가 아님 (side info 바로 뒤에 태그가 있음)
+                if version == 'mpeg1':
+                    side_info = 17 if channels == 1 else 32
+                else:
+                    side_info = 9 if channels == 1 else 17
+                tag = data[pos + 4 + side_info:pos + 8 + side_info]
+                if tag in (b'Xing', b'Info'):
+                    pos += frame_length
+                    continue
+
+            self._frames.append((pos, frame_length))
+            pos += frame_length
+
+        self._valid = self._sample_rate is not None and bool(self._frames)
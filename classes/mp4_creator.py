@@ -1,18 +1,37 @@
 import os
 import subprocess
-from typing import List, Dict, Tuple, Optional
-from moviepy.editor import VideoFileClip, AudioFileClip, TextClip, CompositeVideoClip, ImageClip
-from PIL import Image, ImageDraw, ImageFont
-import requests
-import tempfile
+from typing import Callable, List, Dict, Tuple, Optional
+from moviepy.editor import VideoFileClip, CompositeVideoClip, ImageClip
+from moviepy.config import get_setting
+from urllib.parse import urlparse
 from classes.settings import Settings
 from classes.tts import TextToSpeech
+from classes.script_parser import ScriptParser, Script
 from classes.giphy import GiphySearch
 from classes.spreadsheet_read import SpreadsheetRead
 from classes.drive import DriveUpload
+from classes.metrics import metrics
+from classes.ffmpeg import FFmpeg
+from classes.ffmpeg_renderer import FFmpegRenderer
+from classes.subtitle_writer import SubtitleWriter
+from classes.caption_renderer import CaptionRenderer
+from classes.encode_profile import EncodeProfile
+from classes.image_downloader import ImageDownloader
+from classes.frame_preparer import FramePreparer
+from classes.segment_planner import SegmentPlanner
+from classes.mp4_merger import MP4Merger
+from classes.build_cache import BuildCache
+from classes.workspace import Workspace
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import asyncio
+import time
 
 class MP4Creator:
+    RENDER_BACKENDS = ('ffmpeg', 'moviepy')
+    # 'burn': 자막을 화면에 입힘, 'soft': 켜고 끌 수 있는 자막 트랙만, 'both': 둘 다
+    SUBTITLE_DELIVERIES = ('burn', 'soft', 'both')
+    SUBTITLE_LANGUAGE = 'kor'
+
     def __init__(self):
         """MP4 동영상 생성 클래스"""
         self._settings = Settings()
@@ -24,9 +43,21 @@ class MP4Creator:
         self._background_color: str = "#000000"
         self._subtitle_font_size: int = 48  # 일반보다 큰 폰트
         self._subtitle_position: str = "bottom"  # 화면 중간보다 아래
-        self._temp_files: List[str] = []
+        self._workspace: Optional[Workspace] = None  # 중간 파일 디렉토리 (처음 쓸 때 만듦)
+        self._scratch_peak_bytes: int = 0  # 마지막 작업의 중간 파일 최대 사용량
         self._external_audio_file: Optional[str] = None  # 외부 음성 파일
         self._external_subtitles: Optional[List[Dict]] = None  # 외부 자막 정보
+        # TTS 음성을 최종 영상의 음성 코덱(AAC)으로 바로 받아서 먹싱 때 스트림 복사
+        self._audio_format: str = "m4a"
+        self._ffmpeg = FFmpeg()
+        # 'ffmpeg': 필터 그래프 한 번으로 렌더링, 'moviepy': 프레임마다 파이썬에서 합성
+        self._render_backend: str = self._settings.video_render_backend
+        self._caption_renderer: Optional[CaptionRenderer] = None  # moviepy 백엔드 자막 이미지
+        self._encode_profile = EncodeProfile()  # 인코딩 프로필 (video_settings.encode_profile)
+        self._progress_callback: Optional[Callable[[str, float], None]] = None  # 단계별 진행 상황 (단계, 0~1)
+        self._subtitle_delivery: str = self._settings.video_subtitle_delivery
+        self._subtitle_track: Optional[str] = None  # MP4에 mov_text 트랙으로 넣을 SRT (작업 공간 안)
+        self._sidecar_paths: List[str] = []  # 영상 옆에 저장한 자막 파일 (WebVTT, ASS)
     
     @property
     def script_text(self) -> str:
@@ -48,107 +79,526 @@ class MP4Creator:
         """출력 MP4 파일 경로를 설정"""
         self._output_path = value
     
-    def _download_image(self, url: str, output_path: str) -> str:
-        """이미지 URL에서 파일을 다운로드"""
+    @property
+    def render_backend(self) -> str:
+        """렌더링 방식을 반환"""
+        return self._render_backend
+    
+    @render_backend.setter
+    def render_backend(self, value: str) -> None:
+        """렌더링 방식을 설정 ('ffmpeg', 'moviepy')"""
+        if value not in self.RENDER_BACKENDS:
+            raise ValueError(f"render_backend must be one of {self.RENDER_BACKENDS}")
+        self._render_backend = value
+    
+    @property
+    def encode_profile(self) -> EncodeProfile:
+        """인코딩 프로필을 반환"""
+        return self._encode_profile
+    
+    @encode_profile.setter
+    def encode_profile(self, value: EncodeProfile) -> None:
+        """인코딩 프로필을 설정"""
+        self._encode_profile = value
+    
+    @property
+    def subtitle_delivery(self) -> str:
+        """자막 표시 방식을 반환"""
+        return self._subtitle_delivery
+    
+    @subtitle_delivery.setter
+    def subtitle_delivery(self, value: str) -> None:
+        """자막 표시 방식을 설정 ('burn', 'soft', 'both')"""
+        if value not in self.SUBTITLE_DELIVERIES:
+            raise ValueError(f"subtitle_delivery must be one of {self.SUBTITLE_DELIVERIES}")
+        self._subtitle_delivery = value
+    
+    @property
+    def sidecar_paths(self) -> List[str]:
+        """마지막 작업에서 영상 옆에 저장한 자막 파일 경로들을 반환"""
+        return list(self._sidecar_paths)
+    
+    @property
+    def progress_callback(self) -> Optional[Callable[[str, float], None]]:
+        """진행 상황을 받을 함수를 반환"""
+        return self._progress_callback
+    
+    @progress_callback.setter
+    def progress_callback(self, value: Optional[Callable[[str, float], None]]) -> None:
+        """
+        진행 상황을 받을 함수를 설정
+        
+        단계('tts', 'images', 'render', 'mux')와 그 단계의 진행률(0~1)을 받는다.
+        """
+        self._progress_callback = value
+    
+    @property
+    def scratch_peak_bytes(self) -> int:
+        """마지막 작업에서 중간 파일이 차지한 최대 용량(바이트)을 반환"""
+        return self._scratch_peak_bytes
+    
+    def _report(self, stage: str, fraction: float) -> None:
+        """진행 상황 전달 (받는 쪽의 오류는 렌더링에 영향을 주지 않음)"""
+        if self._progress_callback is None:
+            return
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            self._temp_files.append(output_path)
-            return output_path
+            self._progress_callback(stage, fraction)
         except Exception as e:
-            raise Exception(f"이미지 다운로드 실패: {str(e)}")
-    
-    def _search_images_for_text(self, text: str, limit: int = 1) -> List[str]:
-        """텍스트에서 키워드를 추출하여 이미지 검색"""
-        # [검색어:키워드] 패턴 찾기
-        import re
-        search_pattern = r'\[검색어:([^\]]+)\]'
-        matches = re.findall(search_pattern, text)
+            print(f"⚠️ 진행 상황 전달 실패: {e}")
+    
+    async def _download_images(self, urls: List[str]) -> List[str]:
+        """이미지 URL들을 연결 풀 하나로 동시에 다운로드 (입력 순서대로 경로 반환)"""
+        # MP4 렌디션(움직이는 배경)은 확장자로 구분해서 ffmpeg 렌더러가 영상으로 디코딩
+        targets = [(url, self._scratch_file('.mp4' if urlparse(url).path.endswith('.mp4') else '.jpg'))
+                   for url in urls]
+        print(f"📥 이미지 다운로드 중... ({len(urls)}개 동시)")
+        image_paths = await ImageDownloader().download_all(targets)
+        self._workspace.check()
+        return image_paths
+    
+    @metrics.timed('image_search')
+    def _search_images_for_text(self, text: str, limit: int = 1, script: Optional[Script] = None,
+                                moving: bool = False) -> List[str]:
+        """
+        텍스트에서 키워드를 추출하여 이미지 검색
         
-        image_urls = []
+        원본 GIF 대신 영상 해상도를 덮는 가장 작은 렌디션을 받는다.
+        moving이면 MP4 렌디션(움직이는 배경)을, 없거나 아니면 정지 렌디션을 사용한다.
+        """
+        # [검색어:키워드] 명령어는 TTS와 같은 파싱 결과에서 가져옴
+        if script is None:
+            script = ScriptParser().parse(text)
+        return [url for url in self._search_image_urls(script.search_keywords, limit, moving) if url]
+    
+    def _search_image_urls(self, keywords: List[str], limit: int = 1, moving: bool = False) -> List[Optional[str]]:
+        """검색어마다 이미지 URL 검색 (검색어 순서대로, 찾지 못하면 None)"""
+        image_urls: List[Optional[str]] = []
         giphy = GiphySearch()
+        giphy.target_size = (self._video_width, self._video_height)
         
-        for keyword in matches:
+        for keyword in keywords:
+            url = None
             try:
                 giphy.search_query = keyword
                 giphy.limit = limit
                 results = giphy.search()
                 
                 if results:
-                    image_urls.append(results[0]['url'])
+                    result = results[0]
+                    rendition = (moving and result.get('video')) or result.get('still')
+                    url = rendition['url'] if rendition else result['url']
             except Exception as e:
                 print(f"이미지 검색 실패 ({keyword}): {e}")
+            image_urls.append(url)
         
         return image_urls
     
-    def _create_subtitle_clip(self, text: str, start_time: float, end_time: float) -> TextClip:
+    def _create_subtitle_clip(self, text: str, start_time: float, end_time: float) -> ImageClip:
         """자막 클립 생성 (화면 중간보다 아래, 큰 폰트)"""
         # 자막 위치 계산 (화면 중간보다 아래)
         y_position = int(self._video_height * 0.75)  # 화면의 75% 지점
         
-        subtitle_clip = TextClip(
-            text,
-            fontsize=self._subtitle_font_size,
-            color='white',
-            font='Noto-Sans-CJK-KR-Bold',
-            stroke_color='black',
-            stroke_width=2
+        # 자막 이미지는 Pillow로 그리고 같은 텍스트는 캐시에서 재사용 (화면 너비의 90%에서 줄바꿈)
+        if self._caption_renderer is None or self._caption_renderer.max_width != int(self._video_width * 0.9):
+            self._caption_renderer = CaptionRenderer(
+                font_size=self._subtitle_font_size,
+                stroke_width=2,
+                max_width=int(self._video_width * 0.9)
+            )
+        
+        subtitle_clip = ImageClip(
+            self._caption_renderer.render(text), transparent=True
         ).set_position(('center', y_position)).set_start(start_time).set_end(end_time)
         
         return subtitle_clip
     
-    def _create_video_from_image(self, image_path: str, duration: float) -> ImageClip:
-        """이미지로부터 비디오 클립 생성"""
-        # 이미지를 비디오 해상도에 맞게 리사이즈
-        with Image.open(image_path) as img:
-            # 이미지 비율 유지하면서 리사이즈
-            img_ratio = img.width / img.height
-            video_ratio = self._video_width / self._video_height
-            
-            if img_ratio > video_ratio:
-                # 이미지가 더 넓음 - 높이를 비디오 높이에 맞춤
-                new_height = self._video_height
-                new_width = int(new_height * img_ratio)
-            else:
-                # 이미지가 더 높음 - 너비를 비디오 너비에 맞춤
-                new_width = self._video_width
-                new_height = int(new_width / img_ratio)
-            
-            # 리사이즈
-            img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # 비디오 크기의 검은 배경 생성
-            background = Image.new('RGB', (self._video_width, self._video_height), self._background_color)
-            
-            # 이미지를 중앙에 배치
-            x_offset = (self._video_width - new_width) // 2
-            y_offset = (self._video_height - new_height) // 2
-            background.paste(img_resized, (x_offset, y_offset))
-            
-            # 임시 파일로 저장
-            temp_image_path = tempfile.mktemp(suffix='.png')
-            background.save(temp_image_path)
-            self._temp_files.append(temp_image_path)
+    def _create_video_from_image(self, image_path: Optional[str], duration: float) -> ImageClip:
+        """이미지로부터 비디오 클립 생성 (image_path가 None이면 배경색만)"""
+        # 이미지를 화면에 맞춘 프레임 배열로 준비 (같은 이미지는 캐시에서 재사용, 파일로 저장하지 않음)
+        preparer = FramePreparer(self._video_width, self._video_height, self._background_color)
+        frame = preparer.prepare(image_path) if image_path else preparer.background()
         
         # MoviePy로 비디오 클립 생성
-        video_clip = ImageClip(temp_image_path).set_duration(duration)
+        video_clip = ImageClip(frame).set_duration(duration)
         return video_clip
     
+    def _scratch(self) -> Workspace:
+        """이 작업의 작업 공간 (처음 쓸 때 만듦)"""
+        if self._workspace is None:
+            self._workspace = Workspace()
+        return self._workspace
+    
+    def _scratch_file(self, suffix: str) -> str:
+        """작업 공간 안의 새 임시 파일 경로"""
+        return self._scratch().file(suffix)
+    
     def _cleanup_temp_files(self):
-        """임시 파일들 정리"""
-        for file_path in self._temp_files:
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            except Exception:
-                pass
-        self._temp_files = []
+        """임시 파일들 정리 (작업 공간 삭제)"""
+        if self._workspace is None:
+            return
+        stats = self._workspace.stats
+        self._scratch_peak_bytes = stats['peak_bytes']
+        self._workspace.close()
+        self._workspace = None
+        self._subtitle_track = None
+        print(f"🧹 작업 공간 정리 (최대 사용량 {stats['peak_bytes'] / 1024 / 1024:.1f}MB)")
+    
+    def _write_video_ffmpeg(self, slides: List[Tuple[str, float]], subtitles: List[Dict], duration: float,
+                            video_path: str, audio_file: Optional[str] = None, threads: int = 0,
+                            progress: Optional[Callable[[float], None]] = None) -> None:
+        """타임라인을 ffmpeg 필터 그래프로 바꿔서 한 번에 렌더링 (자막은 libass, 음성이 있으면 먹싱까지)"""
+        writer = SubtitleWriter(
+            self._video_width, self._video_height,
+            font=self._settings.video_subtitle_font,
+            font_size=self._subtitle_font_size
+        )
+        # 입힐 자막이 없으면 자막 필터 없이 렌더링
+        subtitle_path = writer.write_ass(subtitles, self._scratch_file('.ass')) if subtitles else None
+        
+        renderer = FFmpegRenderer(
+            self._scratch().path, self._video_width, self._video_height, self._fps,
+            self._background_color, ffmpeg=self._ffmpeg, profile=self._encode_profile, threads=threads
+        )
+        renderer.render(slides, duration, video_path, subtitle_path, audio_file, progress=progress)
+    
+    def _prepare_subtitle_track(self, subtitles: List[Dict]) -> None:
+        """
+        자막 트랙과 자막 파일 준비 (subtitle_delivery가 'soft', 'both'일 때)
+        
+        TTS 자막 시간 그대로 MP4에 넣을 SRT(mov_text 트랙)를 만들고,
+        영상 옆에 WebVTT(웹 플레이어)와 ASS(화면에 입히는 자막과 같은 모양)도 저장한다.
+        """
+        self._sidecar_paths = []
+        if self._subtitle_delivery == 'burn' or not subtitles:
+            return
+        writer = SubtitleWriter(
+            self._video_width, self._video_height,
+            font=self._settings.video_subtitle_font,
+            font_size=self._subtitle_font_size
+        )
+        self._subtitle_track = writer.write_srt(subtitles, self._scratch_file('.srt'))
+        base_path = os.path.splitext(self._output_path)[0]
+        self._sidecar_paths = [
+            writer.write_vtt(subtitles, f"{base_path}.vtt"),
+            writer.write_ass(subtitles, f"{base_path}.ass")
+        ]
+        print(f"📝 자막 트랙과 자막 파일 준비 완료 ({', '.join(os.path.basename(path) for path in self._sidecar_paths)})")
     
+    def _mux(self, video_path: str, audio_file: str, total_duration: float) -> None:
+        """영상과 음성(과 자막 트랙)을 스트림 복사로 합쳐서 출력 파일 생성"""
+        with metrics.span('mp4_mux'):
+            self._ffmpeg.mux(
+                video_path, audio_file, self._output_path, duration=total_duration,
+                subtitle_path=self._subtitle_track, subtitle_language=self.SUBTITLE_LANGUAGE
+            )
+    
+    def _render_with_ffmpeg(self, slides: List[Tuple[str, float]], subtitles: List[Dict],
+                            total_duration: float, audio_file: str) -> None:
+        """ffmpeg 한 번의 실행으로 렌더링과 음성 먹싱 (자막 트랙이 있으면 먹싱은 따로)"""
+        print("🎬 ffmpeg로 비디오 렌더링 중...")
+        progress = lambda fraction: self._report('render', fraction)
+        if self._subtitle_track is None:
+            with metrics.span('mp4_render', backend='ffmpeg'):
+                self._write_video_ffmpeg(slides, subtitles, total_duration, self._output_path, audio_file,
+                                         progress=progress)
+            self._report('render', 1.0)
+            return
+        
+        # 자막 트랙은 렌더링한 영상에 스트림 복사로 붙임
+        video_path = self._scratch_file('.mp4')
+        with metrics.span('mp4_render', backend='ffmpeg'):
+            self._write_video_ffmpeg(slides, subtitles, total_duration, video_path, progress=progress)
+        self._report('render', 1.0)
+        self._report('mux', 0.0)
+        self._mux(video_path, audio_file, total_duration)
+        self._report('mux', 1.0)
+    
+    def _write_video_moviepy(self, slides: List[Tuple[str, float]], subtitles: List[Dict], total_duration: float,
+                             video_path: str, threads: int = 0) -> None:
+        """moviepy로 클립을 합성해서 음성 없이 영상만 렌더링"""
+        # 비디오 클립들 생성
+        video_clips = []
+        subtitle_clips = []
+        current_time = 0.0
+        
+        if slides:
+            # 이미지가 있는 경우
+            for image_path, image_duration in slides:
+                video_clip = self._create_video_from_image(image_path, image_duration)
+                video_clip = video_clip.set_start(current_time)
+                video_clips.append(video_clip)
+                
+                current_time += image_duration
+        else:
+            # 이미지가 없는 경우 단순한 배경
+            print("🎨 기본 배경 생성 중...")
+            video_clip = self._create_video_from_image(None, total_duration)
+            video_clips.append(video_clip)
+        
+        # 자막 클립 생성
+        print("📝 자막 생성 중...")
+        for subtitle in subtitles:
+            # 키 이름 확인 (start/end 또는 start_time/end_time)
+            start_time, end_time = SubtitleWriter.cue_times(subtitle)
+            text = subtitle.get('text', '')
+            
+            subtitle_clip = self._create_subtitle_clip(
+                text,
+                start_time,
+                end_time
+            )
+            subtitle_clips.append(subtitle_clip)
+        
+        # 모든 클립 합성
+        print("🎬 비디오 합성 중...")
+        compose_started = time.perf_counter()
+        
+        # 비디오 클립들 합치기
+        if len(video_clips) > 1:
+            final_video = CompositeVideoClip(video_clips, size=(self._video_width, self._video_height))
+        else:
+            final_video = video_clips[0]
+        
+        # 자막 추가
+        if subtitle_clips:
+            final_video = CompositeVideoClip([final_video] + subtitle_clips)
+        
+        # 영상 길이는 음성 길이에 맞춤 (음성은 moviepy를 거치지 않고 먹싱 단계에서 합침)
+        final_video = final_video.set_duration(total_duration)
+        
+        metrics.observe('stage_seconds', time.perf_counter() - compose_started, stage='mp4_compose')
+        
+        print("💾 MP4 파일 저장 중...")
+        ffmpeg_params = self._encode_profile.codec_args(self._fps)
+        decimate = self._encode_profile.decimate_filter(self._fps)
+        if decimate:
+            # 같은 프레임은 버리고 가변 프레임레이트로 저장 (moviepy가 쓰는 ffmpeg 기준 인자)
+            ffmpeg_params += ['-vf', decimate, *FFmpeg(get_setting("FFMPEG_BINARY")).vfr_args()]
+        final_video.write_videofile(
+            video_path,
+            fps=self._fps,
+            codec='libx264',
+            preset=self._encode_profile.preset,
+            audio=False,
+            threads=threads or None,
+            ffmpeg_params=ffmpeg_params
+        )
+    
+    def _write_video(self, backend: str, slides: List[Tuple[str, float]], subtitles: List[Dict],
+                     duration: float, video_path: str, threads: int = 0) -> None:
+        """선택한 렌더링 방식으로 음성 없이 영상만 렌더링"""
+        if backend == 'ffmpeg':
+            self._write_video_ffmpeg(slides, subtitles, duration, video_path, threads=threads)
+        else:
+            self._write_video_moviepy(slides, subtitles, duration, video_path, threads=threads)
+    
+    def _render_with_moviepy(self, slides: List[Tuple[str, float]], subtitles: List[Dict],
+                             total_duration: float, audio_file: str) -> None:
+        """moviepy로 클립을 합성해서 렌더링한 뒤 음성과 먹싱"""
+        # 음성 없이 영상만 렌더링한 뒤 음성과 먹싱
+        # (음성을 다시 디코딩/인코딩하지 않고, AAC면 그대로 복사)
+        temp_video_path = self._scratch_file('.mp4')
+        self._report('render', 0.0)
+        with metrics.span('mp4_render', backend='moviepy'):
+            self._write_video_moviepy(slides, subtitles, total_duration, temp_video_path)
+        self._workspace.check()
+        self._report('render', 1.0)
+        self._report('mux', 0.0)
+        self._mux(temp_video_path, audio_file, total_duration)
+        self._report('mux', 1.0)
+    
+    def _segment_job(self, backend: str, segment: Dict, video_path: str, threads: int) -> Dict:
+        """구간 렌더링 작업 (다른 프로세스로 넘길 수 있는 값만)"""
+        return {
+            'backend': backend,
+            'width': self._video_width,
+            'height': self._video_height,
+            'fps': self._fps,
+            'background_color': self._background_color,
+            'subtitle_font_size': self._subtitle_font_size,
+            'encode_profile': (self._encode_profile.name, self._encode_profile.crf, self._encode_profile.preset),
+            'slides': segment['slides'],
+            'subtitles': segment['subtitles'],
+            'duration': segment['duration'],
+            'video_path': video_path,
+            'threads': threads
+        }
+    
+    def _render_segment_files(self, backend: str, segments: List[Dict]) -> List[str]:
+        """
+        구간들을 프로세스마다 따로 음성 없이 렌더링 (구간 순서대로 경로 반환)
+        
+        모든 구간은 같은 인코딩 설정을 쓰고 구간마다 키프레임으로 시작하므로 다시 인코딩하지 않고 이어 붙일 수 있다.
+        """
+        workers = min(len(segments), self._settings.video_render_workers or os.cpu_count() or 1)
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        print(f"🎬 구간 {len(segments)}개 렌더링 중... (프로세스 {workers}개, 구간마다 스레드 {threads}개)")
+        
+        segment_paths = [self._scratch_file('.mp4') for _ in segments]
+        jobs = [self._segment_job(backend, segment, path, threads) for segment, path in zip(segments, segment_paths)]
+        self._report('render', 0.0)
+        if len(jobs) == 1:
+            _render_segment(jobs[0])
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_segment, job) for job in jobs]
+                # 끝난 구간 수로 진행률 전달 (하나라도 실패하면 예외)
+                for finished, future in enumerate(as_completed(futures), start=1):
+                    future.result()
+                    self._report('render', finished / len(futures))
+        self._workspace.check()
+        self._report('render', 1.0)
+        return segment_paths
+    
+    def _concat_and_mux(self, segment_paths: List[str], durations: List[float],
+                        total_duration: float, audio_file: str) -> None:
+        """구간들을 스트림 복사로 이어 붙이고 음성과 먹싱"""
+        video_path = self._scratch_file('.mp4')
+        merger = MP4Merger(self._scratch().path)
+        merger.mp4_files = segment_paths
+        # 가변 프레임레이트 구간은 파일 길이가 실제 구간 길이보다 짧을 수 있으므로 구간 길이로 이어 붙임
+        merger.durations = durations
+        merger.output_path = video_path
+        self._report('mux', 0.0)
+        merger.merge()
+        self._mux(video_path, audio_file, total_duration)
+        self._report('mux', 1.0)
+    
+    def _render_segments(self, backend: str, segments: List[Dict], total_duration: float, audio_file: str) -> None:
+        """구간들을 프로세스마다 따로 렌더링한 뒤 이어 붙이고 음성과 먹싱"""
+        with metrics.span('mp4_render', backend=backend):
+            segment_paths = self._render_segment_files(backend, segments)
+        self._concat_and_mux(segment_paths, [segment['duration'] for segment in segments], total_duration, audio_file)
+    
+    @staticmethod
+    def _script_segments(script: Script, subtitles: List[Dict], total_duration: float) -> List[Dict]:
+        """
+        대본의 [검색어:...] 줄마다 구간을 나눔 (빌드 캐시 단위)
+        
+        구간은 검색어가 있는 줄의 첫 자막에서 시작해서 다음 검색어 줄 직전까지이고 (첫 구간은 0초부터)
+        그 줄의 검색어 이미지를 차례로 보여준다. 경계가 대본 줄에 묶여 있으므로 한 줄을 고쳐도
+        다른 구간의 내용(구간 기준 자막 시간)은 그대로다.
+        
+        Returns:
+            List[Dict]: 구간 목록 (start, duration, keywords, subtitles).
+                검색어가 없거나 자막에 대본 줄 번호가 없으면 빈 목록
+        """
+        if not subtitles or any(subtitle.get('line') is None for subtitle in subtitles):
+            return []
+        
+        groups: List[Tuple[float, List[str]]] = []
+        for line in script.lines:
+            keywords = [marker.value for marker in line.markers if marker.kind == '검색어']
+            if not keywords:
+                continue
+            line_starts = [SubtitleWriter.cue_times(subtitle)[0] for subtitle in subtitles if subtitle['line'] >= line.index]
+            start = 0.0 if not groups else min(line_starts, default=total_duration)
+            if groups and start <= groups[-1][0]:
+                # 사이에 읽을 텍스트가 없는 검색어 줄은 다음 구간에서 함께 보여줌
+                groups[-1] = (groups[-1][0], groups[-1][1] + keywords)
+            else:
+                groups.append((start, keywords))
+        
+        segments = []
+        for index, (start, keywords) in enumerate(groups):
+            end = groups[index + 1][0] if index + 1 < len(groups) else total_duration
+            if end - start < 0.001:
+                continue
+            # 캐시 키와 렌더링에 같은 값을 쓰도록 구간 기준 시간을 ms 단위로 맞춤
+            # (절대 시간을 먼저 반올림하면 앞 줄 길이에 따라 구간 기준 시간이 달라짐)
+            segments.append({
+                'start': start,
+                'duration': round(end - start, 3),
+                'keywords': keywords,
+                'subtitles': [
+                    {'text': subtitle.get('text', ''),
+                     'start_time': round(subtitle['start_time'], 3),
+                     'end_time': round(subtitle['end_time'], 3)}
+                    for subtitle in SegmentPlanner.rebase_subtitles(subtitles, start, end)
+                ]
+            })
+        return segments
+    
+    def _segment_cache_key(self, backend: str, moving: bool, segment: Dict) -> str:
+        """구간 빌드 캐시 키 (화면에 보이는 입력값과 인코딩 설정)"""
+        return BuildCache.make_key({
+            'keywords': segment['keywords'],
+            'duration': segment['duration'],
+            'subtitles': [[subtitle['text'], subtitle['start_time'], subtitle['end_time']]
+                          for subtitle in segment['subtitles']],
+            'style': {
+                'size': [self._video_width, self._video_height],
+                'fps': self._fps,
+                'background_color': self._background_color,
+                'font_size': self._subtitle_font_size,
+                'font': self._settings.video_subtitle_font,
+                'font_path': self._settings.video_subtitle_font_path,
+                'moving_background': moving
+            },
+            'encode': {
+                'backend': backend,
+                'profile': self._encode_profile.name,
+                'crf': self._encode_profile.crf,
+                'preset': self._encode_profile.preset
+            }
+        })
+    
+    async def _render_with_build_cache(self, backend: str, moving: bool, segments: List[Dict],
+                                       total_duration: float, audio_file: str) -> None:
+        """
+        바뀐 구간만 렌더링하고 나머지는 이전 빌드의 구간을 재사용
+        
+        이미지 검색/다운로드도 다시 렌더링할 구간의 검색어만 한다.
+        재사용하는 구간은 작업 공간으로 링크/복사해서 쓰므로, 이어 붙이기 전에 이 작업이나 다른 작업이
+        캐시를 정리해도 지워지지 않는다. 캐시 정리는 이어 붙인 뒤 이 빌드의 구간을 빼고 한 번만 한다.
+        """
+        cache = BuildCache()
+        keys = [self._segment_cache_key(backend, moving, segment) for segment in segments]
+        paths: List[Optional[str]] = [cache.get(key, dest=self._scratch_file('.mp4')) for key in keys]
+        missing = [index for index, path in enumerate(paths) if path is None]
+        metrics.inc('build_cache_requests_total', len(segments) - len(missing), result='hit')
+        metrics.inc('build_cache_requests_total', len(missing), result='miss')
+        print(f"♻️ 구간 {len(segments)}개 중 {len(segments) - len(missing)}개 재사용, {len(missing)}개 렌더링")
+        
+        self._report('images', 0.0)
+        if missing:
+            print("🖼️ 이미지 검색 중...")
+            keywords = [keyword for index in missing for keyword in segments[index]['keywords']]
+            image_urls = self._search_image_urls(keywords, moving=moving)
+            found = [url for url in image_urls if url]
+            image_paths = dict(zip(found, await self._download_images(found))) if found else {}
+            self._report('images', 1.0)
+            
+            url_iter = iter(image_urls)
+            render_segments = []
+            complete = []
+            for index in missing:
+                segment = segments[index]
+                urls = [next(url_iter) for _ in segment['keywords']]
+                segment_images = [image_paths[url] for url in urls if url]
+                slide_duration = segment['duration'] / len(segment_images) if segment_images else 0.0
+                render_segments.append({
+                    **segment,
+                    'slides': [(image_path, slide_duration) for image_path in segment_images]
+                })
+                # 이미지를 찾지 못한 구간은 다음 빌드에서 다시 검색하도록 캐시에 넣지 않음
+                complete.append(all(urls))
+            
+            with metrics.span('mp4_render', backend=backend):
+                rendered = self._render_segment_files(backend, render_segments)
+            # 이어 붙이기는 작업 공간의 렌더링 결과로 하고 캐시에는 복사본만 저장
+            for index, rendered_path, cacheable in zip(missing, rendered, complete):
+                if cacheable:
+                    cache.put(keys[index], rendered_path, evict=False)
+                paths[index] = rendered_path
+        else:
+            self._report('images', 1.0)
+            self._report('render', 1.0)
+        
+        self._concat_and_mux(paths, [segment['duration'] for segment in segments], total_duration, audio_file)
+        cache.evict(keep=keys)
+    
+    @metrics.timed('mp4_create')
     async def create_mp4(self) -> str:
         """MP4 동영상 생성"""
         if not self._script_text and not self._external_audio_file:
@@ -157,115 +607,95 @@ class MP4Creator:
             raise ValueError("출력 경로가 설정되지 않았습니다")
         
         try:
+            # 대본은 한 번만 파싱해서 TTS와 이미지 검색이 함께 사용
+            script = ScriptParser().parse(self._script_text) if self._script_text else None
+
             # 1. 음성 파일 준비 (외부 파일이 있으면 사용, 없으면 TTS 생성)
+            self._report('tts', 0.0)
             if self._external_audio_file and os.path.exists(self._external_audio_file):
                 print("🎤 외부 음성 파일 사용 중...")
                 audio_file = self._external_audio_file
                 subtitles = self._external_subtitles or []
+                total_duration = self._ffmpeg.probe(audio_file)['duration']
             else:
                 print("🎤 음성 파일 생성 중...")
-                tts = TextToSpeech()
-                tts.text = self._script_text
-                audio_path = tempfile.mktemp(suffix='.mp3')
-                tts.output_path = audio_path
-                
-                audio_file, subtitles = await tts.convert()
-                self._temp_files.append(audio_file)
+                tts = TextToSpeech(output_dir=self._scratch().path)
+                tts.set_output_format(self._audio_format)
+                with metrics.span('mp4_tts'):
+                    result = await tts.convert(self._script_text, script)
+                if not result['success']:
+                    raise Exception(result['error'])
+
+                # 자막은 단어 경계 기반의 짧은 구 단위로 받음
+                audio_file = result['audio_path']
+                subtitles = result['subtitles']
+                total_duration = result['duration']
+                self._workspace.check()
+            self._report('tts', 1.0)
+            
+            # 렌더링 방식을 먼저 정함 (움직이는 배경은 ffmpeg 백엔드에서만 사용)
+            use_ffmpeg = self._render_backend == 'ffmpeg' and FFmpegRenderer(self._scratch().path, ffmpeg=self._ffmpeg).available()
+            moving = use_ffmpeg and self._settings.video_moving_background
+            backend = 'ffmpeg' if use_ffmpeg else 'moviepy'
+            if self._render_backend == 'ffmpeg' and not use_ffmpeg:
+                print("⚠️ ffmpeg에 libass 자막 필터가 없어 moviepy로 렌더링합니다")
+            
+            # 자막 트랙만 쓰면 화면에 자막을 그리지 않음 (영상은 자막이 바뀌어도 그대로)
+            self._prepare_subtitle_track(subtitles)
+            burned = subtitles if self._subtitle_delivery in ('burn', 'both') else []
+            
+            # 대본의 검색어 줄 단위로 구간을 나눠서 이전 빌드와 달라진 구간만 검색/다운로드/렌더링
+            # (설정으로 켤 때만. 이미지가 같은 시간씩이 아니라 검색어 줄의 시간만큼 보이므로 결과가 달라짐)
+            script_segments = []
+            if script and self._settings.video_build_cache_enabled:
+                script_segments = self._script_segments(script, subtitles, total_duration)
+                if not burned:
+                    script_segments = [{**segment, 'subtitles': []} for segment in script_segments]
+            if script_segments:
+                await self._render_with_build_cache(backend, moving, script_segments, total_duration, audio_file)
+                print("✅ MP4 생성 완료!")
+                return self._output_path
             
             # 2. 이미지 검색 및 다운로드
+            self._report('images', 0.0)
             print("🖼️ 이미지 검색 중...")
             # 외부 음성 사용 시 script_text가 없을 수 있으므로 자막 텍스트에서 검색
             search_text = self._script_text
             if not search_text and subtitles:
                 search_text = " ".join([sub['text'] for sub in subtitles])
+                script = None
             
-            image_urls = self._search_images_for_text(search_text)
-            
-            # 3. 비디오 클립들 생성
-            video_clips = []
-            subtitle_clips = []
-            current_time = 0.0
-            
-            # 오디오 클립 로드
-            audio_clip = AudioFileClip(audio_file)
-            total_duration = audio_clip.duration
+            image_urls = self._search_images_for_text(search_text, script=script, moving=moving)
             
+            # 3. 이미지 다운로드 (이미지마다 같은 시간씩 표시, 모두 받으면 바로 렌더링)
+            slides: List[Tuple[str, float]] = []
             if image_urls:
-                # 이미지가 있는 경우
                 image_duration = total_duration / len(image_urls)
-                
-                for i, image_url in enumerate(image_urls):
-                    print(f"📥 이미지 다운로드 중... ({i+1}/{len(image_urls)})")
-                    
-                    # 이미지 다운로드
-                    temp_image_path = tempfile.mktemp(suffix='.jpg')
-                    downloaded_image = self._download_image(image_url, temp_image_path)
-                    
-                    # 비디오 클립 생성
-                    video_clip = self._create_video_from_image(downloaded_image, image_duration)
-                    video_clip = video_clip.set_start(current_time)
-                    video_clips.append(video_clip)
-                    
-                    current_time += image_duration
-            else:
-                # 이미지가 없는 경우 단순한 배경
-                print("🎨 기본 배경 생성 중...")
-                temp_bg_path = tempfile.mktemp(suffix='.png')
-                
-                # 단순한 배경 이미지 생성
-                background = Image.new('RGB', (self._video_width, self._video_height), self._background_color)
-                background.save(temp_bg_path)
-                self._temp_files.append(temp_bg_path)
-                
-                video_clip = self._create_video_from_image(temp_bg_path, total_duration)
-                video_clips.append(video_clip)
-            
-            # 4. 자막 클립 생성
-            print("📝 자막 생성 중...")
-            for subtitle in subtitles:
-                # 키 이름 확인 (start/end 또는 start_time/end_time)
-                start_time = subtitle.get('start_time', subtitle.get('start', 0))
-                end_time = subtitle.get('end_time', subtitle.get('end', 0))
-                text = subtitle.get('text', '')
-                
-                subtitle_clip = self._create_subtitle_clip(
-                    text,
-                    start_time,
-                    end_time
-                )
-                subtitle_clips.append(subtitle_clip)
-            
-            # 5. 모든 클립 합성
-            print("🎬 비디오 합성 중...")
+                image_paths = await self._download_images(image_urls)
+                slides = [(image_path, image_duration) for image_path in image_paths]
+            self._report('images', 1.0)
             
-            # 비디오 클립들 합치기
-            if len(video_clips) > 1:
-                final_video = CompositeVideoClip(video_clips, size=(self._video_width, self._video_height))
+            # 4. 렌더링 (음성 먹싱 포함)
+            # 길면 이미지/자막 경계에서 구간으로 나눠 프로세스마다 따로 렌더링
+            workers = self._settings.video_render_workers or os.cpu_count() or 1
+            planner = SegmentPlanner(self._fps, workers, self._settings.video_segment_seconds)
+            segments = planner.plan(slides, burned, total_duration)
+            if len(segments) > 1:
+                self._render_segments(backend, segments, total_duration, audio_file)
+            elif use_ffmpeg:
+                self._render_with_ffmpeg(slides, burned, total_duration, audio_file)
             else:
-                final_video = video_clips[0]
-            
-            # 자막 추가
-            if subtitle_clips:
-                final_video = CompositeVideoClip([final_video] + subtitle_clips)
-            
-            # 오디오 추가
-            final_video = final_video.set_audio(audio_clip)
-            
-            # 6. MP4 파일로 출력
-            print("💾 MP4 파일 저장 중...")
-            final_video.write_videofile(
-                self._output_path,
-                fps=self._fps,
-                codec='libx264',
-                audio_codec='aac',
-                temp_audiofile=tempfile.mktemp(suffix='.m4a'),
-                remove_temp=True
-            )
+                self._render_with_moviepy(slides, burned, total_duration, audio_file)
             
             print("✅ MP4 생성 완료!")
             return self._output_path
             
         except Exception as e:
+            # 영상을 만들지 못했으면 먼저 저장한 자막 파일도 지움
+            for path in self._sidecar_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            self._sidecar_paths = []
             raise Exception(f"MP4 생성 실패: {str(e)}")
         
         finally:
@@ -314,3 +744,20 @@ class MP4Creator:
         """외부에서 생성된 음성 파일과 자막 정보를 설정"""
         self._external_audio_file = audio_file
         self._external_subtitles = subtitles or []
+
+
+def _render_segment(job: Dict) -> str:
+    """구간 하나를 음성 없이 렌더링 (프로세스 풀 작업 함수)"""
+    creator = MP4Creator()
+    creator._video_width = job['width']
+    creator._video_height = job['height']
+    creator._fps = job['fps']
+    creator._background_color = job['background_color']
+    creator._subtitle_font_size = job['subtitle_font_size']
+    creator._encode_profile = EncodeProfile(*job['encode_profile'])
+    try:
+        creator._write_video(job['backend'], job['slides'], job['subtitles'], job['duration'],
+                             job['video_path'], threads=job['threads'])
+    finally:
+        creator._cleanup_temp_files()
+    return job['video_path']
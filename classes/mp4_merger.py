@@ -1,14 +1,25 @@
 import os
-import subprocess
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 import tempfile
+from classes.metrics import metrics
+from classes.ffmpeg import FFmpeg
 
 class MP4Merger:
-    def __init__(self):
+    def __init__(self, temp_dir: str):
+        """
+        MP4 파일들을 다시 인코딩하지 않고 이어 붙이는 클래스
+
+        Args:
+            temp_dir (str): concat 입력 목록을 만들 디렉토리 (작업의 작업 공간)
+        """
+        if not temp_dir or not os.path.isdir(temp_dir):
+            raise FileNotFoundError(f"임시 디렉토리가 존재하지 않습니다: {temp_dir}")
+        self._temp_dir = temp_dir
         self._mp4_files: List[str] = []
         self._output_path: str = ""
         self._temp_file = None
+        self._durations: Optional[List[float]] = None
 
     @property
     def mp4_files(self) -> List[str]:
@@ -30,6 +41,23 @@ class MP4Merger:
         
         self._mp4_files = files
 
+    @property
+    def durations(self) -> Optional[List[float]]:
+        """입력 파일별 길이(초)를 반환"""
+        return self._durations
+
+    @durations.setter
+    def durations(self, values: Optional[List[float]]):
+        """
+        입력 파일별 길이(초)를 설정
+
+        설정하면 다음 파일의 시작 시간을 이 길이로 정한다.
+        (가변 프레임레이트 파일은 마지막 프레임 이후가 잘려 있어서 파일 길이로 이으면 밀림)
+        """
+        if values is not None and len(values) != len(self._mp4_files):
+            raise ValueError("durations는 mp4_files와 개수가 같아야 합니다")
+        self._durations = values
+
     @property
     def output_path(self) -> str:
         """통합된 MP4 파일의 출력 경로를 반환"""
@@ -51,14 +79,18 @@ class MP4Merger:
 
     def _create_ffmpeg_input_file(self) -> str:
         """ffmpeg용 입력 파일 리스트를 생성"""
-        # 현재 디렉토리에 임시 파일 생성
-        temp_file = open("ffmpeg_input_list.txt", "w", encoding="utf-8")
-        for file in self._mp4_files:
-            temp_file.write(f"file '{file}'\n")
-        temp_file.close()
-        self._temp_file = "ffmpeg_input_list.txt"
+        # 작업 공간에 병합마다 다른 이름으로 생성 (동시에 여러 병합을 해도 겹치지 않음)
+        fd, self._temp_file = tempfile.mkstemp(suffix='.txt', prefix='ffmpeg_input_list_', dir=self._temp_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+            for index, file in enumerate(self._mp4_files):
+                # 따옴표가 들어간 경로도 concat 형식에 맞게 이스케이프
+                escaped = os.path.abspath(file).replace("'", "'\\''")
+                temp_file.write(f"file '{escaped}'\n")
+                if self._durations:
+                    temp_file.write(f"duration {self._durations[index]:.6f}\n")
         return self._temp_file
 
+    @metrics.timed('mp4_merge')
     def merge(self) -> str:
         """MP4 파일들을 통합하여 새로운 MP4 파일 생성"""
         if not self._mp4_files:
@@ -70,20 +102,15 @@ class MP4Merger:
             # ffmpeg 입력 파일 생성
             input_file = self._create_ffmpeg_input_file()
             
-            # ffmpeg 명령어 실행
-            cmd = [
-                'ffmpeg',
+            # ffmpeg 명령어 실행 (다시 인코딩하지 않고 스트림 복사)
+            FFmpeg().run([
                 '-f', 'concat',
                 '-safe', '0',
                 '-i', input_file,
                 '-c', 'copy',
+                '-movflags', '+faststart',
                 self._output_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                raise Exception(f"ffmpeg 오류: {result.stderr}")
+            ])
             
             return self._output_path
             
@@ -0,0 +1,464 @@
+import os
+import time
+import uuid
+import queue
+import signal
+import asyncio
+import multiprocessing
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional
+from classes.settings import Settings
+from classes.metrics import metrics
+
+class RenderJob:
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    ERROR = 'error'
+    CANCELLED = 'cancelled'
+
+    # 단계별 전체 진행률 비중 (순서대로)
+    STAGES = (('tts', 0.25), ('images', 0.10), ('render', 0.55), ('mux', 0.05), ('upload', 0.05))
+
+    def __init__(self, params: Dict):
+        """
+        영상 생성 작업 하나
+
+        Args:
+            params (Dict): script_text 또는 script_id, output_path, upload, filename
+        """
+        self._id: str = uuid.uuid4().hex
+        self._params = params
+        self._status: str = self.QUEUED
+        self._stage: Optional[str] = None
+        self._stage_progress: float = 0.0
+        self._progress: float = 0.0
+        self._result: Optional[Dict] = None
+        self._error: Optional[str] = None
+        self._cancel_requested: bool = False
+        self._pid: Optional[int] = None
+        self._created_at: float = time.time()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        # 상태가 바뀔 때마다 증가 (구독자가 변경 여부를 확인)
+        self._version: int = 0
+
+    @property
+    def id(self) -> str:
+        """작업 ID를 반환"""
+        return self._id
+
+    @property
+    def params(self) -> Dict:
+        """작업 입력값을 반환"""
+        return self._params
+
+    @property
+    def status(self) -> str:
+        """작업 상태를 반환 (queued, running, done, error, cancelled)"""
+        return self._status
+
+    @property
+    def finished(self) -> bool:
+        """작업이 끝났는지 여부를 반환"""
+        return self._status in (self.DONE, self.ERROR, self.CANCELLED)
+
+    @property
+    def cancel_requested(self) -> bool:
+        """취소 요청 여부를 반환"""
+        return self._cancel_requested
+
+    @property
+    def pid(self) -> Optional[int]:
+        """렌더링 프로세스 ID를 반환 (실행 중일 때만)"""
+        return self._pid
+
+    @property
+    def version(self) -> int:
+        """상태 변경 횟수를 반환"""
+        return self._version
+
+    def start(self, pid: int) -> None:
+        """실행 시작 기록"""
+        self._status = self.RUNNING
+        self._pid = pid
+        self._started_at = time.time()
+        self._version += 1
+
+    def update(self, stage: str, fraction: float) -> bool:
+        """
+        단계 진행 상황 기록
+
+        Returns:
+            bool: 전체 진행률이 1% 이상 바뀌었거나 단계가 바뀌었으면 True (알릴 필요가 있음)
+        """
+        progress = 0.0
+        for name, weight in self.STAGES:
+            if name == stage:
+                progress += weight * max(0.0, min(1.0, fraction))
+                break
+            progress += weight
+        changed = stage != self._stage or progress - self._progress >= 0.01
+        self._stage = stage
+        self._stage_progress = fraction
+        self._progress = max(self._progress, progress)
+        if changed:
+            self._version += 1
+        return changed
+
+    def request_cancel(self) -> None:
+        """취소 요청 기록 (대기 중이면 바로 취소)"""
+        self._cancel_requested = True
+        if self._status == self.QUEUED:
+            self._finish(self.CANCELLED)
+        else:
+            self._version += 1
+
+    def finish(self, result: Optional[Dict], error: Optional[str] = None) -> None:
+        """실행 결과 기록 (취소 요청이 있었으면 결과와 관계없이 취소)"""
+        if self._cancel_requested:
+            self._finish(self.CANCELLED)
+        elif result is not None:
+            self._result = result
+            self._progress = 1.0
+            self._finish(self.DONE)
+        else:
+            self._error = error or '알 수 없는 오류'
+            self._finish(self.ERROR)
+
+    def _finish(self, status: str) -> None:
+        """끝난 상태 기록"""
+        self._status = status
+        self._pid = None
+        self._finished_at = time.time()
+        self._version += 1
+
+    def to_dict(self) -> Dict:
+        """작업 상태를 API 응답용 dict로 반환"""
+        data = {
+            'job_id': self._id,
+            'status': self._status,
+            'stage': self._stage,
+            'stage_progress': round(self._stage_progress, 3),
+            'progress': round(self._progress, 3),
+            'cancel_requested': self._cancel_requested,
+            'created_at': self._created_at,
+            'started_at': self._started_at,
+            'finished_at': self._finished_at
+        }
+        if self._params.get('script_id'):
+            data['script_id'] = self._params['script_id']
+        if self._error is not None:
+            data['error'] = self._error
+        if self._result is not None:
+            data.update(self._result)
+            data['download_url'] = f"/download-video?file={os.path.basename(self._result['output_path'])}"
+            data['subtitle_urls'] = [f"/download-video?file={os.path.basename(path)}"
+                                     for path in self._result.get('subtitle_files', [])]
+        return data
+
+def _run_render_job(params: Dict, messages) -> None:
+    """
+    렌더링 프로세스에서 영상 생성 (진행 상황과 결과는 messages 큐로 전달)
+
+    취소할 때 ffmpeg과 구간 렌더링 프로세스까지 한 번에 종료할 수 있도록 새 프로세스 그룹을 만들고,
+    종료 신호를 받으면 예외로 바꿔서 임시 파일 정리(finally)가 실행되게 한다.
+    """
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+
+    def terminate(signum, frame):
+        raise SystemExit(f"종료 신호 {signum}")
+    signal.signal(signal.SIGTERM, terminate)
+
+    from classes.mp4_creator import MP4Creator
+
+    last = {'stage': None, 'fraction': -1.0}
+
+    def report(stage: str, fraction: float) -> None:
+        # 너무 자주 보내지 않도록 단계가 바뀌었거나 1% 이상 진행됐을 때만 전달
+        if stage == last['stage'] and fraction - last['fraction'] < 0.01 and fraction < 1.0:
+            return
+        last['stage'], last['fraction'] = stage, fraction
+        messages.put(('progress', stage, fraction))
+
+    output_path = params['output_path']
+    try:
+        creator = MP4Creator()
+        creator.output_path = output_path
+        creator.progress_callback = report
+        if params.get('script_id'):
+            asyncio.run(creator.create_from_spreadsheet(params['script_id']))
+        else:
+            creator.script_text = params['script_text']
+            asyncio.run(creator.create_mp4())
+
+        result = {'output_path': output_path, 'file_size': os.path.getsize(output_path),
+                  'scratch_peak_bytes': creator.scratch_peak_bytes, 'subtitle_files': creator.sidecar_paths}
+        if params.get('upload'):
+            report('upload', 0.0)
+            filename = params.get('filename') or os.path.basename(output_path)
+            result['drive'] = asyncio.run(creator.upload_to_drive(output_path, filename))
+            report('upload', 1.0)
+        messages.put(('done', result))
+    except BaseException as e:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        messages.put(('error', str(e)))
+        if not isinstance(e, Exception):
+            raise
+
+class RenderJobManager:
+    # 렌더링 프로세스 시작 방식 (웹 서버의 스레드/이벤트 루프를 복제하지 않도록 spawn)
+    START_METHOD = 'spawn'
+
+    def __init__(self, workers: Optional[int] = None, output_dir: str = "outputs", max_jobs: Optional[int] = None):
+        """
+        영상 생성 작업을 별도 프로세스에서 실행하는 작업 큐
+
+        영상 생성(TTS, 이미지 처리, 인코딩, 구글 API 호출)은 모두 작업마다 새 프로세스에서 실행되므로
+        웹 서버의 이벤트 루프는 막히지 않는다. 동시에 실행하는 작업 수는 workers개로 제한되고
+        나머지는 제출한 순서대로 기다린다. 실행 중인 작업은 프로세스 그룹째 종료해서 취소한다.
+
+        Args:
+            workers (Optional[int]): 동시에 실행할 작업 수. None이면 설정값 사용
+            output_dir (str): 영상 파일 저장 디렉토리
+            max_jobs (Optional[int]): 보관할 최대 작업 수 (넘으면 끝난 오래된 작업부터 삭제)
+        """
+        self._settings = Settings()
+        self._workers = workers or self._settings.video_job_workers
+        self._output_dir = output_dir
+        self._max_jobs = max_jobs or self._settings.video_job_max_jobs
+        self._jobs: "OrderedDict[str, RenderJob]" = OrderedDict()
+        self._processes: Dict[str, multiprocessing.Process] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._changed = asyncio.Event()
+        self._context = multiprocessing.get_context(self.START_METHOD)
+
+    @property
+    def workers(self) -> int:
+        """동시에 실행할 작업 수를 반환"""
+        return self._workers
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환"""
+        counts = {status: 0 for status in (RenderJob.QUEUED, RenderJob.RUNNING, RenderJob.DONE,
+                                           RenderJob.ERROR, RenderJob.CANCELLED)}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        counts['workers'] = self._workers
+        return counts
+
+    def _ensure_workers(self) -> None:
+        """실행 중인 이벤트 루프에서 작업자 시작 (처음 제출할 때 한 번)"""
+        if self._tasks and not all(task.done() for task in self._tasks):
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self._workers)]
+        # 작업자가 없는 동안 큐에 남은 작업을 다시 넣음
+        for job in self._jobs.values():
+            if job.status == RenderJob.QUEUED:
+                self._queue.put_nowait(job.id)
+
+    def _notify(self) -> None:
+        """상태 변경을 구독자에게 알림"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+        stats = self.stats
+        metrics.set('render_jobs', stats[RenderJob.QUEUED], status=RenderJob.QUEUED)
+        metrics.set('render_jobs', stats[RenderJob.RUNNING], status=RenderJob.RUNNING)
+
+    def submit(self, params: Dict) -> Dict:
+        """
+        영상 생성 작업 제출
+
+        Args:
+            params (Dict): script_text 또는 script_id(스프레드시트 대본 ID) 중 하나,
+                upload(구글 드라이브 업로드 여부), filename(업로드 파일 이름)
+
+        Returns:
+            Dict: 작업 정보
+        """
+        script_text = str(params.get('script_text') or '')
+        script_id = str(params.get('script_id') or '')
+        if not script_text.strip() and not script_id:
+            raise ValueError("script_text 또는 script_id가 필요합니다.")
+
+        os.makedirs(self._output_dir, exist_ok=True)
+        output_path = os.path.abspath(os.path.join(
+            self._output_dir, f"video_{int(time.time())}_{uuid.uuid4().hex[:8]}.mp4"
+        ))
+        job = RenderJob({
+            'script_text': script_text,
+            'script_id': script_id,
+            'output_path': output_path,
+            'upload': Settings._to_bool(params.get('upload', False)),
+            'filename': str(params.get('filename') or '')
+        })
+
+        self._ensure_workers()
+        self._jobs[job.id] = job
+        self._queue.put_nowait(job.id)
+
+        metrics.inc('render_jobs_total')
+        print(f"🎬 영상 생성 작업 접수: {job.id} (동시 실행 {self._workers}개)")
+        self._evict()
+        self._notify()
+        return job.to_dict()
+
+    def _evict(self) -> None:
+        """보관 작업 수가 max_jobs를 넘으면 끝난 오래된 작업부터 삭제"""
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self._max_jobs:
+                break
+            if self._jobs[job_id].finished:
+                del self._jobs[job_id]
+
+    def get_job(self, job_id: str) -> Optional[RenderJob]:
+        """작업 조회 (없으면 None)"""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Dict]:
+        """모든 작업 정보 (제출 순서)"""
+        return [job.to_dict() for job in self._jobs.values()]
+
+    def cancel(self, job_id: str) -> Optional[RenderJob]:
+        """
+        작업 취소 (없으면 None)
+
+        대기 중이면 바로 취소하고, 실행 중이면 렌더링 프로세스 그룹을 종료한다.
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.request_cancel()
+        process = self._processes.get(job_id)
+        if process is not None and process.is_alive():
+            self._terminate(process)
+        self._notify()
+        return job
+
+    @staticmethod
+    def _terminate(process: multiprocessing.Process) -> None:
+        """렌더링 프로세스와 그 하위 프로세스(ffmpeg, 구간 렌더링) 종료"""
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, signal.SIGTERM)
+            else:
+                process.terminate()
+        except (ProcessLookupError, PermissionError):
+            process.terminate()
+
+    @staticmethod
+    def _next_message(messages, timeout: float):
+        """렌더링 프로세스의 메시지 하나 (timeout초 안에 없으면 None)"""
+        try:
+            return messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    @staticmethod
+    def _drain(messages) -> List:
+        """큐에 남아 있는 메시지를 모두 꺼냄 (기다리지 않음)"""
+        remaining = []
+        while True:
+            try:
+                remaining.append(messages.get_nowait())
+            except queue.Empty:
+                return remaining
+
+    def _handle(self, job: RenderJob, message, outcome: Dict) -> None:
+        """렌더링 프로세스의 메시지 하나 반영 (결과/오류는 outcome에 기록)"""
+        kind = message[0]
+        if kind == 'progress':
+            if job.update(message[1], message[2]):
+                self._notify()
+        elif kind == 'done':
+            outcome['result'] = message[1]
+        elif kind == 'error':
+            outcome['error'] = message[1]
+
+    async def _run(self, job: RenderJob) -> None:
+        """작업 하나를 새 프로세스에서 실행하고 끝날 때까지 진행 상황을 반영"""
+        loop = asyncio.get_running_loop()
+        messages = self._context.Queue()
+        process = self._context.Process(target=_run_render_job, args=(job.params, messages))
+        process.start()
+        self._processes[job.id] = process
+        job.start(process.pid)
+        self._notify()
+
+        outcome: Dict = {'result': None, 'error': None}
+        try:
+            while True:
+                message = await loop.run_in_executor(None, self._next_message, messages, 0.5)
+                if message is not None:
+                    self._handle(job, message, outcome)
+                    continue
+                if not process.is_alive():
+                    # 기다리는 시간이 끝난 직후에 결과를 넣고 종료했을 수 있으므로 남은 메시지를 모두 읽음
+                    for message in self._drain(messages):
+                        self._handle(job, message, outcome)
+                    break
+            await loop.run_in_executor(None, process.join)
+            if outcome['result'] is None and outcome['error'] is None:
+                outcome['error'] = f"렌더링 프로세스가 비정상 종료되었습니다 (exit code {process.exitcode})"
+        finally:
+            self._processes.pop(job.id, None)
+            messages.close()
+        job.finish(outcome['result'], outcome['error'])
+
+    async def _worker(self, index: int) -> None:
+        """큐에서 작업을 하나씩 꺼내 실행"""
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            try:
+                if job is None or job.status != RenderJob.QUEUED:
+                    continue
+                with metrics.span('render_job'):
+                    try:
+                        await self._run(job)
+                    except Exception as e:
+                        job.finish(None, f"영상 생성 실패: {str(e)}")
+                metrics.inc('render_jobs_finished_total', status=job.status)
+                self._notify()
+            finally:
+                self._queue.task_done()
+
+    async def subscribe(self, job_id: str, keepalive: float = 15.0) -> AsyncIterator[Optional[Dict]]:
+        """
+        작업 상태/진행 상황이 바뀔 때마다 작업 정보를 전달 (작업이 끝나면 종료)
+
+        keepalive초 동안 변화가 없으면 None을 보내서 연결 유지에 쓸 수 있게 한다.
+        """
+        seen: Optional[int] = None
+        while True:
+            changed = self._changed
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if seen != job.version:
+                seen = job.version
+                yield job.to_dict()
+            if job.finished:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), keepalive)
+            except asyncio.TimeoutError:
+                yield None
+
+    async def shutdown(self) -> None:
+        """작업자와 실행 중인 렌더링 프로세스 종료"""
+        for process in list(self._processes.values()):
+            if process.is_alive():
+                self._terminate(process)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+# 프로세스 전체에서 공유하는 영상 생성 작업 관리자
+render_jobs = RenderJobManager()
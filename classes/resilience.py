@@ -0,0 +1,271 @@
+import time
+import random
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Type
+from classes.settings import Settings
+from classes.metrics import metrics
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어서 요청을 보내지 않음"""
+
+class LatencyTracker:
+    def __init__(self, window: int = 200):
+        """
+        최근 요청 지연 시간을 모아 백분위수를 계산하는 클래스
+
+        지연 시간은 세그먼트 크기(예상 음성 길이 등)로 나눈 값으로 저장해서
+        길이가 다른 세그먼트끼리도 비교할 수 있게 한다.
+
+        Args:
+            window (int): 보관할 최근 표본 수
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    @property
+    def count(self) -> int:
+        """보관 중인 표본 수를 반환"""
+        return len(self._samples)
+
+    def record(self, latency: float, size: float = 1.0) -> None:
+        """지연 시간(초)을 크기 단위당 값으로 기록"""
+        self._samples.append(latency / max(size, 1e-3))
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """크기 단위당 지연 시간의 백분위수 (표본이 없으면 None)"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        """
+        연속 실패가 쌓이면 일정 시간 요청을 바로 거절하는 서킷 브레이커
+
+        열린 상태에서는 서비스에 요청을 보내지 않고 즉시 실패하며,
+        reset_seconds가 지나면 요청 하나만 시험으로 보내서(half open)
+        성공하면 닫고 실패하면 다시 연다.
+
+        Args:
+            failure_threshold (int): 열리기까지의 연속 실패 횟수
+            reset_seconds (float): 열린 상태를 유지하는 시간(초)
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._state: str = self.CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+        self._probing: bool = False
+
+    @property
+    def state(self) -> str:
+        """현재 상태를 반환 (열린 지 reset_seconds가 지났으면 half_open)"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_seconds:
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """연속 실패 횟수를 반환"""
+        return self._failures
+
+    def allow(self) -> None:
+        """요청을 보내도 되는지 확인 (안 되면 CircuitOpenError)"""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        retry_after = max(0.0, self._reset_seconds - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(f"Edge-TTS 서비스 장애로 요청을 잠시 중단했습니다 ({retry_after:.0f}초 후 재시도)")
+
+    def record_success(self) -> None:
+        """성공 기록 (닫힘 상태로 돌아감)"""
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """시험 요청이 결과 없이 끝났을 때 다른 요청이 시험할 수 있도록 함"""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """실패 기록 (연속 실패가 기준을 넘거나 시험 요청이 실패하면 열림)"""
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            if self._state != self.OPEN or self._probing:
+                print(f"⚠️ 서킷 브레이커 열림: 연속 실패 {self._failures}회")
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+class ResilientCaller:
+    # 서비스별로 프로세스 안에서 공유하는 상태 (작업이 달라도 같은 서비스 상태를 봄)
+    _shared: Dict[str, Tuple[CircuitBreaker, LatencyTracker]] = {}
+    # 헤징을 시작하려면 필요한 최소 지연 시간 표본 수
+    MIN_HEDGE_SAMPLES = 20
+    # 재시도 대기 시간 (초)
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 8.0
+
+    def __init__(self, name: str, timeout: Optional[float] = None, max_retries: Optional[int] = None,
+                 hedge_enabled: Optional[bool] = None, hedge_percentile: Optional[float] = None,
+                 failure_threshold: Optional[int] = None, reset_seconds: Optional[float] = None):
+        """
+        외부 서비스 호출에 시간 제한, 지터 재시도, 헤징, 서킷 브레이커를 적용하는 클래스
+
+        - 호출마다 timeout을 두고, 실패하면 지수 백오프에 무작위 지터를 더해 재시도한다.
+        - 호출이 최근 지연 시간의 백분위수(기본 p95)를 넘기면 같은 요청을 하나 더 보내서
+          먼저 끝난 쪽을 쓴다 (헤징). 느린 요청 하나가 긴 작업 전체를 붙잡지 않게 된다.
+        - 연속 실패가 쌓이면 서킷 브레이커가 열려 요청을 바로 거절한다.
+
+        Args:
+            name (str): 서비스 이름 (같은 이름끼리 브레이커와 지연 통계를 공유)
+            timeout (Optional[float]): 호출 하나의 제한 시간(초)
+            max_retries (Optional[int]): 최대 재시도 횟수
+            hedge_enabled (Optional[bool]): 헤징 사용 여부
+            hedge_percentile (Optional[float]): 헤징을 시작할 지연 시간 백분위수
+            failure_threshold (Optional[int]): 브레이커가 열리는 연속 실패 횟수
+            reset_seconds (Optional[float]): 브레이커가 열려 있는 시간(초)
+            (None인 값은 설정값 사용)
+        """
+        self._settings = Settings()
+        self._name = name
+        self._timeout = timeout if timeout is not None else self._settings.tts_request_timeout
+        self._max_retries = max_retries if max_retries is not None else self._settings.tts_max_retries
+        self._hedge_enabled = hedge_enabled if hedge_enabled is not None else self._settings.tts_hedge_enabled
+        self._hedge_percentile = (hedge_percentile if hedge_percentile is not None
+                                  else self._settings.tts_hedge_percentile)
+
+        if name not in self._shared:
+            self._shared[name] = (
+                CircuitBreaker(
+                    failure_threshold if failure_threshold is not None else self._settings.tts_breaker_failure_threshold,
+                    reset_seconds if reset_seconds is not None else self._settings.tts_breaker_reset_seconds
+                ),
+                LatencyTracker()
+            )
+        self._breaker, self._latency = self._shared[name]
+        self._stats = {'calls': 0, 'retries': 0, 'hedges': 0, 'hedge_wins': 0, 'timeouts': 0, 'rejected': 0}
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """서킷 브레이커를 반환"""
+        return self._breaker
+
+    @property
+    def latency(self) -> LatencyTracker:
+        """지연 시간 통계를 반환"""
+        return self._latency
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """이 호출자의 재시도/헤징/거절 횟수와 브레이커 상태를 반환"""
+        stats = dict(self._stats)
+        stats['breaker'] = self._breaker.state
+        return stats
+
+    def _count(self, event: str) -> None:
+        """호출자 통계와 프로세스 지표를 함께 증가"""
+        self._stats[event] += 1
+        metrics.inc(f'resilience_{event}_total', service=self._name)
+
+    def _hedge_delay(self, size: float) -> Optional[float]:
+        """헤징 요청을 보내기까지 기다릴 시간 (통계가 부족하면 None)"""
+        if not self._hedge_enabled or self._latency.count < self.MIN_HEDGE_SAMPLES:
+            return None
+        threshold = self._latency.percentile(self._hedge_percentile)
+        return threshold * max(size, 1e-3) if threshold is not None else None
+
+    async def _attempt(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """제한 시간을 둔 호출 한 번"""
+        try:
+            return await asyncio.wait_for(factory(), self._timeout)
+        except asyncio.TimeoutError:
+            self._count('timeouts')
+            raise TimeoutError(f"{self._name} 요청 시간 초과 ({self._timeout:.0f}초)")
+
+    async def _hedged(self, factory: Callable[[], Awaitable[Any]], size: float) -> Any:
+        """호출이 백분위수 지연을 넘기면 같은 요청을 하나 더 보내고 먼저 성공한 결과 사용"""
+        primary = asyncio.create_task(self._attempt(factory))
+        tasks = [primary]
+        try:
+            delay = self._hedge_delay(size)
+            if delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self._count('hedges')
+                tasks.append(asyncio.create_task(self._attempt(factory)))
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._count('hedge_wins')
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # 남은 요청(느린 쪽)은 취소
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+
+    async def call(self, factory: Callable[[], Awaitable[Any]], size: float = 1.0,
+                   no_retry: Tuple[Type[BaseException], ...] = (ValueError, TypeError)) -> Any:
+        """
+        서비스 호출
+
+        Args:
+            factory: 호출할 때마다 새 코루틴을 만드는 함수 (재시도/헤징에서 여러 번 호출됨)
+            size (float): 요청 크기 (지연 시간 백분위수를 크기에 비례해서 적용)
+            no_retry: 재시도해도 소용없는 예외 종류 (잘못된 입력 등)
+
+        Returns:
+            Any: factory 코루틴의 결과
+        """
+        self._count('calls')
+        attempt = 0
+        while True:
+            try:
+                self._breaker.allow()
+            except CircuitOpenError:
+                self._count('rejected')
+                raise
+
+            started = time.monotonic()
+            try:
+                result = await self._hedged(factory, size)
+            except (asyncio.CancelledError, *no_retry):
+                # 서비스 상태와 무관한 종료이므로 시험 요청이었다면 다음 요청에 기회를 넘김
+                self._breaker.release_probe()
+                raise
+            except Exception as e:
+                self._breaker.record_failure()
+                if attempt >= self._max_retries:
+                    raise
+                attempt += 1
+                self._count('retries')
+                # 지수 백오프에 전체 지터를 적용해서 동시에 실패한 요청들이 몰리지 않게 함
+                backoff = random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
+                print(f"🔁 {self._name} 재시도 {attempt}/{self._max_retries} ({backoff:.1f}초 후): {e}")
+                await asyncio.sleep(backoff)
+                continue
+
+            self._latency.record(time.monotonic() - started, size)
+            self._breaker.record_success()
+            return result
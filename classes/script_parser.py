@@ -0,0 +1,144 @@
+import re
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+# 대본에서 쓰는 모든 명령어를 한 번에 찾는 패턴
+_TAG_PATTERN = re.compile(r'\[(목소리|VOICE|속도|SPEED|쉼|GIPHY_URL|GOOGLE_URL|GIPHY|GOOGLE|검색어):([^\]]+)\]')
+
+_VOICE_TAGS = ('목소리', 'VOICE')
+_SPEED_TAGS = ('속도', 'SPEED')
+_PAUSE_TAG = '쉼'
+
+class TextRun(NamedTuple):
+    """읽을 텍스트 조각 (start/end는 원문 위치)"""
+    text: str
+    start: int
+    end: int
+
+class Pause(NamedTuple):
+    """쉼 명령어 (초 단위)"""
+    duration: float
+    start: int
+    end: int
+
+class SearchMarker(NamedTuple):
+    """이미지 검색 명령어 (kind: 검색어, GIPHY, GOOGLE, GIPHY_URL, GOOGLE_URL)"""
+    kind: str
+    value: str
+    start: int
+    end: int
+
+class ScriptLine(NamedTuple):
+    """
+    대본 한 줄
+
+    voice/speed는 그 줄 전체에 적용되는 범위이고, items는 텍스트와 쉼이
+    대본 순서대로 들어 있다.
+    """
+    index: int
+    start: int
+    end: int
+    voice: Optional[str]
+    speed: Optional[str]
+    items: Tuple[Union[TextRun, Pause], ...]
+    markers: Tuple[SearchMarker, ...]
+
+class Script(NamedTuple):
+    """파싱된 대본 (TTS, 이미지 검색, 렌더링이 함께 사용)"""
+    source: str
+    lines: Tuple[ScriptLine, ...]
+
+    @property
+    def markers(self) -> List[SearchMarker]:
+        """모든 이미지 검색 명령어를 순서대로 반환"""
+        return [marker for line in self.lines for marker in line.markers]
+
+    @property
+    def search_keywords(self) -> List[str]:
+        """[검색어:...] 키워드를 순서대로 반환"""
+        return [marker.value for marker in self.markers if marker.kind == '검색어']
+
+    @property
+    def text_runs(self) -> List[TextRun]:
+        """읽을 텍스트 조각을 순서대로 반환"""
+        return [item for line in self.lines for item in line.items if isinstance(item, TextRun)]
+
+class ScriptParser:
+    def __init__(self):
+        """대본을 한 번만 훑어서 Script로 변환하는 파서"""
+        self._pattern = _TAG_PATTERN
+
+    def _flush_text(self, parts: List[str], start: int, end: int, items: list) -> None:
+        """모아둔 텍스트 조각을 정리해서 TextRun으로 추가"""
+        text = ''.join(parts).strip()
+        if text:
+            items.append(TextRun(text, start, end))
+        parts.clear()
+
+    def _parse_line(self, source: str, index: int, start: int, end: int) -> Optional[ScriptLine]:
+        """한 줄을 파싱 (빈 줄이면 None)"""
+        if not source[start:end].strip():
+            return None
+
+        voice = None
+        speed = None
+        items: List[Union[TextRun, Pause]] = []
+        markers: List[SearchMarker] = []
+
+        # 쉼 사이의 텍스트는 다른 명령어를 뺀 나머지를 이어붙인 것
+        parts: List[str] = []
+        run_start = start
+        cursor = start
+
+        for match in self._pattern.finditer(source, start, end):
+            tag = match.group(1)
+            value = match.group(2)
+            parts.append(source[cursor:match.start()])
+            cursor = match.end()
+
+            if tag == _PAUSE_TAG:
+                self._flush_text(parts, run_start, match.start(), items)
+                try:
+                    items.append(Pause(float(value), match.start(), match.end()))
+                except ValueError:
+                    pass  # 숫자가 아닌 쉼은 무시
+                run_start = match.end()
+            elif tag in _VOICE_TAGS:
+                if voice is None:
+                    voice = value  # 한 줄에 여러 개면 첫 번째 값 사용
+            elif tag in _SPEED_TAGS:
+                if speed is None:
+                    speed = value
+            else:
+                markers.append(SearchMarker(tag, value, match.start(), match.end()))
+
+        parts.append(source[cursor:end])
+        self._flush_text(parts, run_start, end, items)
+
+        return ScriptLine(index, start, end, voice, speed, tuple(items), tuple(markers))
+
+    def parse(self, source: str) -> Script:
+        """
+        대본 전체를 파싱
+
+        Args:
+            source (str): 대본 원문
+
+        Returns:
+            Script: 줄 단위로 목소리/속도 범위, 텍스트/쉼, 검색 명령어를 담은 결과
+        """
+        lines = []
+        start = 0
+        index = 0
+        length = len(source)
+
+        while start <= length:
+            end = source.find('\n', start)
+            if end < 0:
+                end = length
+            line = self._parse_line(source, index, start, end)
+            if line is not None:
+                lines.append(line)
+            index += 1
+            start = end + 1
+
+        return Script(source, tuple(lines))
@@ -0,0 +1,134 @@
+import os
+from typing import Dict, List, Tuple
+from classes.subtitle_writer import SubtitleWriter
+
+class SegmentPlanner:
+    # 움직이는 배경(영상 클립)은 중간에서 자르면 다음 구간에서 처음부터 다시 재생되므로 자르지 않음
+    VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov')
+
+    def __init__(self, fps: int = 30, segments: int = 1, min_seconds: float = 30.0):
+        """
+        타임라인을 따로 렌더링할 수 있는 구간들로 나누는 클래스
+
+        - 구간 경계는 이미지/자막 경계 중 목표 위치(전체 길이를 구간 수로 나눈 지점)에 가장 가까운 곳
+        - 경계는 프레임 단위로 맞춰서 구간별 프레임 수를 더하면 전체 프레임 수와 같음
+        - 자막 중간은 가능하면 피하고, 영상 클립 중간은 자르지 않음
+        - 구간마다 해당 시간의 이미지와 자막을 구간 시작 기준 시간으로 옮겨서 담음
+
+        Args:
+            fps (int): 초당 프레임 수
+            segments (int): 최대 구간 수 (보통 작업 프로세스 수)
+            min_seconds (float): 구간 하나의 최소 길이(초). 짧으면 프로세스 시작 비용이 더 큼
+        """
+        self._fps = fps
+        self._segments = max(1, segments)
+        self._min_seconds = max(1.0, min_seconds)
+
+    def _snap(self, seconds: float) -> float:
+        """프레임 경계로 맞춘 시간"""
+        return round(seconds * self._fps) / self._fps
+
+    @classmethod
+    def _is_video(cls, path: str) -> bool:
+        """영상 클립인지 확인"""
+        return os.path.splitext(path)[1].lower() in cls.VIDEO_EXTENSIONS
+
+    def _cut_candidates(self, slides: List[Tuple[str, float]], subtitles: List[Dict],
+                        duration: float) -> Tuple[List[float], List[float]]:
+        """
+        자를 수 있는 시간들
+
+        Returns:
+            Tuple[List[float], List[float]]: (이미지/자막 경계 중 자막 중간이 아닌 곳, 그 밖에 자를 수 있는 곳)
+        """
+        cues = [SubtitleWriter.cue_times(subtitle) for subtitle in subtitles]
+        slide_spans = []
+        elapsed = 0.0
+        for path, slide_duration in slides:
+            slide_spans.append((elapsed, elapsed + slide_duration, self._is_video(path)))
+            elapsed += slide_duration
+
+        boundaries = {self._snap(end) for _, end, _ in slide_spans}
+        for start, end in cues:
+            boundaries.update((self._snap(start), self._snap(end)))
+
+        def inside_video(t: float) -> bool:
+            return any(is_video and start < t < end for start, end, is_video in slide_spans)
+
+        def inside_cue(t: float) -> bool:
+            return any(start < t < end for start, end in cues)
+
+        preferred = sorted(t for t in boundaries
+                           if 0 < t < duration and not inside_video(t) and not inside_cue(t))
+        # 경계가 부족하면 영상 클립이 아닌 곳은 어디든 (같은 이미지/자막이 두 구간에 이어서 그려짐)
+        fallback = [t for t in (self._snap(i) for i in range(1, int(duration)))
+                    if not inside_video(t) and t not in preferred]
+        return preferred, fallback
+
+    def count(self, duration: float) -> int:
+        """길이에 맞는 구간 수"""
+        return max(1, min(self._segments, int(duration // self._min_seconds)))
+
+    def plan(self, slides: List[Tuple[str, float]], subtitles: List[Dict], duration: float) -> List[Dict]:
+        """
+        구간 나누기
+
+        Args:
+            slides (List[Tuple[str, float]]): (이미지 경로, 표시 시간(초)) 목록
+            subtitles (List[Dict]): 자막 목록
+            duration (float): 전체 길이(초)
+
+        Returns:
+            List[Dict]: 구간 목록 (start, duration, slides, subtitles). 나눌 수 없으면 구간 하나
+        """
+        count = self.count(duration)
+        cuts: List[float] = []
+        if count > 1:
+            preferred, fallback = self._cut_candidates(slides, subtitles, duration)
+            # 구간이 너무 짧아지지 않도록 목표 길이의 절반 이상 떨어진 곳만 사용
+            min_gap = duration / count / 2
+            for index in range(1, count):
+                target = duration * index / count
+                previous = cuts[-1] if cuts else 0.0
+                for candidates in (preferred, fallback):
+                    usable = [t for t in candidates if t - previous >= min_gap and duration - t >= min_gap]
+                    if usable:
+                        cuts.append(min(usable, key=lambda t: abs(t - target)))
+                        break
+
+        edges = [0.0, *cuts, duration]
+        return [self._segment(slides, subtitles, start, end) for start, end in zip(edges, edges[1:])]
+
+    @staticmethod
+    def _segment(slides: List[Tuple[str, float]], subtitles: List[Dict], start: float, end: float) -> Dict:
+        """구간 하나에 들어가는 이미지와 자막 (구간 시작 기준 시간)"""
+        segment_slides: List[Tuple[str, float]] = []
+        elapsed = 0.0
+        for path, slide_duration in slides:
+            slide_start, slide_end = elapsed, elapsed + slide_duration
+            elapsed = slide_end
+            overlap = min(slide_end, end) - max(slide_start, start)
+            if overlap > 1e-6:
+                segment_slides.append((path, overlap))
+
+        return {
+            'start': start,
+            'duration': end - start,
+            'slides': segment_slides,
+            'subtitles': SegmentPlanner.rebase_subtitles(subtitles, start, end)
+        }
+
+    @staticmethod
+    def rebase_subtitles(subtitles: List[Dict], start: float, end: float) -> List[Dict]:
+        """구간(start~end)에 걸친 자막을 잘라서 구간 시작 기준 시간으로 옮김"""
+        segment_subtitles: List[Dict] = []
+        for subtitle in subtitles:
+            cue_start, cue_end = SubtitleWriter.cue_times(subtitle)
+            if cue_end <= start or cue_start >= end:
+                continue
+            segment_subtitles.append({
+                **subtitle,
+                'start_time': max(cue_start, start) - start,
+                'end_time': min(cue_end, end) - start
+            })
+        return segment_subtitles
@@ -22,6 +22,13 @@ class Settings:
         writer = WriteFile(self._settings, "json", self._settings_file)
         writer.write()
 
+    @staticmethod
+    def _to_bool(value: Any) -> bool:
+        """설정 페이지에서 문자열로 저장된 값도 bool로 해석"""
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
+
     def update_settings(self, new_settings: Dict[str, Any]) -> None:
         """여러 설정을 한 번에 갱신 및 저장"""
         self._settings.update(new_settings)
@@ -101,6 +108,436 @@ class Settings:
     def voice_type(self, value: str) -> None:
         self.voice_settings["default_voice"] = value
 
+    @property
+    def tts_settings(self) -> Dict[str, Any]:
+        self._settings = self._load_settings()
+        return self._settings.get("tts_settings", {})
+
+    @tts_settings.setter
+    def tts_settings(self, value: Dict[str, Any]) -> None:
+        self._settings["tts_settings"] = value
+        self._save_settings()
+
+    @property
+    def tts_max_concurrency(self) -> int:
+        return int(self.tts_settings.get("max_concurrency", 4))
+
+    @tts_max_concurrency.setter
+    def tts_max_concurrency(self, value: int) -> None:
+        tts = self.tts_settings
+        tts["max_concurrency"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_cache_enabled(self) -> bool:
+        return self._to_bool(self.tts_settings.get("cache_enabled", True))
+
+    @tts_cache_enabled.setter
+    def tts_cache_enabled(self, value: bool) -> None:
+        tts = self.tts_settings
+        tts["cache_enabled"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_cache_dir(self) -> str:
+        return self.tts_settings.get("cache_dir", "cache/tts")
+
+    @tts_cache_dir.setter
+    def tts_cache_dir(self, value: str) -> None:
+        tts = self.tts_settings
+        tts["cache_dir"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_cache_max_size_mb(self) -> float:
+        return float(self.tts_settings.get("cache_max_size_mb", 512))
+
+    @tts_cache_max_size_mb.setter
+    def tts_cache_max_size_mb(self, value: float) -> None:
+        tts = self.tts_settings
+        tts["cache_max_size_mb"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_ssml_batching(self) -> bool:
+        return self._to_bool(self.tts_settings.get("ssml_batching", False))
+
+    @tts_ssml_batching.setter
+    def tts_ssml_batching(self, value: bool) -> None:
+        tts = self.tts_settings
+        tts["ssml_batching"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_duration_model_path(self) -> str:
+        return self.tts_settings.get("duration_model_path", "cache/duration_model.json")
+
+    @tts_duration_model_path.setter
+    def tts_duration_model_path(self, value: str) -> None:
+        tts = self.tts_settings
+        tts["duration_model_path"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_request_timeout(self) -> float:
+        return float(self.tts_settings.get("request_timeout", 30))
+
+    @tts_request_timeout.setter
+    def tts_request_timeout(self, value: float) -> None:
+        tts = self.tts_settings
+        tts["request_timeout"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_max_retries(self) -> int:
+        return int(self.tts_settings.get("max_retries", 2))
+
+    @tts_max_retries.setter
+    def tts_max_retries(self, value: int) -> None:
+        tts = self.tts_settings
+        tts["max_retries"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_hedge_enabled(self) -> bool:
+        return self._to_bool(self.tts_settings.get("hedge_enabled", True))
+
+    @tts_hedge_enabled.setter
+    def tts_hedge_enabled(self, value: bool) -> None:
+        tts = self.tts_settings
+        tts["hedge_enabled"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_hedge_percentile(self) -> float:
+        return float(self.tts_settings.get("hedge_percentile", 95))
+
+    @tts_hedge_percentile.setter
+    def tts_hedge_percentile(self, value: float) -> None:
+        tts = self.tts_settings
+        tts["hedge_percentile"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_breaker_failure_threshold(self) -> int:
+        return int(self.tts_settings.get("breaker_failure_threshold", 5))
+
+    @tts_breaker_failure_threshold.setter
+    def tts_breaker_failure_threshold(self, value: int) -> None:
+        tts = self.tts_settings
+        tts["breaker_failure_threshold"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_breaker_reset_seconds(self) -> float:
+        return float(self.tts_settings.get("breaker_reset_seconds", 30))
+
+    @tts_breaker_reset_seconds.setter
+    def tts_breaker_reset_seconds(self, value: float) -> None:
+        tts = self.tts_settings
+        tts["breaker_reset_seconds"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_batch_workers(self) -> int:
+        return int(self.tts_settings.get("batch_workers", 2))
+
+    @tts_batch_workers.setter
+    def tts_batch_workers(self, value: int) -> None:
+        tts = self.tts_settings
+        tts["batch_workers"] = value
+        self.tts_settings = tts
+
+    @property
+    def tts_batch_max_jobs(self) -> int:
+        return int(self.tts_settings.get("batch_max_jobs", 500))
+
+    @tts_batch_max_jobs.setter
+    def tts_batch_max_jobs(self, value: int) -> None:
+        tts = self.tts_settings
+        tts["batch_max_jobs"] = value
+        self.tts_settings = tts
+
+    @property
+    def subtitle_settings(self) -> Dict[str, Any]:
+        self._settings = self._load_settings()
+        return self._settings.get("subtitle_settings", {})
+
+    @subtitle_settings.setter
+    def subtitle_settings(self, value: Dict[str, Any]) -> None:
+        self._settings["subtitle_settings"] = value
+        self._save_settings()
+
+    @property
+    def subtitle_mode(self) -> str:
+        return self.subtitle_settings.get("mode", "phrase")
+
+    @subtitle_mode.setter
+    def subtitle_mode(self, value: str) -> None:
+        subtitle = self.subtitle_settings
+        subtitle["mode"] = value
+        self.subtitle_settings = subtitle
+
+    @property
+    def subtitle_max_chars(self) -> int:
+        return int(self.subtitle_settings.get("max_chars", 20))
+
+    @subtitle_max_chars.setter
+    def subtitle_max_chars(self, value: int) -> None:
+        subtitle = self.subtitle_settings
+        subtitle["max_chars"] = value
+        self.subtitle_settings = subtitle
+
+    @property
+    def subtitle_max_duration(self) -> float:
+        return float(self.subtitle_settings.get("max_duration", 3.0))
+
+    @subtitle_max_duration.setter
+    def subtitle_max_duration(self, value: float) -> None:
+        subtitle = self.subtitle_settings
+        subtitle["max_duration"] = value
+        self.subtitle_settings = subtitle
+
+    @property
+    def video_settings(self) -> Dict[str, Any]:
+        self._settings = self._load_settings()
+        return self._settings.get("video_settings", {})
+
+    @video_settings.setter
+    def video_settings(self, value: Dict[str, Any]) -> None:
+        self._settings["video_settings"] = value
+        self._save_settings()
+
+    @property
+    def video_render_backend(self) -> str:
+        return self.video_settings.get("render_backend", "moviepy")
+
+    @video_render_backend.setter
+    def video_render_backend(self, value: str) -> None:
+        video = self.video_settings
+        video["render_backend"] = value
+        self.video_settings = video
+
+    @property
+    def video_subtitle_font(self) -> str:
+        return self.video_settings.get("subtitle_font", "Noto Sans CJK KR")
+
+    @video_subtitle_font.setter
+    def video_subtitle_font(self, value: str) -> None:
+        video = self.video_settings
+        video["subtitle_font"] = value
+        self.video_settings = video
+
+    @property
+    def video_subtitle_font_path(self) -> str:
+        return self.video_settings.get("subtitle_font_path", "")
+
+    @video_subtitle_font_path.setter
+    def video_subtitle_font_path(self, value: str) -> None:
+        video = self.video_settings
+        video["subtitle_font_path"] = value
+        self.video_settings = video
+
+    @property
+    def video_encode_profile(self) -> str:
+        return self.video_settings.get("encode_profile", "default")
+
+    @video_encode_profile.setter
+    def video_encode_profile(self, value: str) -> None:
+        video = self.video_settings
+        video["encode_profile"] = value
+        self.video_settings = video
+
+    @property
+    def video_encode_crf(self) -> int:
+        return int(self.video_settings.get("encode_crf", 0))
+
+    @video_encode_crf.setter
+    def video_encode_crf(self, value: int) -> None:
+        video = self.video_settings
+        video["encode_crf"] = value
+        self.video_settings = video
+
+    @property
+    def video_encode_preset(self) -> str:
+        return self.video_settings.get("encode_preset", "")
+
+    @video_encode_preset.setter
+    def video_encode_preset(self, value: str) -> None:
+        video = self.video_settings
+        video["encode_preset"] = value
+        self.video_settings = video
+
+    @property
+    def video_moving_background(self) -> bool:
+        return self._to_bool(self.video_settings.get("moving_background", False))
+
+    @video_moving_background.setter
+    def video_moving_background(self, value: bool) -> None:
+        video = self.video_settings
+        video["moving_background"] = value
+        self.video_settings = video
+
+    @property
+    def video_render_workers(self) -> int:
+        return int(self.video_settings.get("render_workers", 0))
+
+    @video_render_workers.setter
+    def video_render_workers(self, value: int) -> None:
+        video = self.video_settings
+        video["render_workers"] = value
+        self.video_settings = video
+
+    @property
+    def video_segment_seconds(self) -> float:
+        return float(self.video_settings.get("segment_seconds", 30))
+
+    @video_segment_seconds.setter
+    def video_segment_seconds(self, value: float) -> None:
+        video = self.video_settings
+        video["segment_seconds"] = value
+        self.video_settings = video
+
+    @property
+    def video_build_cache_enabled(self) -> bool:
+        return self._to_bool(self.video_settings.get("build_cache_enabled", False))
+
+    @video_build_cache_enabled.setter
+    def video_build_cache_enabled(self, value: bool) -> None:
+        video = self.video_settings
+        video["build_cache_enabled"] = value
+        self.video_settings = video
+
+    @property
+    def video_build_cache_dir(self) -> str:
+        return self.video_settings.get("build_cache_dir", "cache/segments")
+
+    @video_build_cache_dir.setter
+    def video_build_cache_dir(self, value: str) -> None:
+        video = self.video_settings
+        video["build_cache_dir"] = value
+        self.video_settings = video
+
+    @property
+    def video_build_cache_max_size_mb(self) -> float:
+        return float(self.video_settings.get("build_cache_max_size_mb", 2048))
+
+    @video_build_cache_max_size_mb.setter
+    def video_build_cache_max_size_mb(self, value: float) -> None:
+        video = self.video_settings
+        video["build_cache_max_size_mb"] = value
+        self.video_settings = video
+
+    @property
+    def video_job_workers(self) -> int:
+        return max(1, int(self.video_settings.get("job_workers", 1)))
+
+    @video_job_workers.setter
+    def video_job_workers(self, value: int) -> None:
+        video = self.video_settings
+        video["job_workers"] = value
+        self.video_settings = video
+
+    @property
+    def video_job_max_jobs(self) -> int:
+        return max(1, int(self.video_settings.get("job_max_jobs", 100)))
+
+    @video_job_max_jobs.setter
+    def video_job_max_jobs(self, value: int) -> None:
+        video = self.video_settings
+        video["job_max_jobs"] = value
+        self.video_settings = video
+
+    @property
+    def video_subtitle_delivery(self) -> str:
+        return self.video_settings.get("subtitle_delivery", "burn")
+
+    @video_subtitle_delivery.setter
+    def video_subtitle_delivery(self, value: str) -> None:
+        video = self.video_settings
+        video["subtitle_delivery"] = value
+        self.video_settings = video
+
+    @property
+    def download_settings(self) -> Dict[str, Any]:
+        self._settings = self._load_settings()
+        return self._settings.get("download_settings", {})
+
+    @download_settings.setter
+    def download_settings(self, value: Dict[str, Any]) -> None:
+        self._settings["download_settings"] = value
+        self._save_settings()
+
+    @property
+    def download_max_connections(self) -> int:
+        return int(self.download_settings.get("max_connections", 16))
+
+    @download_max_connections.setter
+    def download_max_connections(self, value: int) -> None:
+        download = self.download_settings
+        download["max_connections"] = value
+        self.download_settings = download
+
+    @property
+    def download_per_host_connections(self) -> int:
+        return int(self.download_settings.get("per_host_connections", 4))
+
+    @download_per_host_connections.setter
+    def download_per_host_connections(self, value: int) -> None:
+        download = self.download_settings
+        download["per_host_connections"] = value
+        self.download_settings = download
+
+    @property
+    def download_max_size_mb(self) -> float:
+        return float(self.download_settings.get("max_size_mb", 20))
+
+    @download_max_size_mb.setter
+    def download_max_size_mb(self, value: float) -> None:
+        download = self.download_settings
+        download["max_size_mb"] = value
+        self.download_settings = download
+
+    @property
+    def download_timeout(self) -> float:
+        return float(self.download_settings.get("timeout", 20))
+
+    @download_timeout.setter
+    def download_timeout(self, value: float) -> None:
+        download = self.download_settings
+        download["timeout"] = value
+        self.download_settings = download
+
+    @property
+    def workspace_settings(self) -> Dict[str, Any]:
+        self._settings = self._load_settings()
+        return self._settings.get("workspace_settings", {})
+
+    @workspace_settings.setter
+    def workspace_settings(self, value: Dict[str, Any]) -> None:
+        self._settings["workspace_settings"] = value
+        self._save_settings()
+
+    @property
+    def workspace_root(self) -> str:
+        return str(self.workspace_settings.get("root", "") or "")
+
+    @workspace_root.setter
+    def workspace_root(self, value: str) -> None:
+        workspace = self.workspace_settings
+        workspace["root"] = value
+        self.workspace_settings = workspace
+
+    @property
+    def workspace_quota_mb(self) -> float:
+        return float(self.workspace_settings.get("quota_mb", 4096))
+
+    @workspace_quota_mb.setter
+    def workspace_quota_mb(self, value: float) -> None:
+        workspace = self.workspace_settings
+        workspace["quota_mb"] = value
+        self.workspace_settings = workspace
+
     @property
     def voices_list(self) -> Dict[str, str]:
         self._settings = self._load_settings()
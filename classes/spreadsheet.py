@@ -2,6 +2,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from typing import Optional, Dict, List
 from classes.settings import Settings
+from classes.metrics import metrics
 
 class SpreadsheetUpdate:
     def __init__(self):
@@ -233,6 +234,7 @@ class SpreadsheetUpdate:
                 body=body
             ).execute()
     
+    @metrics.timed('spreadsheet_update')
     def update(self) -> Dict:
         """
         스프레드시트에 데이터 추가
@@ -295,6 +297,7 @@ class SpreadsheetUpdate:
         except Exception as e:
             raise Exception(f"Failed to update spreadsheet: {str(e)}")
     
+    @metrics.timed('spreadsheet_overwrite')
     def overwrite(self):
         """
         self.headers와 self.data를 사용해 시트 전체를 덮어씀 (대본 등 임의 구조용)
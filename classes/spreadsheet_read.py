@@ -3,6 +3,7 @@ from googleapiclient.discovery import build
 from typing import Optional, Dict, List
 from classes.settings import Settings
 from classes.spreadsheet import SpreadsheetUpdate
+from classes.metrics import metrics
 
 class SpreadsheetRead:
     def __init__(self):
@@ -84,6 +85,7 @@ class SpreadsheetRead:
         
         return sheets[0]['properties']['title']
     
+    @metrics.timed('spreadsheet_read')
     def read(self) -> List[Dict]:
         """
         스프레드시트에서 데이터를 읽어옴
@@ -0,0 +1,209 @@
+from typing import Dict, List, Optional
+from classes.settings import Settings
+
+# 자막을 끊기 좋은 문장 부호
+_BREAK_PUNCTUATION = ('.', ',', '?', '!', '…', '。', '、')
+
+class SubtitleBuilder:
+    MODES = ('segment', 'phrase', 'word')
+
+    def __init__(self, mode: Optional[str] = None, max_chars: Optional[int] = None,
+                 max_duration: Optional[float] = None):
+        """
+        Edge-TTS 단어 경계(WordBoundary) 정보로 짧은 자막 큐를 만드는 클래스
+
+        Args:
+            mode (Optional[str]): 'segment'(세그먼트 하나당 자막 하나), 'phrase'(구 단위), 'word'(단어 단위)
+            max_chars (Optional[int]): 구 단위 자막 하나의 최대 글자 수
+            max_duration (Optional[float]): 구 단위 자막 하나의 최대 길이(초)
+        """
+        self._settings = Settings()
+        self._mode: str = 'phrase'
+        self._max_chars: int = 20
+        self._max_duration: float = 3.0
+
+        self.mode = mode or self._settings.subtitle_mode
+        self.max_chars = max_chars if max_chars is not None else self._settings.subtitle_max_chars
+        self.max_duration = max_duration if max_duration is not None else self._settings.subtitle_max_duration
+
+    @property
+    def mode(self) -> str:
+        """자막 분할 방식을 반환"""
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: str) -> None:
+        """자막 분할 방식을 설정"""
+        if value not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        self._mode = value
+
+    @property
+    def max_chars(self) -> int:
+        """자막 하나의 최대 글자 수를 반환"""
+        return self._max_chars
+
+    @max_chars.setter
+    def max_chars(self, value: int) -> None:
+        """자막 하나의 최대 글자 수를 설정"""
+        if value < 1:
+            raise ValueError("max_chars must be greater than 0")
+        self._max_chars = int(value)
+
+    @property
+    def max_duration(self) -> float:
+        """자막 하나의 최대 길이(초)를 반환"""
+        return self._max_duration
+
+    @max_duration.setter
+    def max_duration(self, value: float) -> None:
+        """자막 하나의 최대 길이(초)를 설정"""
+        if value <= 0:
+            raise ValueError("max_duration must be greater than 0")
+        self._max_duration = float(value)
+
+    def _locate_words(self, text: str, boundaries: List[Dict]) -> List[Dict]:
+        """단어 경계를 원문 위치에 대응시켜 (시작, 끝, 원문 범위) 목록 생성"""
+        words = []
+        cursor = 0
+        for boundary in boundaries:
+            word = boundary['text']
+            position = text.find(word, cursor) if word else -1
+            if position < 0:
+                # 원문에서 찾지 못한 단어는 경계 텍스트 그대로 사용
+                span = None
+            else:
+                span = (position, position + len(word))
+                cursor = span[1]
+            words.append({
+                'start': boundary['offset'],
+                'end': boundary['offset'] + boundary['duration'],
+                'text': word,
+                'span': span
+            })
+        return words
+
+    def _cue_text(self, text: str, words: List[Dict], next_word: Optional[Dict]) -> str:
+        """단어 묶음에 해당하는 원문 (문장 부호 포함)"""
+        spans = [word['span'] for word in words]
+        if all(spans):
+            # 다음 단어 직전까지 포함해서 뒤따르는 문장 부호를 살림
+            end = next_word['span'][0] if next_word and next_word['span'] else len(text)
+            return text[spans[0][0]:end].strip()
+        return ' '.join(word['text'] for word in words)
+
+    def _ends_phrase(self, text: str, word: Dict, next_word: Optional[Dict]) -> bool:
+        """단어 끝이나 바로 뒤에 문장 부호가 있는지 확인"""
+        if not word['span']:
+            return word['text'].endswith(_BREAK_PUNCTUATION)
+        end = next_word['span'][0] if next_word and next_word['span'] else len(text)
+        return text[word['span'][0]:end].rstrip().endswith(_BREAK_PUNCTUATION)
+
+    def build(self, text: str, boundaries: List[Dict], start_time: float, end_time: float) -> List[Dict]:
+        """
+        세그먼트 하나의 자막 큐 생성
+
+        Args:
+            text (str): 세그먼트 원문
+            boundaries (List[Dict]): 세그먼트 기준 단어 경계 목록 (offset, duration은 초 단위)
+            start_time (float): 전체 음성에서 세그먼트 시작 시각(초)
+            end_time (float): 전체 음성에서 세그먼트 끝 시각(초)
+
+        Returns:
+            List[Dict]: start_time, end_time, text 키를 가진 자막 목록
+        """
+        if self._mode == 'segment' or not boundaries:
+            return [{'start_time': start_time, 'end_time': end_time, 'text': text}]
+
+        words = self._locate_words(text, boundaries)
+        groups: List[List[Dict]] = []
+        current: List[Dict] = []
+
+        for index, word in enumerate(words):
+            next_word = words[index + 1] if index + 1 < len(words) else None
+            if current and self._mode == 'phrase':
+                chars = len(' '.join(w['text'] for w in current + [word]))
+                duration = word['end'] - current[0]['start']
+                if chars > self._max_chars or duration > self._max_duration:
+                    groups.append(current)
+                    current = []
+            current.append(word)
+
+            if self._mode == 'word' or self._ends_phrase(text, word, next_word):
+                groups.append(current)
+                current = []
+        if current:
+            groups.append(current)
+
+        cues = []
+        for index, group in enumerate(groups):
+            next_group = groups[index + 1] if index + 1 < len(groups) else None
+            next_word = next_group[0] if next_group else None
+            cue_start = start_time if index == 0 else start_time + group[0]['start']
+            # 다음 자막이 시작될 때까지 유지해서 깜빡임을 없앰
+            cue_end = start_time + next_word['start'] if next_word else end_time
+            cues.append({
+                'start_time': cue_start,
+                'end_time': max(cue_start, min(cue_end, end_time)),
+                'text': self._cue_text(text, group, next_word)
+            })
+        return cues
+
+    def _assign_parts(self, texts: List[str], boundaries: List[Dict]) -> List[List[Dict]]:
+        """단어 경계를 순서대로 각 텍스트 조각에 나눠 담음"""
+        groups: List[List[Dict]] = [[] for _ in texts]
+        part = 0
+        cursor = 0
+        for boundary in boundaries:
+            word = boundary['text']
+            position = texts[part].find(word, cursor) if word else -1
+            if position < 0:
+                # 현재 조각에 없으면 다음 조각들에서 찾음 (끝까지 없으면 현재 조각에 둠)
+                for candidate in range(part + 1, len(texts)):
+                    position = texts[candidate].find(word) if word else -1
+                    if position >= 0:
+                        part = candidate
+                        break
+            if position >= 0:
+                cursor = position + len(word)
+            groups[part].append(boundary)
+        return groups
+
+    def build_parts(self, parts: List[Dict], boundaries: List[Dict], start_time: float, end_time: float) -> List[Dict]:
+        """
+        쉼(<break>)을 넣어 한 번에 합성한 세그먼트의 자막 큐 생성
+
+        조각별 시작 시각은 단어 경계에서 되찾으므로 쉼 구간에는 자막이 없고
+        각 조각은 따로 합성했을 때와 같은 방식으로 나뉜다.
+
+        Args:
+            parts (List[Dict]): 'text'(content) / 'pause'(duration) 항목 목록
+            boundaries (List[Dict]): 세그먼트 전체 기준 단어 경계 목록 (초 단위)
+            start_time (float): 전체 음성에서 세그먼트 시작 시각(초)
+            end_time (float): 전체 음성에서 세그먼트 끝 시각(초)
+
+        Returns:
+            List[Dict]: start_time, end_time, text 키를 가진 자막 목록
+        """
+        texts = [part['content'] for part in parts if part['type'] == 'text']
+        if not boundaries:
+            return [{'start_time': start_time, 'end_time': end_time, 'text': ' '.join(texts)}]
+
+        groups = self._assign_parts(texts, boundaries)
+        cues = []
+        part_start = 0.0
+        for index, (text, words) in enumerate(zip(texts, groups)):
+            if words and index > 0:
+                part_start = words[0]['offset']
+            if index + 1 < len(texts):
+                # 쉼 앞 조각은 마지막 단어가 끝나는 시각까지만 표시
+                part_end = words[-1]['offset'] + words[-1]['duration'] if words else part_start
+            else:
+                part_end = end_time - start_time
+            rebased = [
+                {'offset': word['offset'] - part_start, 'duration': word['duration'], 'text': word['text']}
+                for word in words
+            ]
+            cues.extend(self.build(text, rebased, start_time + part_start, start_time + max(part_start, part_end)))
+            part_start = part_end
+        return cues
@@ -0,0 +1,155 @@
+from typing import Dict, List, Tuple
+
+class SubtitleWriter:
+    def __init__(self, width: int = 1920, height: int = 1080, font: str = "Noto Sans CJK KR",
+                 font_size: int = 48, position_ratio: float = 0.75, outline: int = 2):
+        """
+        자막 목록을 자막 파일 형식(ASS, SRT, WebVTT)으로 변환하는 클래스
+
+        기본값은 moviepy 자막 클립과 같은 모양이다.
+        (흰 글자, 검은 테두리 2px, 가로 가운데, 자막 윗변이 화면 높이의 75% 지점)
+
+        Args:
+            width (int): 영상 너비 (ASS 좌표계)
+            height (int): 영상 높이 (ASS 좌표계)
+            font (str): 글꼴 이름 (fontconfig 이름)
+            font_size (int): 글자 크기(px)
+            position_ratio (float): 화면 위에서부터 자막 윗변까지의 비율
+            outline (int): 테두리 두께(px)
+        """
+        self._width = width
+        self._height = height
+        self._font = font
+        self._font_size = font_size
+        self._position_ratio = position_ratio
+        self._outline = outline
+
+    @property
+    def font(self) -> str:
+        """글꼴 이름을 반환"""
+        return self._font
+
+    @font.setter
+    def font(self, value: str) -> None:
+        """글꼴 이름을 설정"""
+        self._font = value
+
+    @staticmethod
+    def cue_times(subtitle: Dict) -> Tuple[float, float]:
+        """자막 하나의 (시작, 끝) 시간 (start/end 또는 start_time/end_time 키)"""
+        start_time = subtitle.get('start_time', subtitle.get('start', 0))
+        end_time = subtitle.get('end_time', subtitle.get('end', 0))
+        return float(start_time), float(end_time)
+
+    @staticmethod
+    def _ass_time(seconds: float) -> str:
+        """초를 ASS 시간 형식(H:MM:SS.cc)으로 변환"""
+        centiseconds = int(round(max(seconds, 0.0) * 100))
+        hours, centiseconds = divmod(centiseconds, 360000)
+        minutes, centiseconds = divmod(centiseconds, 6000)
+        secs, centiseconds = divmod(centiseconds, 100)
+        return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
+
+    @staticmethod
+    def _ass_text(text: str) -> str:
+        """ASS 대사 텍스트로 변환 (줄바꿈은 \\N, 중괄호는 태그로 해석되지 않도록 전각 문자로)"""
+        text = text.replace('\\', '＼').replace('{', '｛').replace('}', '｝')
+        return text.replace('\r\n', '\n').replace('\n', '\\N')
+
+    @staticmethod
+    def _clock_time(seconds: float, separator: str) -> str:
+        """초를 HH:MM:SS{separator}mmm 형식으로 변환 (SRT는 ',', WebVTT는 '.')"""
+        milliseconds = int(round(max(seconds, 0.0) * 1000))
+        hours, milliseconds = divmod(milliseconds, 3600000)
+        minutes, milliseconds = divmod(milliseconds, 60000)
+        secs, milliseconds = divmod(milliseconds, 1000)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
+
+    @classmethod
+    def srt_time(cls, seconds: float) -> str:
+        """초를 SRT 시간 형식(HH:MM:SS,mmm)으로 변환"""
+        return cls._clock_time(seconds, ',')
+
+    def _cues(self, subtitles: List[Dict]) -> List[Tuple[float, float, str]]:
+        """표시할 자막만 (시작, 끝, 텍스트)로 (길이가 없거나 빈 자막은 제외)"""
+        cues = []
+        for subtitle in subtitles:
+            start_time, end_time = self.cue_times(subtitle)
+            text = subtitle.get('text', '')
+            if end_time <= start_time or not text.strip():
+                continue
+            # 빈 줄은 SRT/WebVTT에서 큐의 끝을 뜻하므로 뺌
+            lines = [line for line in text.replace('\r\n', '\n').split('\n') if line.strip()]
+            cues.append((start_time, end_time, '\n'.join(lines)))
+        return cues
+
+    def to_srt(self, subtitles: List[Dict]) -> str:
+        """자막 목록을 SRT 형식 문자열로 변환 (앱의 SRT 출력은 모두 이 함수를 씀)"""
+        blocks = [
+            f"{index}\n{self.srt_time(start_time)} --> {self.srt_time(end_time)}\n{text}\n"
+            for index, (start_time, end_time, text) in enumerate(self._cues(subtitles), 1)
+        ]
+        return '\n'.join(blocks)
+
+    def to_vtt(self, subtitles: List[Dict]) -> str:
+        """
+        자막 목록을 WebVTT 형식 문자열로 변환
+
+        화면 위치는 ASS와 같게 가운데, 화면 높이의 position_ratio 지점에 둔다.
+        """
+        line = f"{int(round(self._position_ratio * 100))}%"
+        blocks = ["WEBVTT\n"]
+        for start_time, end_time, text in self._cues(subtitles):
+            # '-->'는 시간 줄로, '<', '&'는 태그/문자 참조로 해석되므로 바꿈
+            text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            blocks.append(
+                f"{self._clock_time(start_time, '.')} --> {self._clock_time(end_time, '.')} "
+                f"line:{line} align:center\n{text}\n"
+            )
+        return '\n'.join(blocks)
+
+    def to_ass(self, subtitles: List[Dict]) -> str:
+        """자막 목록을 ASS 형식 문자열로 변환"""
+        margin_top = int(self._height * self._position_ratio)
+        lines = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            f"PlayResX: {self._width}",
+            f"PlayResY: {self._height}",
+            "WrapStyle: 0",
+            "ScaledBorderAndShadow: yes",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+            "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+            "Alignment, MarginL, MarginR, MarginV, Encoding",
+            # Alignment 8: 가운데 위 기준, MarginV는 화면 위에서의 거리
+            f"Style: Default,{self._font},{self._font_size},&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000,"
+            f"-1,0,0,0,100,100,0,0,1,{self._outline},0,8,10,10,{margin_top},1",
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ]
+        for start_time, end_time, text in self._cues(subtitles):
+            lines.append(
+                f"Dialogue: 0,{self._ass_time(start_time)},{self._ass_time(end_time)},Default,,0,0,0,,{self._ass_text(text)}"
+            )
+        return '\n'.join(lines) + '\n'
+
+    def write_ass(self, subtitles: List[Dict], output_path: str) -> str:
+        """ASS 파일 저장 (UTF-8)"""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_ass(subtitles))
+        return output_path
+
+    def write_srt(self, subtitles: List[Dict], output_path: str) -> str:
+        """SRT 파일 저장 (UTF-8)"""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_srt(subtitles))
+        return output_path
+
+    def write_vtt(self, subtitles: List[Dict], output_path: str) -> str:
+        """WebVTT 파일 저장 (UTF-8)"""
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_vtt(subtitles))
+        return output_path
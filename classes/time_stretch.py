@@ -0,0 +1,122 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pydub import AudioSegment
+
+class TimeStretcher:
+    # 샘플 크기별 numpy 자료형
+    _DTYPES = {2: np.int16, 4: np.int32}
+
+    def __init__(self, frame_ms: float = 20.0, tolerance_ms: float = 8.0):
+        """
+        음높이를 유지하면서 재생 속도를 바꾸는 WSOLA 방식 시간 신축 클래스
+
+        `frame_rate`를 바꿔서 속도를 조절하면 음높이도 함께 바뀐다.
+        WSOLA는 입력에서 일정 간격으로 프레임을 가져오되, 직전 프레임과
+        파형이 가장 잘 이어지는 위치를 허용 범위 안에서 찾아 겹쳐 더하므로
+        샘플레이트와 음높이는 그대로이고 길이만 바뀐다.
+
+        Args:
+            frame_ms (float): 분석 프레임 길이(ms)
+            tolerance_ms (float): 프레임 위치를 조정할 수 있는 최대 범위(ms)
+        """
+        if frame_ms <= 0:
+            raise ValueError("frame_ms must be greater than 0")
+        if tolerance_ms < 0:
+            raise ValueError("tolerance_ms must be 0 or greater")
+        self._frame_ms = frame_ms
+        self._tolerance_ms = tolerance_ms
+
+    @property
+    def frame_ms(self) -> float:
+        """분석 프레임 길이(ms)를 반환"""
+        return self._frame_ms
+
+    @property
+    def tolerance_ms(self) -> float:
+        """프레임 위치 조정 범위(ms)를 반환"""
+        return self._tolerance_ms
+
+    def stretch(self, samples: np.ndarray, sample_rate: int, speed: float) -> np.ndarray:
+        """
+        샘플 배열의 재생 속도를 변경
+
+        Args:
+            samples (np.ndarray): (샘플 수,) 또는 (샘플 수, 채널 수) 형태의 float 배열
+            sample_rate (int): 샘플레이트
+            speed (float): 속도 배수 (1.5면 1.5배 빠르게, 길이는 1/1.5)
+
+        Returns:
+            np.ndarray: 입력과 같은 형태(채널 수)의 float32 배열
+        """
+        if speed <= 0:
+            raise ValueError("speed must be greater than 0")
+
+        mono = samples.ndim == 1
+        x = samples.reshape(-1, 1) if mono else samples
+        x = x.astype(np.float32, copy=False)
+        length = x.shape[0]
+        if speed == 1.0 or length == 0:
+            return x[:, 0].copy() if mono else x.copy()
+
+        frame = max(2, int(sample_rate * self._frame_ms / 1000) // 2 * 2)
+        synthesis_hop = frame // 2
+        analysis_hop = synthesis_hop * speed
+        tolerance = int(sample_rate * self._tolerance_ms / 1000)
+
+        output_length = int(round(length / speed))
+        frame_count = output_length // synthesis_hop + 2
+
+        # 검색 범위와 마지막 프레임이 배열 밖으로 나가지 않도록 앞뒤를 무음으로 채움
+        pad_end = int(analysis_hop) + 2 * frame + 2 * tolerance
+        padded = np.pad(x, ((tolerance, pad_end), (0, 0)))
+        # 위치 탐색은 채널 평균 신호로 한 번만 수행
+        guide = padded.mean(axis=1)
+
+        window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame) / frame)).astype(np.float32)
+        output = np.zeros((frame_count * synthesis_hop + frame, x.shape[1]), dtype=np.float32)
+        weights = np.zeros(output.shape[0], dtype=np.float32)
+
+        previous = 0
+        for index in range(frame_count):
+            # padded 기준 위치 (앞쪽 패딩만큼 밀려 있음)
+            ideal = int(round(index * analysis_hop)) + tolerance
+            position = ideal
+            if index > 0 and tolerance > 0:
+                # 직전 프레임이 자연스럽게 이어졌을 구간과 가장 닮은 위치 선택
+                template = guide[previous + synthesis_hop:previous + synthesis_hop + frame]
+                candidates = sliding_window_view(guide[ideal - tolerance:ideal + tolerance + frame], frame)
+                position = ideal - tolerance + int(np.argmax(candidates @ template))
+
+            start = index * synthesis_hop
+            output[start:start + frame] += padded[position:position + frame] * window[:, None]
+            weights[start:start + frame] += window
+            previous = position
+
+        output = output[:output_length]
+        weights = weights[:output_length]
+        output /= np.maximum(weights, 1e-3)[:, None]
+        return output[:, 0] if mono else output
+
+    def stretch_segment(self, segment: AudioSegment, speed: float) -> AudioSegment:
+        """
+        AudioSegment의 재생 속도를 변경 (샘플레이트, 채널, 샘플 크기 유지)
+
+        Args:
+            segment (AudioSegment): 원본 세그먼트
+            speed (float): 속도 배수
+
+        Returns:
+            AudioSegment: 속도가 바뀐 세그먼트
+        """
+        if speed == 1.0:
+            return segment
+        if segment.sample_width not in self._DTYPES:
+            segment = segment.set_sample_width(2)
+
+        dtype = self._DTYPES[segment.sample_width]
+        samples = np.frombuffer(segment.raw_data, dtype=dtype).reshape(-1, segment.channels)
+        stretched = self.stretch(samples, segment.frame_rate, speed)
+
+        limits = np.iinfo(dtype)
+        data = np.clip(np.rint(stretched), limits.min, limits.max).astype(dtype)
+        return segment._spawn(data.tobytes())
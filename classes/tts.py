@@ -1,16 +1,66 @@
 import edge_tts
 import asyncio
 import re
+import io
 import os
+import wave
 import time
-import tempfile
+import uuid
 import logging
-from typing import List, Dict, Tuple, Optional
+import functools
+from typing import List, Dict, Tuple, Optional, AsyncIterator
 from pydub import AudioSegment
 from .settings import Settings
+from .tts_cache import TTSCache
+from .mp3_frames import MP3Frames
+from .audio_assembler import AudioAssembler
+from .subtitle_builder import SubtitleBuilder
+from .subtitle_writer import SubtitleWriter
+from .script_parser import ScriptParser, Script, Pause
+from .time_stretch import TimeStretcher
+from .duration_estimator import DurationEstimator
+from .resilience import ResilientCaller
+from .metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# 병합 요청에서 쉼 자리를 표시하는 문자 (edge-tts가 텍스트를 이스케이프한 뒤 <break>로 바꿈)
+_BREAK_OPEN = '\ue000'
+_BREAK_CLOSE = '\ue001'
+_BREAK_MARKER = re.compile(_BREAK_OPEN.encode('utf-8') + rb'(\d+)' + _BREAK_CLOSE.encode('utf-8'))
+# 이보다 긴 쉼은 병합하지 않고 무음으로 넣음 (SSML break 최대 길이)
+_MAX_BREAK_SECONDS = 5.0
+# <break> 삽입은 edge-tts 내부 구현(Communicate.texts: 이스케이프 후 분할된 요청 텍스트)에 의존하므로
+# 확인한 메이저 버전에서만 사용
+_BREAKS_EDGE_TTS_MAJOR_VERSIONS = (6, 7)
+# 전체 파일 조립 시 한 번에 디코딩할 새 세그먼트 분량(초)
+# (클수록 ffmpeg 실행이 줄고, 작을수록 디코딩 중 메모리가 줄어든다)
+_DECODE_BATCH_SECONDS = 60.0
+
+@functools.lru_cache(maxsize=1)
+def _breaks_supported() -> bool:
+    """
+    설치된 edge-tts에서 <break>를 넣을 수 있는지 확인 (프로세스에서 한 번만)
+
+    버전이 확인한 범위 안이고, 요청 텍스트(texts)를 노출하며, 쉼 표시 문자가
+    이스케이프/분할 후에도 그대로 남는 경우에만 True.
+    """
+    try:
+        from edge_tts.version import __version__ as version
+        major = int(version.split('.')[0])
+        if major not in _BREAKS_EDGE_TTS_MAJOR_VERSIONS:
+            logger.warning("edge-tts %s에서는 SSML 쉼 병합을 사용하지 않습니다", version)
+            return False
+        marker = f"{_BREAK_OPEN}100{_BREAK_CLOSE}"
+        texts = getattr(edge_tts.Communicate(f"확인 {marker} 확인", "ko-KR-SunHiNeural"), 'texts', None)
+        if texts is None:
+            return False
+        joined = b''.join(chunk.encode('utf-8') if isinstance(chunk, str) else chunk for chunk in texts)
+        return _BREAK_MARKER.search(joined) is not None
+    except Exception as e:
+        logger.warning("edge-tts SSML 쉼 병합 확인 실패: %s", e)
+        return False
+
 class TextToSpeech:
     def __init__(self, output_dir: str = "outputs"):
         """텍스트를 음성으로 변환하는 클래스"""
@@ -19,6 +69,17 @@ class TextToSpeech:
         self.voices = self.settings.voices_list  # settings.json의 voices_list
         self.voice = self.voices.get("여자1", "ko-KR-SunHiNeural")  # 기본 목소리
         self.speed = "+0%"  # 기본 속도 (백분율 형태)
+        self.output_format = "mp3"  # 최종 음성 형식 (mp3, wav: 무손실, m4a: AAC)
+        self.max_concurrency = self.settings.tts_max_concurrency  # 동시에 합성할 세그먼트 수
+        self.cache = TTSCache() if self.settings.tts_cache_enabled else None  # 세그먼트 캐시
+        self._io_stats = self._new_io_stats()
+        self.subtitle_builder = SubtitleBuilder()  # 단어 경계 기반 자막 분할
+        self.parser = ScriptParser()  # 대본 명령어 파서
+        self.time_stretcher = TimeStretcher()  # 음높이를 유지하는 속도 조절
+        self.duration_estimator = DurationEstimator.shared()  # 합성 결과로 보정되는 길이 예측 (프로세스 공용)
+        self.resilience = ResilientCaller('edge-tts')  # 시간 제한, 재시도, 헤징, 서킷 브레이커
+        # 같은 줄의 텍스트를 쉼(<break>)과 함께 한 번에 합성 (edge-tts 내부 구현에 의존하므로 설정으로 켤 때만)
+        self.ssml_batching = self.settings.tts_ssml_batching and _breaks_supported()
         
         # 출력 디렉토리 생성
         os.makedirs(self.output_dir, exist_ok=True)
@@ -39,6 +100,47 @@ class TextToSpeech:
         """속도 설정 (예: "0.5", "1.0", "1.5", "2.0")"""
         self.speed = speed
     
+    def set_output_format(self, output_format: str):
+        """
+        최종 음성 파일 형식 설정
+        
+        다음 단계에서 다시 디코딩/인코딩하지 않도록 무손실 PCM('wav')이나
+        최종 영상의 음성 코덱('m4a', AAC)으로 바로 받을 수 있다.
+        """
+        if output_format not in AudioAssembler.FORMATS:
+            raise ValueError(f"output_format must be one of {tuple(AudioAssembler.FORMATS)}")
+        self.output_format = output_format
+    
+    @staticmethod
+    def _new_io_stats() -> Dict:
+        """작업당 네트워크/디코딩/디스크 사용량 카운터"""
+        return {
+            'segments': 0,
+            'network_requests': 0,
+            'network_bytes': 0,
+            'decode_calls': 0,
+            'disk_bytes_read': 0,
+            'disk_bytes_written': 0
+        }
+    
+    @property
+    def io_stats(self) -> Dict:
+        """마지막 변환 작업의 I/O 통계를 반환 (세그먼트당 디스크 I/O 포함)"""
+        stats = dict(self._io_stats)
+        segments = stats['segments'] or 1
+        stats['disk_bytes_per_segment'] = (stats['disk_bytes_read'] + stats['disk_bytes_written']) / segments
+        return stats
+    
+    def set_concurrency(self, max_concurrency: int):
+        """동시에 합성할 세그먼트 수 설정 (1이면 순차 합성)"""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+        self.max_concurrency = max_concurrency
+    
+    def set_subtitle_mode(self, mode: str):
+        """자막 분할 방식 설정 ('segment', 'phrase', 'word')"""
+        self.subtitle_builder.mode = mode
+    
     def _convert_speed_to_rate(self, speed: str) -> str:
         """속도를 Edge-TTS rate 형식으로 변환 (부호 있는 백분율 입력)"""
         print(f"🎵 속도 변환 시작: '{speed}' (타입: {type(speed)})")
@@ -118,68 +220,643 @@ class TextToSpeech:
             except:
                 return 1.0
     
-    def _extract_voice_speed_options(self, text: str) -> Tuple[str, Optional[str], Optional[str]]:
-        """텍스트에서 목소리와 속도 옵션을 추출하고 정리된 텍스트 반환"""
-        voice = None
-        speed = None
-        clean_text = text
-        
-        print(f"🔍 옵션 추출 시작: '{text}'")
-        
-        # 목소리 옵션 패턴
-        voice_pattern = r'\[(목소리|VOICE):([^\]]+)\]'
-        voice_match = re.search(voice_pattern, text)
-        if voice_match:
-            voice = voice_match.group(2)
-            clean_text = re.sub(voice_pattern, '', clean_text)
-            print(f"🎤 목소리 옵션 발견: {voice}")
-        
-        # 속도 옵션 패턴
-        speed_pattern = r'\[(속도|SPEED):([^\]]+)\]'
-        speed_match = re.search(speed_pattern, text)
-        if speed_match:
-            speed = speed_match.group(2)
-            clean_text = re.sub(speed_pattern, '', clean_text)
-            print(f"🎵 속도 옵션 발견: {speed}")
-        
-        # 기타 옵션 제거 (GIPHY, GOOGLE 등)
-        other_pattern = r'\[(GIPHY|GOOGLE|GIPHY_URL|GOOGLE_URL|검색어):([^\]]+)\]'
-        clean_text = re.sub(other_pattern, '', clean_text)
-        
-        print(f"🔍 추출 결과 - 음성: {voice}, 속도: {speed}, 정리된 텍스트: '{clean_text.strip()}'")
-        return clean_text.strip(), voice, speed
-    
-    def _process_line_with_pauses(self, line: str) -> List[Dict]:
-        """한 줄의 텍스트를 쉼 명령어 기준으로 분리하여 처리"""
-        # 쉼 명령어 패턴
-        pause_pattern = r'\[쉼:([^\]]+)\]'
-        
-        segments = []
-        current_pos = 0
-        
-        for match in re.finditer(pause_pattern, line):
-            # 쉼 명령어 앞의 텍스트
-            before_text = line[current_pos:match.start()].strip()
-            if before_text:
-                segments.append({'type': 'text', 'content': before_text})
+    def _residual_multiplier(self, speed: str, rate: str) -> float:
+        """
+        요청한 속도 배수 중 Edge-TTS rate로 이미 적용된 부분을 뺀 나머지 배수
+        
+        rate는 -50% ~ +100%로 제한되므로 그 범위를 넘는 속도만 시간 신축으로 처리한다.
+        """
+        # 레거시 숫자('0', '-1' 등)도 백분율과 같은 0.1~3.0배로 제한 (0이나 음수 배수가 되지 않도록)
+        target = max(0.1, min(3.0, self._convert_percentage_to_multiplier(speed)))
+        applied = self._convert_percentage_to_multiplier(rate)
+        residual = target / applied
+        # 반올림 오차 수준의 차이는 무시해서 불필요한 신축을 피함
+        return 1.0 if abs(residual - 1.0) < 0.01 else round(residual, 4)
+    
+    def _merge_run(self, run: List[Dict]) -> List[Dict]:
+        """쉼으로 나뉜 텍스트들을 하나의 병합 항목으로 묶음 (앞뒤 쉼은 그대로 무음으로 둠)"""
+        text_positions = [index for index, item in enumerate(run) if item['type'] == 'text']
+        if len(text_positions) < 2:
+            return run
+        
+        first, last = text_positions[0], text_positions[-1]
+        parts = run[first:last + 1]
+        head = parts[0]
+        merged = {
+            'type': 'text',
+            'content': ' '.join(part['content'] for part in parts if part['type'] == 'text'),
+            'voice': head['voice'],
+            'rate': head['rate'],
+            'speed_multiplier': head['speed_multiplier'],
+            'line': head.get('line'),
+            'parts': parts
+        }
+        return run[:first] + [merged] + run[last + 1:]
+    
+    def _merge_line(self, items: List[Dict]) -> List[Dict]:
+        """
+        한 줄의 텍스트와 쉼을 SSML 요청 하나로 병합
+        
+        한 줄은 목소리와 속도가 같으므로 쉼으로 나뉜 텍스트들을 <break>로 이어서
+        한 번에 합성한다. 시간 신축이 필요한 줄은 쉼 길이까지 바뀌므로 병합하지 않는다.
+        """
+        if len(items) < 3 or items[0].get('speed_multiplier', 1.0) != 1.0:
+            return items
+        
+        merged = []
+        run = []
+        for item in items:
+            if item['type'] == 'pause' and item['duration'] > _MAX_BREAK_SECONDS:
+                merged.extend(self._merge_run(run))
+                merged.append(item)
+                run = []
+            else:
+                run.append(item)
+        merged.extend(self._merge_run(run))
+        return merged
+    
+    def _request_text(self, item: Dict) -> str:
+        """Edge-TTS에 보낼 텍스트 (병합 항목은 쉼 자리에 표시 문자를 넣음)"""
+        if 'parts' not in item:
+            return item['content']
+        
+        pieces = []
+        for part in item['parts']:
+            if part['type'] == 'pause':
+                pieces.append(f"{_BREAK_OPEN}{int(round(part['duration'] * 1000))}{_BREAK_CLOSE}")
+            else:
+                pieces.append(part['content'].replace(_BREAK_OPEN, '').replace(_BREAK_CLOSE, ''))
+        return ' '.join(pieces)
+    
+    @staticmethod
+    def _insert_breaks(communicate: edge_tts.Communicate) -> None:
+        """이스케이프가 끝난 요청 텍스트의 쉼 표시 문자를 SSML <break>로 바꿈"""
+        def replace(chunks):
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                yield _BREAK_MARKER.sub(rb"<break time='\1ms'/>", chunk)
+        communicate.texts = replace(communicate.texts)
+    
+    def _build_plan(self, script: Script) -> List[Dict]:
+        """
+        파싱된 대본을 합성 계획으로 변환
+        
+        줄 단위 목소리/속도 범위를 적용해서 대본 순서대로
+        'pause' / 'text' 항목 목록을 만든다.
+        """
+        plan = []
+        default_rate = self._convert_speed_to_rate(self.speed)
+        
+        for line in script.lines:
+            # 이 줄에서 사용할 목소리와 속도 설정 (줄 전체에 적용)
+            current_voice = self.voice  # 기본값으로 시작
+            current_rate = default_rate  # 기본값으로 시작
             
-            # 쉼 명령어
-            try:
-                pause_duration = float(match.group(1))
-                segments.append({'type': 'pause', 'duration': pause_duration})
-            except ValueError:
-                pass
+            if line.voice:
+                if line.voice in self.voices:
+                    current_voice = self.voices[line.voice]
+                else:
+                    current_voice = line.voice  # 직접 지정된 음성
+            
+            # 시간 신축 배수 (Edge-TTS rate 범위를 벗어난 나머지만 보정)
+            speed_multiplier = 1.0
+            if line.speed:
+                current_rate = self._convert_speed_to_rate(line.speed)
+                print(f"🎵 줄별 속도 설정: {line.speed} -> {current_rate}")
+                if line.speed not in ["1.0", "+0%"]:
+                    speed_multiplier = self._residual_multiplier(line.speed, current_rate)
+            
+            print(f"🎤 현재 음성: {current_voice}, 속도: {current_rate}")
             
-            current_pos = match.end()
+            line_items = []
+            for item in line.items:
+                if isinstance(item, Pause):
+                    line_items.append({'type': 'pause', 'duration': item.duration, 'line': line.index})
+                    continue
+                
+                line_items.append({
+                    'type': 'text',
+                    'content': item.text,
+                    'voice': current_voice,
+                    'rate': current_rate,
+                    'speed_multiplier': speed_multiplier,
+                    'line': line.index  # 대본 줄 번호 (자막에 남겨서 영상 구간을 대본 줄에 맞춤)
+                })
+            
+            plan.extend(self._merge_line(line_items) if self.ssml_batching else line_items)
+        
+        return plan
+    
+    def _create_communicate(self, text: str, voice: str, rate: str) -> edge_tts.Communicate:
+        """Edge-TTS 통신 객체 생성 (단어 경계 이벤트를 함께 요청)"""
+        try:
+            return edge_tts.Communicate(text=text, voice=voice, rate=rate, boundary="WordBoundary")
+        except TypeError:
+            # boundary 인자가 없는 예전 버전은 기본으로 WordBoundary를 보낸다
+            return edge_tts.Communicate(text=text, voice=voice, rate=rate)
+    
+    async def _request_segment(self, item: Dict, text: str) -> Tuple[bytes, List[Dict]]:
+        """
+        Edge-TTS 요청 한 번 (재시도/헤징 시 여러 번 호출될 수 있음)
+        
+        Returns:
+            Tuple[bytes, List[Dict]]: MP3 바이트, 세그먼트 기준 단어 경계(초 단위)
+        """
+        self._io_stats['network_requests'] += 1
+        metrics.inc('tts_network_requests_total')
         
-        # 마지막 남은 텍스트
-        remaining_text = line[current_pos:].strip()
-        if remaining_text:
-            segments.append({'type': 'text', 'content': remaining_text})
+        # Edge-TTS에서 속도 설정 방법 개선 (rate는 생성자에서 직접 설정)
+        tts_communicate = self._create_communicate(text, item['voice'], item['rate'])
+        if 'parts' in item:
+            self._insert_breaks(tts_communicate)
         
-        return segments
+        # 임시 파일 없이 스트림을 메모리 버퍼로 바로 수신
+        # 단어 경계의 offset/duration은 100ns 단위이므로 초로 변환
+        buffer = io.BytesIO()
+        boundaries = []
+        with metrics.span('tts_network'):
+            async for chunk in tts_communicate.stream():
+                if chunk['type'] == 'audio':
+                    buffer.write(chunk['data'])
+                elif chunk['type'] == 'WordBoundary':
+                    boundaries.append({
+                        'offset': chunk['offset'] / 10_000_000,
+                        'duration': chunk['duration'] / 10_000_000,
+                        'text': chunk['text']
+                    })
+        metrics.inc('tts_network_bytes_total', buffer.tell())
+        return buffer.getvalue(), boundaries
     
-    async def convert(self, text: str) -> Dict:
+    async def _fetch_segment(self, item: Dict, semaphore: asyncio.Semaphore) -> Dict:
+        """
+        텍스트 항목 하나를 Edge-TTS로 합성 (동시 실행 개수는 semaphore로 제한)
+        
+        Returns:
+            dict: 캐시 적중이면 'audio'(AudioSegment), 아니면 'mp3'(메모리에 받은 MP3 바이트)
+                  'boundaries'에는 세그먼트 기준 단어 경계(초 단위)가 담긴다
+        """
+        clean_text = self._request_text(item)
+        current_voice = item['voice']
+        current_rate = item['rate']
+        
+        # 캐시 적중 시 네트워크 요청과 디코딩 모두 생략
+        cache_key = TTSCache.make_key(clean_text, current_voice, current_rate, item['speed_multiplier'])
+        if self.cache:
+            cached_segment = self.cache.get(cache_key)
+            metrics.inc('tts_cache_requests_total', result='hit' if cached_segment is not None else 'miss')
+            if cached_segment is not None:
+                print(f"🎵 캐시 적중: '{clean_text}'")
+                self._io_stats['disk_bytes_read'] += len(cached_segment.raw_data)
+                boundaries = self.cache.get_meta(cache_key).get('boundaries', [])
+                return {'audio': cached_segment, 'boundaries': boundaries, 'cache_key': cache_key}
+        
+        async with semaphore:
+            # Edge-TTS로 음성 생성
+            print(f"🎵 TTS 생성 전 - 텍스트: '{clean_text}', 음성: {current_voice}, 속도: {current_rate}")
+            start_time = time.time()
+            
+            # 느리거나 실패한 요청 하나가 작업 전체를 멈추지 않도록 재시도/헤징 적용
+            # (헤징 기준 지연 시간은 예상 음성 길이에 비례)
+            mp3_data, boundaries = await self.resilience.call(
+                lambda: self._request_segment(item, clean_text),
+                size=max(self._predict_duration(item), 1.0)
+            )
+            
+            generation_time = time.time() - start_time
+            print(f"🎵 음성 생성 완료: {generation_time:.2f}초 소요, {len(mp3_data)} bytes")
+        
+        self._io_stats['network_bytes'] += len(mp3_data)
+        return {'mp3': mp3_data, 'boundaries': boundaries, 'cache_key': cache_key}
+    
+    async def _run_ffmpeg_decode(self, mp3_data: bytes, sample_rate: Optional[int], channels: Optional[int]) -> AudioSegment:
+        """MP3 바이트를 ffmpeg 파이프로 16bit PCM 디코딩 (디스크를 거치지 않음)"""
+        sample_rate = sample_rate or 24000  # Edge-TTS 기본 출력 형식
+        channels = channels or 1
+        command = [
+            AudioSegment.converter, '-v', 'error',
+            '-f', 'mp3', '-i', 'pipe:0',
+            '-ar', str(sample_rate), '-ac', str(channels),
+            '-f', 's16le', '-acodec', 'pcm_s16le', 'pipe:1'
+        ]
+        
+        with metrics.span('tts_decode'):
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            pcm_data, error = await process.communicate(mp3_data)
+        if process.returncode != 0:
+            raise Exception(f"MP3 디코딩 실패: {error.decode('utf-8', errors='ignore')}")
+        
+        self._io_stats['decode_calls'] += 1
+        return AudioSegment(data=pcm_data, sample_width=2, frame_rate=sample_rate, channels=channels)
+    
+    async def _decode_batch(self, mp3_blobs: List[bytes]) -> List[AudioSegment]:
+        """
+        여러 세그먼트의 MP3를 이어붙여 한 번에 디코딩한 뒤 세그먼트별로 잘라 반환
+        
+        MP3 프레임 헤더로 각 세그먼트의 샘플 수를 미리 계산하므로 디코딩은
+        형식(샘플레이트/채널)이 같은 세그먼트끼리 한 번만 실행된다.
+        프레임을 해석할 수 없는 세그먼트만 따로 디코딩한다.
+        
+        디코딩 결과는 디코더 지연(529샘플)만큼 밀려 있으므로 그만큼 뒤에서부터 자른다.
+        그대로 자르면 앞 세그먼트의 마지막 529샘플이 다음 세그먼트 앞에 섞이고 마지막 세그먼트 끝은 잘린다.
+        Edge-TTS 스트림에는 LAME/Xing 태그(인코더 지연/패딩)가 없으므로 세그먼트 길이는 프레임 수 그대로 둔다.
+        """
+        decoded: List[Optional[AudioSegment]] = [None] * len(mp3_blobs)
+        groups: Dict[Tuple[int, int], List[Tuple[int, MP3Frames]]] = {}
+        
+        for index, blob in enumerate(mp3_blobs):
+            frames = MP3Frames(blob)
+            if frames.valid:
+                groups.setdefault((frames.sample_rate, frames.channels), []).append((index, frames))
+            else:
+                decoded[index] = await self._run_ffmpeg_decode(blob, None, None)
+        
+        for (sample_rate, channels), members in groups.items():
+            joined = b''.join(frames.audio_data for _, frames in members)
+            audio = await self._run_ffmpeg_decode(joined, sample_rate, channels)
+            bytes_per_sample = 2 * channels
+            pcm_data = audio.raw_data[MP3Frames.DECODER_DELAY * bytes_per_sample:]
+            
+            position = 0
+            for index, frames in members:
+                # 프레임 수로 계산한 길이만큼 정확히 잘라서 스트리밍 응답의 길이와 맞춤
+                # (마지막 세그먼트는 디코더 지연만큼 모자라므로 무음으로 채움)
+                expected = frames.sample_count * bytes_per_sample
+                chunk = pcm_data[position:position + expected]
+                position += expected
+                if len(chunk) < expected:
+                    chunk += b'\x00' * (expected - len(chunk))
+                decoded[index] = audio._spawn(chunk)
+        
+        return decoded
+    
+    async def _apply_speed(self, audio_segment: AudioSegment, speed_multiplier: float) -> AudioSegment:
+        """
+        Edge-TTS rate로 처리하지 못한 나머지 속도를 음높이를 유지한 채 적용
+        
+        시간 신축은 프레임마다 도는 계산이라 긴 세그먼트에서는 오래 걸리므로
+        스레드에서 실행해서 웹 서버의 이벤트 루프(다른 요청, 스트리밍 응답)를 막지 않는다.
+        """
+        if speed_multiplier == 1.0:
+            return audio_segment
+        
+        # 샘플레이트와 음높이는 그대로 두고 길이만 바꿈
+        print(f"🎵 시간 신축으로 속도 조절: {speed_multiplier:.3f}배")
+        with metrics.span('tts_time_stretch'):
+            return await asyncio.to_thread(self.time_stretcher.stretch_segment, audio_segment, speed_multiplier)
+    
+    def _effective_speed(self, item: Dict) -> float:
+        """Edge-TTS rate와 시간 신축을 합친 실제 속도 배수"""
+        return self._convert_percentage_to_multiplier(item['rate']) * item['speed_multiplier']
+    
+    def _observe_duration(self, item: Dict, audio_segment: AudioSegment) -> None:
+        """새로 합성한 세그먼트 길이로 길이 예측 모델 보정 (병합 항목은 쉼 길이를 뺌)"""
+        parts = item.get('parts', [item])
+        pause_duration = sum(part['duration'] for part in parts if part['type'] == 'pause')
+        text = ' '.join(part['content'] for part in parts if part['type'] == 'text')
+        duration = len(audio_segment) / 1000.0 - pause_duration
+        self.duration_estimator.observe(text, item['voice'], self._effective_speed(item), duration)
+    
+    def _predict_duration(self, item: Dict) -> float:
+        """텍스트 항목 하나의 예상 길이(초, 병합 항목은 쉼 포함)"""
+        parts = item.get('parts', [item])
+        duration = 0.0
+        for part in parts:
+            if part['type'] == 'pause':
+                duration += part['duration']
+            else:
+                duration += self.duration_estimator.predict(part['content'], item['voice'], self._effective_speed(item))
+        return duration
+    
+    async def _finalize_segment(self, item: Dict, fetched: Dict, audio_segment: AudioSegment) -> None:
+        """디코딩된 세그먼트에 속도 조절을 적용하고 단어 경계를 맞춘 뒤 캐시에 저장"""
+        speed_multiplier = item['speed_multiplier']
+        audio_segment = await self._apply_speed(audio_segment, speed_multiplier)
+        self._observe_duration(item, audio_segment)
+        # 속도를 바꾼 만큼 단어 경계 시각도 맞춤
+        boundaries = [
+            {
+                'offset': boundary['offset'] / speed_multiplier,
+                'duration': boundary['duration'] / speed_multiplier,
+                'text': boundary['text']
+            }
+            for boundary in fetched['boundaries']
+        ]
+        if self.cache:
+            self.cache.put(fetched['cache_key'], audio_segment, {'boundaries': boundaries})
+            self._io_stats['disk_bytes_written'] += len(audio_segment.raw_data)
+        fetched['audio'] = audio_segment
+        fetched['boundaries'] = boundaries
+    
+    def _start_fetches(self, items: List[Dict], longest_first: bool = False) -> List[asyncio.Task]:
+        """
+        텍스트 항목들의 합성을 동시에 시작 (동시 요청 수는 max_concurrency로 제한)
+        
+        longest_first이면 예상 길이가 긴 세그먼트부터 요청해서 마지막에 긴 요청
+        하나만 남는 일을 줄인다. 반환되는 작업 목록은 항상 입력 순서를 따른다.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._io_stats['segments'] += len(items)
+        order = list(range(len(items)))
+        if longest_first:
+            order.sort(key=lambda index: -self._predict_duration(items[index]))
+        
+        tasks: List[Optional[asyncio.Task]] = [None] * len(items)
+        for index in order:
+            tasks[index] = asyncio.create_task(self._fetch_segment(items[index], semaphore))
+        return tasks
+    
+    async def _cancel_tasks(self, tasks: List[asyncio.Task]) -> None:
+        """남은 합성 작업을 취소하고 종료될 때까지 대기"""
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    def _mp3_seconds(mp3_data: bytes) -> float:
+        """프레임 헤더로 계산한 MP3 길이(초, 해석할 수 없으면 0)"""
+        frames = MP3Frames(mp3_data)
+        return frames.sample_count / frames.sample_rate if frames.valid else 0.0
+    
+    async def _finalize_batch(self, items: List[Dict], batch: List[Tuple[int, Dict]]) -> None:
+        """묶음에서 아직 디코딩되지 않은 세그먼트를 한 번에 디코딩하고 마무리"""
+        misses = [(index, fetched) for index, fetched in batch if 'audio' not in fetched]
+        if not misses:
+            return
+        decoded = await self._decode_batch([fetched['mp3'] for _, fetched in misses])
+        for (index, fetched), audio_segment in zip(misses, decoded):
+            await self._finalize_segment(items[index], fetched, audio_segment)
+    
+    @staticmethod
+    def _watch_failure(tasks: List[asyncio.Task]) -> asyncio.Future:
+        """작업 중 하나가 처음 실패하면 그 예외로 끝나는 Future"""
+        failure = asyncio.get_running_loop().create_future()
+        
+        def on_done(task: asyncio.Task) -> None:
+            if not failure.done() and not task.cancelled() and task.exception() is not None:
+                failure.set_exception(task.exception())
+        
+        for task in tasks:
+            task.add_done_callback(on_done)
+        return failure
+    
+    @staticmethod
+    async def _result_or_failure(task: asyncio.Task, failure: asyncio.Future) -> Dict:
+        """작업 결과를 기다리되 다른 작업이 먼저 실패하면 그 예외를 바로 발생시킴"""
+        await asyncio.wait([task, failure], return_when=asyncio.FIRST_COMPLETED)
+        if failure.done():
+            failure.result()
+        return task.result()
+    
+    @staticmethod
+    def _release_failure(failure: asyncio.Future) -> None:
+        """실패 감시 종료 (이미 다른 경로로 전달된 예외는 확인한 것으로 표시)"""
+        if failure.done():
+            failure.exception()
+        else:
+            failure.cancel()
+    
+    async def _finalize_in_order(self, items: List[Dict], tasks: List[asyncio.Task]) -> AsyncIterator[Dict]:
+        """
+        합성 작업을 입력 순서대로 기다리며 결과('audio', 'boundaries')를 하나씩 내보냄
+        
+        디코딩은 앞에서부터 이어지는 새 세그먼트를 _DECODE_BATCH_SECONDS 분량씩 묶어서 실행하고,
+        내보낸 세그먼트의 PCM은 바로 해제한다. 대본 전체를 한 번에 디코딩하면 ffmpeg 실행은
+        한 번이지만 메모리가 대본 길이에 비례해서 늘어나므로, 묶음 크기로 ffmpeg 실행 횟수와
+        최대 메모리 사용량을 맞바꾼다 (묶음이 작을수록 실행은 늘고 메모리는 줄어든다).
+        
+        순서대로 기다리는 동안 뒤의 작업이 먼저 실패하면 앞의 작업을 기다리지 않고 바로 예외를 발생시킨다.
+        """
+        batch: List[Tuple[int, Dict]] = []
+        batch_seconds = 0.0
+        failure = self._watch_failure(tasks)
+        
+        try:
+            for index, task in enumerate(tasks):
+                fetched = await self._result_or_failure(task, failure)
+                batch.append((index, fetched))
+                if 'audio' not in fetched:
+                    batch_seconds += self._mp3_seconds(fetched['mp3'])
+                    if batch_seconds < _DECODE_BATCH_SECONDS and index + 1 < len(tasks):
+                        continue
+                
+                await self._finalize_batch(items, batch)
+                for _, result in batch:
+                    yield {'audio': result['audio'], 'boundaries': result['boundaries']}
+                    # 작업 결과가 계속 참조를 들고 있으므로 쓰고 난 세그먼트는 비워서 해제
+                    result.clear()
+                batch = []
+                batch_seconds = 0.0
+        finally:
+            self._release_failure(failure)
+    
+    async def _synthesize_all(self, items: List[Dict]) -> AsyncIterator[Dict]:
+        """
+        텍스트 항목들을 동시에 합성하고 입력 순서대로 결과('audio', 'boundaries')를 내보냄
+        
+        동시에 진행되는 Edge-TTS 요청 수는 max_concurrency로 제한된다.
+        하나라도 실패하면 남은 작업을 취소하고 예외를 다시 발생시킨다.
+        새로 합성된 세그먼트는 순서대로 묶어서 디코딩하므로 메모리에는 디코딩 묶음 하나만 남는다.
+        """
+        tasks = self._start_fetches(items, longest_first=True)
+        
+        try:
+            async for segment in self._finalize_in_order(items, tasks):
+                yield segment
+        finally:
+            await self._cancel_tasks(tasks)
+    
+    async def _assemble(self, plan: List[Dict], synthesized: AsyncIterator[Dict]) -> Tuple[str, List[Dict], float]:
+        """
+        대본 순서대로 세그먼트와 무음을 인코더에 바로 써서 최종 파일 저장
+        (버퍼를 반복해서 복사하지 않으므로 길이에 비례하는 시간만 든다)
+        
+        synthesized는 텍스트 항목 순서대로 세그먼트를 내보내는 비동기 이터레이터로,
+        준비되는 대로 받아서 쓰므로 전체 세그먼트를 메모리에 모아 두지 않는다.
+        
+        Returns:
+            Tuple[str, List[Dict], float]: 출력 파일 경로, 자막 목록, 전체 길이(초)
+        """
+        # 여러 작업이 동시에 끝나도 파일명이 겹치지 않도록 임의 접미사 추가
+        output_path = os.path.join(self.output_dir, f"tts_{int(time.time())}_{uuid.uuid4().hex[:8]}.{self.output_format}")
+        subtitles = []
+        current_time = 0.0
+        
+        with metrics.span('tts_assemble'):
+            async with AudioAssembler(output_path, output_format=self.output_format) as assembler:
+                for item in plan:
+                    if item['type'] == 'pause':
+                        # 쉼 명령어 처리 - 무음 추가
+                        duration = item['duration']
+                        await assembler.add_silence(duration)
+                        current_time += duration
+                        continue
+                    
+                    segment = await synthesized.__anext__()
+                    
+                    segment_duration = len(segment['audio']) / 1000.0
+                    print(f"🎵 최종 음성 길이: {segment_duration:.2f}초")
+                    await assembler.add_segment(segment['audio'])
+                    
+                    # 자막 정보 추가 (단어 경계가 있으면 구/단어 단위로 분할, 대본 줄 번호 포함)
+                    for subtitle in self._segment_subtitles(
+                        item,
+                        segment['boundaries'],
+                        current_time,
+                        current_time + segment_duration
+                    ):
+                        subtitle['line'] = item.get('line')
+                        subtitles.append(subtitle)
+                    current_time += segment_duration
+        
+        self._io_stats['disk_bytes_written'] += os.path.getsize(output_path)
+        return output_path, subtitles, current_time
+    
+    def _segment_subtitles(self, item: Dict, boundaries: List[Dict], start_time: float, end_time: float) -> List[Dict]:
+        """세그먼트 자막 생성 (병합 항목은 단어 경계로 조각별 위치를 되찾음)"""
+        if 'parts' in item:
+            return self.subtitle_builder.build_parts(item['parts'], boundaries, start_time, end_time)
+        return self.subtitle_builder.build(item['content'], boundaries, start_time, end_time)
+    
+    def _build_result(self, output_path: str, subtitles: List[Dict], duration: float) -> Dict:
+        """변환 성공 결과 생성"""
+        self.duration_estimator.save()
+        metrics.inc('tts_jobs_total', result='success')
+        result = {
+            'success': True,
+            'audio_path': output_path,
+            'audio_format': self.output_format,
+            'duration': duration,
+            'subtitles': subtitles,
+            'io': self.io_stats
+        }
+        print(f"🎵 I/O: 요청 {result['io']['network_requests']}회, 디코딩 {result['io']['decode_calls']}회, "
+              f"세그먼트당 디스크 I/O {result['io']['disk_bytes_per_segment']:.0f} bytes")
+        result['resilience'] = self.resilience.stats
+        if self.cache:
+            result['cache'] = self.cache.stats
+            print(f"🎵 캐시 적중 {self.cache.hits}회 / 미스 {self.cache.misses}회")
+        
+        return result
+    
+    @staticmethod
+    def _to_wav_bytes(audio_segment: AudioSegment) -> bytes:
+        """PCM 세그먼트를 메모리에서 WAV 바이트로 변환 (인코더 실행 없음)"""
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_file:
+            wav_file.setnchannels(audio_segment.channels)
+            wav_file.setsampwidth(audio_segment.sample_width)
+            wav_file.setframerate(audio_segment.frame_rate)
+            wav_file.writeframes(audio_segment.raw_data)
+        return buffer.getvalue()
+    
+    async def _stream_part(self, item: Dict, fetched: Dict) -> Tuple[bytes, str, float]:
+        """
+        스트리밍으로 보낼 세그먼트 오디오 준비
+        
+        속도 조절이 없는 새 세그먼트는 Edge-TTS MP3를 그대로 보내고 길이는
+        프레임 헤더로 계산한다 (디코딩 없음). 캐시 적중이나 속도 조절이 필요한
+        세그먼트는 PCM을 WAV로 감싸서 보낸다.
+        
+        Returns:
+            Tuple[bytes, str, float]: 오디오 바이트, 형식('mp3'/'wav'), 길이(초)
+        """
+        if 'audio' not in fetched:
+            frames = MP3Frames(fetched['mp3'])
+            if frames.valid and item['speed_multiplier'] == 1.0:
+                duration = round(frames.sample_count * 1000 / frames.sample_rate) / 1000.0
+                return frames.audio_data, 'mp3', duration
+            
+            # 일괄 디코딩과 같은 지연 보정을 거쳐서 convert와 같은 PCM이 되도록 함
+            audio_segment = (await self._decode_batch([fetched['mp3']]))[0]
+            await self._finalize_segment(item, fetched, audio_segment)
+        
+        return self._to_wav_bytes(fetched['audio']), 'wav', len(fetched['audio']) / 1000.0
+    
+    async def convert_stream(self, text: str, script: Optional[Script] = None) -> AsyncIterator[Dict]:
+        """
+        텍스트를 음성으로 변환하면서 세그먼트가 준비되는 대로 순서대로 내보냄
+        
+        합성은 convert와 같이 동시에 진행되지만 결과는 대본 순서대로 나오므로
+        첫 오디오는 첫 세그먼트 하나의 합성 시간만에 전달된다.
+        
+        Args:
+            text: 변환할 텍스트
+            script: 이미 파싱된 대본 (있으면 text를 다시 파싱하지 않음)
+        
+        Yields:
+            dict: 이벤트
+                - start: segments(텍스트 세그먼트 수), items(쉼 포함 항목 수)
+                - pause: index, start_time, duration
+                - segment: index, start_time, duration, format, audio(bytes), subtitles
+                - done: convert와 같은 결과 (audio_path, subtitles, io, cache)
+                - error: error 메시지
+        """
+        if not text.strip():
+            yield {'type': 'error', 'error': '변환할 텍스트가 없습니다.'}
+            return
+        
+        self._io_stats = self._new_io_stats()
+        plan = self._build_plan(script or self.parser.parse(text))
+        if not plan:
+            yield {'type': 'error', 'error': '변환할 텍스트가 없습니다.'}
+            return
+        
+        text_items = [item for item in plan if item['type'] == 'text']
+        tasks = self._start_fetches(text_items)
+        # 순서대로 기다리는 중에 뒤의 세그먼트가 먼저 실패하면 바로 오류를 보냄
+        failure = self._watch_failure(tasks)
+        fetched_count = 0
+        
+        try:
+            yield {'type': 'start', 'segments': len(text_items), 'items': len(plan)}
+            
+            current_time = 0.0
+            for index, item in enumerate(plan):
+                if item['type'] == 'pause':
+                    yield {'type': 'pause', 'index': index, 'start_time': current_time, 'duration': item['duration']}
+                    current_time += item['duration']
+                    continue
+                
+                result = await self._result_or_failure(tasks[fetched_count], failure)
+                fetched_count += 1
+                audio_data, audio_format, duration = await self._stream_part(item, result)
+                
+                yield {
+                    'type': 'segment',
+                    'index': index,
+                    'start_time': current_time,
+                    'duration': duration,
+                    'format': audio_format,
+                    'audio': audio_data,
+                    'subtitles': self._segment_subtitles(
+                        item, result['boundaries'], current_time, current_time + duration
+                    )
+                }
+                current_time += duration
+            
+            # 전체 파일은 남은 세그먼트를 묶음 단위로 디코딩하면서 조립
+            synthesized = self._finalize_in_order(text_items, tasks)
+            output_path, subtitles, duration = await self._assemble(plan, synthesized)
+            done = self._build_result(output_path, subtitles, duration)
+            done['type'] = 'done'
+            yield done
+            
+        except Exception as e:
+            metrics.inc('tts_jobs_total', result='error')
+            logger.error(f"TTS 스트리밍 변환 오류: {str(e)}")
+            yield {'type': 'error', 'error': f"TTS 변환 실패: {str(e)}"}
+        
+        finally:
+            self._release_failure(failure)
+            await self._cancel_tasks(tasks)
+    
+    async def convert(self, text: str, script: Optional[Script] = None) -> Dict:
         """
         텍스트를 음성으로 변환
         
@@ -188,14 +865,19 @@ class TextToSpeech:
         2. 각 줄에서 목소리/속도 옵션이 있으면 그 줄 전체에 적용 (줄바꿈 전까지 유지)
         3. 쉼 명령어는 그 자리에서 즉시 무음 삽입
         4. 다음 줄로 넘어가면 목소리/속도는 기본값으로 초기화
+        5. 텍스트 세그먼트는 최대 max_concurrency개씩 동시에 합성하고 대본 순서대로 합친다
+        6. 자막은 Edge-TTS 단어 경계로 구/단어 단위로 나눈다 (subtitle_builder 설정)
         
         Args:
             text: 변환할 텍스트
+            script: 이미 파싱된 대본 (있으면 text를 다시 파싱하지 않음)
             
         Returns:
             dict: 
                 - success: 성공 여부
                 - audio_path: 생성된 음성 파일 경로 (성공시)
+                - audio_format: 음성 파일 형식 (output_format)
+                - duration: 전체 길이(초)
                 - error: 오류 메시지 (실패시)
                 - subtitles: 자막 정보 (성공시)
         """
@@ -206,159 +888,75 @@ class TextToSpeech:
                     'error': '변환할 텍스트가 없습니다.'
                 }
             
-            # 줄별로 분리
-            lines = text.strip().split('\n')
-            audio_segments = []
-            subtitles = []
-            current_time = 0.0
-            
-            for line in lines:
-                if not line.strip():
-                    continue
-                
-                # 이 줄에서 목소리/속도 옵션 추출 (줄 전체에 적용)
-                line_without_options, line_voice, line_speed = self._extract_voice_speed_options(line)
-                
-                # 이 줄에서 사용할 목소리와 속도 설정
-                current_voice = self.voice  # 기본값으로 시작
-                current_rate = self._convert_speed_to_rate(self.speed)  # 기본값으로 시작
-                
-                if line_voice:
-                    if line_voice in self.voices:
-                        current_voice = self.voices[line_voice]
-                    else:
-                        current_voice = line_voice  # 직접 지정된 음성
-                
-                if line_speed:
-                    current_rate = self._convert_speed_to_rate(line_speed)
-                    print(f"🎵 줄별 속도 설정: {line_speed} -> {current_rate}")
-                
-                print(f"🎤 현재 음성: {current_voice}, 속도: {current_rate}")
-                
-                # 이 줄을 쉼 명령어 기준으로 세그먼트 분리
-                segments = self._process_line_with_pauses(line_without_options)
-                
-                for segment in segments:
-                    if segment['type'] == 'pause':
-                        # 쉼 명령어 처리 - 무음 추가
-                        duration = segment['duration']
-                        silence = AudioSegment.silent(duration=int(duration * 1000))
-                        audio_segments.append(silence)
-                        current_time += duration
-                        
-                    elif segment['type'] == 'text':
-                        clean_text = segment['content'].strip()
-                        if not clean_text:
-                            continue
-                        
-                        # Edge-TTS로 음성 생성
-                        print(f"🎵 TTS 생성 전 - 텍스트: '{clean_text}', 음성: {current_voice}, 속도: {current_rate}")
-                        
-                        # Edge-TTS에서 속도 설정 방법 개선
-                        tts_communicate = edge_tts.Communicate(
-                            text=clean_text,
-                            voice=current_voice,
-                            rate=current_rate  # 생성자에서 직접 설정
-                        )
-                        
-                        print(f"🎵 TTS 객체 설정 완료 - rate: {current_rate}")
-                        
-                        # 임시 파일에 저장
-                        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-                        temp_file.close()
-                        
-                        print(f"🎵 음성 파일 생성 시작: {temp_file.name}")
-                        start_time = time.time()
-                        
-                        try:
-                            await tts_communicate.save(temp_file.name)
-                            end_time = time.time()
-                            generation_time = end_time - start_time
-                            print(f"🎵 음성 파일 생성 완료: {generation_time:.2f}초 소요")
-                            
-                            # AudioSegment로 로드
-                            audio_segment = AudioSegment.from_mp3(temp_file.name)
-                            
-                            # 속도 조절을 pydub로 처리 (Edge-TTS가 제대로 적용하지 않는 경우)
-                            if line_speed and line_speed not in ["1.0", "+0%"]:
-                                speed_multiplier = self._convert_percentage_to_multiplier(line_speed)
-                                print(f"🎵 pydub로 속도 조절: {line_speed} -> {speed_multiplier}배")
-                                
-                                # 속도 조절: 빠르게 하려면 frame_rate를 높이고, 느리게 하려면 낮춘다
-                                # 그 후 원래 sample_rate로 되돌린다
-                                if speed_multiplier != 1.0:
-                                    # 속도 조절 적용
-                                    new_sample_rate = int(audio_segment.frame_rate * speed_multiplier)
-                                    audio_segment = audio_segment._spawn(audio_segment.raw_data, 
-                                                                       overrides={"frame_rate": new_sample_rate})
-                                    audio_segment = audio_segment.set_frame_rate(22050)  # 원래 샘플레이트로 복원
-                            
-                            segment_duration = len(audio_segment) / 1000.0
-                            print(f"🎵 최종 음성 길이: {segment_duration:.2f}초")
-                            
-                            audio_segments.append(audio_segment)
-                            
-                            # 자막 정보 추가
-                            subtitles.append({
-                                'start_time': current_time,
-                                'end_time': current_time + segment_duration,
-                                'text': clean_text
-                            })
-                            current_time += segment_duration
-                            
-                        finally:
-                            if os.path.exists(temp_file.name):
-                                os.unlink(temp_file.name)
-            
-            if not audio_segments:
+            self._io_stats = self._new_io_stats()
+            plan = self._build_plan(script or self.parser.parse(text))
+            if not plan:
                 return {
                     'success': False,
                     'error': '변환할 텍스트가 없습니다.'
                 }
             
-            # 모든 세그먼트 합치기
-            final_audio = audio_segments[0]
-            for segment in audio_segments[1:]:
-                final_audio += segment
+            text_items = [item for item in plan if item['type'] == 'text']
+            started = time.perf_counter()
             
-            # 최종 파일 저장
-            output_path = os.path.join(self.output_dir, f"tts_{int(time.time())}.mp3")
-            final_audio.export(output_path, format="mp3")
-            
-            return {
-                'success': True,
-                'audio_path': output_path,
-                'subtitles': subtitles
-            }
+            print(f"🎵 동시 합성 시작: 세그먼트 {len(text_items)}개, 최대 동시 실행 {self.max_concurrency}개")
+            synthesized = self._synthesize_all(text_items)
+            try:
+                output_path, subtitles, duration = await self._assemble(plan, synthesized)
+            finally:
+                # 조립이 중간에 실패해도 남은 합성 작업을 바로 취소
+                await synthesized.aclose()
+            metrics.observe('stage_seconds', time.perf_counter() - started, stage='tts_convert')
+            return self._build_result(output_path, subtitles, duration)
             
         except Exception as e:
+            metrics.inc('tts_jobs_total', result='error')
             logger.error(f"TTS 변환 오류: {str(e)}")
             return {
                 'success': False,
                 'error': f"TTS 변환 실패: {str(e)}"
             }
     
-    def subtitles_to_srt(self, subtitles: List[Dict]) -> str:
-        """자막 정보를 SRT 형식으로 변환"""
-        srt_content = []
+    def estimate(self, text: str, script: Optional[Script] = None) -> Dict:
+        """
+        합성하지 않고 음성 길이를 예측
         
-        for i, subtitle in enumerate(subtitles, 1):
-            start_time = self._seconds_to_srt_time(subtitle['start_time'])
-            end_time = self._seconds_to_srt_time(subtitle['end_time'])
-            text = subtitle['text']
+        Args:
+            text: 변환할 텍스트
+            script: 이미 파싱된 대본 (있으면 text를 다시 파싱하지 않음)
             
-            srt_content.append(f"{i}")
-            srt_content.append(f"{start_time} --> {end_time}")
-            srt_content.append(text)
-            srt_content.append("")  # 빈 줄
+        Returns:
+            dict:
+                - duration: 전체 예상 길이(초)
+                - speech_duration: 음성 부분 예상 길이(초)
+                - pause_duration: 쉼 길이 합(초)
+                - segments: 텍스트 세그먼트(요청) 수
+        """
+        plan = self._build_plan(script or self.parser.parse(text))
+        speech_duration = 0.0
+        pause_duration = 0.0
+        segments = 0
         
-        return '\n'.join(srt_content)
-    
-    def _seconds_to_srt_time(self, seconds: float) -> str:
-        """초를 SRT 시간 형식으로 변환 (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
+        for item in plan:
+            if item['type'] == 'pause':
+                pause_duration += item['duration']
+                continue
+            segments += 1
+            for part in item.get('parts', [item]):
+                if part['type'] == 'pause':
+                    pause_duration += part['duration']
+                else:
+                    speech_duration += self.duration_estimator.predict(
+                        part['content'], item['voice'], self._effective_speed(item)
+                    )
         
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
\ No newline at end of file
+        return {
+            'duration': round(speech_duration + pause_duration, 2),
+            'speech_duration': round(speech_duration, 2),
+            'pause_duration': round(pause_duration, 2),
+            'segments': segments
+        }
+    
+    def subtitles_to_srt(self, subtitles: List[Dict]) -> str:
+        """자막 정보를 SRT 형식으로 변환"""
+        return SubtitleWriter().to_srt(subtitles)
\ No newline at end of file
@@ -0,0 +1,335 @@
+import os
+import time
+import uuid
+import asyncio
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional
+from classes.settings import Settings
+from classes.tts import TextToSpeech
+from classes.audio_assembler import AudioAssembler
+from classes.duration_estimator import DurationEstimator
+from classes.metrics import metrics
+
+class TTSBatchJob:
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    ERROR = 'error'
+
+    def __init__(self, batch_id: str, text: str, tts: TextToSpeech):
+        """
+        일괄 음성 생성 작업 하나 (대본 하나)
+
+        Args:
+            batch_id (str): 작업이 속한 일괄 요청 ID
+            text (str): 변환할 텍스트 (쉼 옵션 포함)
+            tts (TextToSpeech): 목소리/속도가 설정된 변환기
+        """
+        self._id: str = uuid.uuid4().hex
+        self._batch_id = batch_id
+        self._text = text
+        self._tts: Optional[TextToSpeech] = tts
+        self._voice: str = tts.voice
+        self._speed: str = tts.speed
+        self._status: str = self.QUEUED
+        self._result: Optional[Dict] = None
+        self._error: Optional[str] = None
+        self._estimated_duration: float = tts.estimate(text)['duration']
+        self._created_at: float = time.time()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        # 상태가 바뀔 때마다 증가 (구독자가 변경 여부를 확인)
+        self._version: int = 0
+
+    @property
+    def id(self) -> str:
+        """작업 ID를 반환"""
+        return self._id
+
+    @property
+    def batch_id(self) -> str:
+        """일괄 요청 ID를 반환"""
+        return self._batch_id
+
+    @property
+    def status(self) -> str:
+        """작업 상태를 반환 (queued, running, done, error)"""
+        return self._status
+
+    @property
+    def finished(self) -> bool:
+        """작업이 끝났는지 여부를 반환"""
+        return self._status in (self.DONE, self.ERROR)
+
+    @property
+    def estimated_duration(self) -> float:
+        """예상 음성 길이(초)를 반환"""
+        return self._estimated_duration
+
+    @property
+    def version(self) -> int:
+        """상태 변경 횟수를 반환"""
+        return self._version
+
+    def start(self) -> None:
+        """실행 시작 기록"""
+        self._status = self.RUNNING
+        self._started_at = time.time()
+        self._version += 1
+
+    def finish(self, result: Dict) -> None:
+        """변환 결과 기록 (변환기는 더 이상 필요 없으므로 놓아줌)"""
+        if result.get('success'):
+            self._status = self.DONE
+            self._result = result
+        else:
+            self._status = self.ERROR
+            self._error = result.get('error', '알 수 없는 오류')
+        self._finished_at = time.time()
+        self._tts = None
+        self._version += 1
+
+    async def run(self) -> Dict:
+        """설정된 변환기로 음성 생성"""
+        return await self._tts.convert(self._text)
+
+    def to_dict(self, include_subtitles: bool = True) -> Dict:
+        """
+        작업 상태를 API 응답용 dict로 반환
+
+        Args:
+            include_subtitles (bool): 자막 정보 포함 여부 (목록 조회에서는 제외)
+        """
+        data = {
+            'job_id': self._id,
+            'batch_id': self._batch_id,
+            'status': self._status,
+            'voice': self._voice,
+            'speed': self._speed,
+            'estimated_duration': self._estimated_duration,
+            'created_at': self._created_at,
+            'started_at': self._started_at,
+            'finished_at': self._finished_at
+        }
+        if self._error is not None:
+            data['error'] = self._error
+        if self._result is not None:
+            audio_path = self._result['audio_path']
+            data['audio_path'] = audio_path
+            data['audio_format'] = self._result['audio_format']
+            data['duration'] = self._result['duration']
+            data['download_url'] = f"/download-audio?file={os.path.basename(audio_path)}"
+            if include_subtitles:
+                data['subtitles'] = self._result['subtitles']
+        return data
+
+class TTSBatchManager:
+    def __init__(self, workers: Optional[int] = None, output_dir: str = "outputs", max_jobs: Optional[int] = None):
+        """
+        여러 대본의 음성 생성을 작업 큐와 고정된 수의 작업자로 처리하는 클래스
+
+        요청한 클라이언트 수와 관계없이 동시에 변환하는 대본 수는 workers개로 제한된다.
+        (Edge-TTS 동시 요청 수는 최대 workers × tts_settings.max_concurrency)
+        한 번에 들어온 대본들은 예상 길이가 짧은 것부터 실행해서 평균 대기 시간을 줄이고,
+        먼저 들어온 일괄 요청이 항상 먼저 처리된다.
+
+        Args:
+            workers (Optional[int]): 동시에 변환할 대본 수. None이면 설정값 사용
+            output_dir (str): 음성 파일 저장 디렉토리
+            max_jobs (Optional[int]): 보관할 최대 작업 수 (넘으면 끝난 오래된 일괄 요청부터 삭제)
+        """
+        self._settings = Settings()
+        self._workers = workers or self._settings.tts_batch_workers
+        self._output_dir = output_dir
+        self._max_jobs = max_jobs or self._settings.tts_batch_max_jobs
+        self._jobs: Dict[str, TTSBatchJob] = {}
+        self._batches: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._changed = asyncio.Event()
+
+    @property
+    def workers(self) -> int:
+        """작업자 수를 반환"""
+        return self._workers
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환"""
+        counts = {status: 0 for status in (TTSBatchJob.QUEUED, TTSBatchJob.RUNNING, TTSBatchJob.DONE, TTSBatchJob.ERROR)}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        counts['workers'] = self._workers
+        return counts
+
+    def _ensure_workers(self) -> None:
+        """실행 중인 이벤트 루프에서 작업자 시작 (처음 제출할 때 한 번)"""
+        if self._tasks and not all(task.done() for task in self._tasks):
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self._workers)]
+        # 작업자가 없는 동안 큐에 남은 작업을 다시 넣음
+        for job_ids in self._batches.values():
+            for job_id in job_ids:
+                if self._jobs[job_id].status == TTSBatchJob.QUEUED:
+                    self._queue.put_nowait(job_id)
+
+    def _notify(self) -> None:
+        """상태 변경을 구독자에게 알림"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+        stats = self.stats
+        metrics.set('tts_batch_jobs', stats[TTSBatchJob.QUEUED], status=TTSBatchJob.QUEUED)
+        metrics.set('tts_batch_jobs', stats[TTSBatchJob.RUNNING], status=TTSBatchJob.RUNNING)
+
+    @staticmethod
+    def _validate_item(item: Dict) -> None:
+        """요청 항목 하나를 변환기를 만들지 않고 검사 (잘못된 요청은 바로 거절)"""
+        if not isinstance(item, dict):
+            raise TypeError("항목은 객체여야 합니다.")
+        if not str(item.get('text') or '').strip():
+            raise ValueError("텍스트가 비어있는 항목이 있습니다.")
+        output_format = item.get('output_format')
+        if output_format and str(output_format) not in AudioAssembler.FORMATS:
+            raise ValueError(f"output_format must be one of {tuple(AudioAssembler.FORMATS)}")
+        float(item.get('pause') or 0.0)
+
+    def _create_job(self, batch_id: str, item: Dict) -> TTSBatchJob:
+        """요청 항목 하나로 작업 생성 (목소리/속도 설정, 길이 예측)"""
+        text = str(item.get('text') or '')
+        tts = TextToSpeech(output_dir=self._output_dir)
+        if item.get('voice'):
+            tts.set_voice(str(item['voice']))
+        tts.set_speed(str(item.get('speed', '1.0')))
+        if item.get('output_format'):
+            tts.set_output_format(str(item['output_format']))
+
+        # 쉼 옵션이 있으면 텍스트 끝에 추가
+        pause = float(item.get('pause') or 0.0)
+        if pause > 0:
+            text = text + f" [쉼:{pause}]"
+        return TTSBatchJob(batch_id, text, tts)
+
+    async def submit(self, items: List[Dict]) -> Dict:
+        """
+        대본 여러 개를 한 번에 제출
+
+        항목은 먼저 이벤트 루프에서 가볍게 검사하고, 변환기 생성(설정/캐시 읽기)과
+        길이 예측은 대본 길이에 비례하므로 스레드에서 실행해서 다른 요청을 막지 않는다.
+
+        Args:
+            items (List[Dict]): 항목마다 text(필수), voice, speed, pause, output_format
+
+        Returns:
+            Dict: batch_id와 작업 목록 (입력 순서)
+        """
+        if not items:
+            raise ValueError("변환할 항목이 없습니다.")
+        for item in items:
+            self._validate_item(item)
+
+        batch_id = uuid.uuid4().hex
+        jobs = await asyncio.to_thread(lambda: [self._create_job(batch_id, item) for item in items])
+
+        self._ensure_workers()
+        for job in jobs:
+            self._jobs[job.id] = job
+        self._batches[batch_id] = [job.id for job in jobs]
+
+        ordered = DurationEstimator.shortest_first([job.to_dict(include_subtitles=False) for job in jobs])
+        for job in ordered:
+            self._queue.put_nowait(job['job_id'])
+
+        metrics.inc('tts_batch_jobs_total', len(jobs))
+        print(f"📦 일괄 음성 생성 접수: {len(jobs)}개 (작업자 {self._workers}개)")
+        self._evict()
+        self._notify()
+        return {'batch_id': batch_id, 'jobs': [job.to_dict(include_subtitles=False) for job in jobs]}
+
+    def _evict(self) -> None:
+        """보관 작업 수가 max_jobs를 넘으면 모두 끝난 오래된 일괄 요청부터 삭제"""
+        for batch_id in list(self._batches):
+            if len(self._jobs) <= self._max_jobs:
+                break
+            job_ids = self._batches[batch_id]
+            if all(self._jobs[job_id].finished for job_id in job_ids):
+                for job_id in job_ids:
+                    del self._jobs[job_id]
+                del self._batches[batch_id]
+
+    def get_job(self, job_id: str) -> Optional[TTSBatchJob]:
+        """작업 조회 (없으면 None)"""
+        return self._jobs.get(job_id)
+
+    def get_batch(self, batch_id: str) -> Optional[List[TTSBatchJob]]:
+        """일괄 요청의 작업 목록 조회 (없으면 None)"""
+        job_ids = self._batches.get(batch_id)
+        if job_ids is None:
+            return None
+        return [self._jobs[job_id] for job_id in job_ids]
+
+    def batch_status(self, batch_id: str, include_subtitles: bool = False) -> Optional[Dict]:
+        """일괄 요청의 진행 상황 (없으면 None)"""
+        jobs = self.get_batch(batch_id)
+        if jobs is None:
+            return None
+        return {
+            'batch_id': batch_id,
+            'total': len(jobs),
+            'finished': sum(1 for job in jobs if job.finished),
+            'failed': sum(1 for job in jobs if job.status == TTSBatchJob.ERROR),
+            'jobs': [job.to_dict(include_subtitles) for job in jobs]
+        }
+
+    async def _worker(self, index: int) -> None:
+        """큐에서 작업을 하나씩 꺼내 실행"""
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            try:
+                if job is None or job.status != TTSBatchJob.QUEUED:
+                    continue
+                job.start()
+                self._notify()
+                with metrics.span('tts_batch_job'):
+                    try:
+                        result = await job.run()
+                    except Exception as e:
+                        result = {'success': False, 'error': f"TTS 변환 실패: {str(e)}"}
+                job.finish(result)
+                metrics.inc('tts_batch_finished_total', status=job.status)
+                self._notify()
+            finally:
+                self._queue.task_done()
+
+    async def subscribe(self, job_ids: List[str], keepalive: float = 15.0) -> AsyncIterator[Optional[Dict]]:
+        """
+        작업 상태가 바뀔 때마다 작업 정보를 전달 (모든 작업이 끝나면 종료)
+
+        처음에는 현재 상태를 모두 보내고, 이후에는 바뀐 작업만 보낸다.
+        keepalive초 동안 변화가 없으면 None을 보내서 연결 유지에 쓸 수 있게 한다.
+        """
+        seen: Dict[str, int] = {}
+        while True:
+            changed = self._changed
+            jobs = [self._jobs[job_id] for job_id in job_ids if job_id in self._jobs]
+            for job in jobs:
+                if seen.get(job.id) != job.version:
+                    seen[job.id] = job.version
+                    yield job.to_dict()
+            if all(job.finished for job in jobs):
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), keepalive)
+            except asyncio.TimeoutError:
+                yield None
+
+    async def shutdown(self) -> None:
+        """작업자 종료"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+# 프로세스 전체에서 공유하는 일괄 작업 관리자
+tts_batch = TTSBatchManager()
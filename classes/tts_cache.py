@@ -0,0 +1,161 @@
+import os
+import json
+import uuid
+import wave
+import hashlib
+from typing import Dict, Optional
+from pydub import AudioSegment
+from classes.settings import Settings
+from classes.lru_directory import LRUDirectory
+
+class TTSCache:
+    # 합성이나 후처리(디코딩, 속도 조절, 무음 정리 등) 결과가 바뀌면 올려서 이전 결과를 쓰지 않도록 함
+    # (2: 속도 조절을 리샘플링에서 WSOLA로 변경, 3: 일괄 디코딩에서 디코더 지연 보정)
+    VERSION = 3
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_mb: Optional[float] = None):
+        """
+        합성된 TTS 세그먼트를 디스크에 보관하는 LRU 캐시
+
+        세그먼트는 (텍스트, 음성, rate, 속도 배수)의 해시로 저장되며
+        디코딩이 끝난 PCM을 WAV로 보관하므로 캐시 적중 시 네트워크 요청과
+        MP3 디코딩이 모두 생략된다.
+
+        Args:
+            cache_dir (Optional[str]): 캐시 디렉토리. None이면 설정값 사용
+            max_size_mb (Optional[float]): 캐시 최대 용량(MB). None이면 설정값 사용
+        """
+        self._settings = Settings()
+        self._cache_dir: str = cache_dir or self._settings.tts_cache_dir
+        if max_size_mb is None:
+            max_size_mb = self._settings.tts_cache_max_size_mb
+        self._max_size_bytes: int = int(max_size_mb * 1024 * 1024)
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        # 용량은 프로세스 전체에서 한 번만 훑고 이후에는 저장/삭제할 때 갱신 (다른 프로세스의 쓰기는 정리 시 반영)
+        self._entries = LRUDirectory(self._cache_dir, '.wav', companions=('.json',))
+
+    @property
+    def cache_dir(self) -> str:
+        """캐시 디렉토리를 반환"""
+        return self._cache_dir
+
+    @property
+    def max_size_bytes(self) -> int:
+        """캐시 최대 용량(바이트)을 반환"""
+        return self._max_size_bytes
+
+    @max_size_bytes.setter
+    def max_size_bytes(self, value: int) -> None:
+        """캐시 최대 용량(바이트)을 설정하고 초과분을 정리"""
+        if value < 0:
+            raise ValueError("max_size_bytes must be 0 or greater")
+        self._max_size_bytes = value
+        self._evictions += self._entries.evict(self._max_size_bytes)
+
+    @property
+    def hits(self) -> int:
+        """캐시 적중 횟수를 반환"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """캐시 미스 횟수를 반환"""
+        return self._misses
+
+    @property
+    def stats(self) -> Dict:
+        """캐시 통계를 반환 (디렉토리를 훑지 않고 추적 중인 값)"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'entries': self._entries.entries,
+            'size_bytes': self._entries.size_bytes,
+            'max_size_bytes': self._max_size_bytes
+        }
+
+    @classmethod
+    def make_key(cls, text: str, voice: str, rate: str, speed_multiplier: float) -> str:
+        """세그먼트 입력값과 알고리즘 버전으로 캐시 키(sha256) 생성"""
+        payload = json.dumps([cls.VERSION, text, voice, rate, round(float(speed_multiplier), 4)],
+                             ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        """캐시 키에 해당하는 파일 경로"""
+        return self._entries.path(key)
+
+    def _meta_path(self, key: str) -> str:
+        """캐시 키에 해당하는 메타데이터(단어 경계 등) 파일 경로"""
+        return os.path.join(self._cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[AudioSegment]:
+        """
+        캐시에서 세그먼트를 읽음
+
+        Returns:
+            Optional[AudioSegment]: 캐시에 있으면 세그먼트, 없으면 None
+        """
+        path = self._entry_path(key)
+        try:
+            with wave.open(path, 'rb') as wav_file:
+                segment = AudioSegment(
+                    data=wav_file.readframes(wav_file.getnframes()),
+                    sample_width=wav_file.getsampwidth(),
+                    frame_rate=wav_file.getframerate(),
+                    channels=wav_file.getnchannels()
+                )
+            # 최근 사용 시각 갱신 (LRU 기준은 파일 수정 시각)
+            self._entries.touch(path)
+        except (FileNotFoundError, wave.Error, EOFError):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return segment
+
+    def get_meta(self, key: str) -> Dict:
+        """세그먼트와 함께 저장된 메타데이터를 읽음 (없으면 빈 dict)"""
+        try:
+            with open(self._meta_path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def put(self, key: str, segment: AudioSegment, meta: Optional[Dict] = None) -> None:
+        """세그먼트를 캐시에 저장하고 용량을 초과하면 오래된 항목부터 삭제"""
+        path = self._entry_path(key)
+        # 같은 프로세스의 여러 스레드가 같은 키를 동시에 저장해도 임시 파일이 겹치지 않도록 임의 접미사 사용
+        suffix = f".{uuid.uuid4().hex}.tmp"
+        temp_path = path + suffix
+
+        if meta is not None:
+            # 메타데이터를 먼저 써서 세그먼트가 보이는 시점에는 항상 함께 있도록 함
+            meta_path = self._meta_path(key)
+            try:
+                with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f, ensure_ascii=False)
+                os.replace(meta_path + suffix, meta_path)
+            finally:
+                if os.path.exists(meta_path + suffix):
+                    os.remove(meta_path + suffix)
+
+        try:
+            with wave.open(temp_path, 'wb') as wav_file:
+                wav_file.setnchannels(segment.channels)
+                wav_file.setsampwidth(segment.sample_width)
+                wav_file.setframerate(segment.frame_rate)
+                wav_file.writeframes(segment.raw_data)
+            # 같은 키를 덮어쓰면 이전 파일 크기를 빼고 용량을 갱신
+            self._entries.commit(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self._evictions += self._entries.evict(self._max_size_bytes, keep=[path])
+
+    def clear(self) -> None:
+        """캐시 항목을 모두 삭제"""
+        self._entries.clear()
@@ -0,0 +1,202 @@
+import os
+import time
+import uuid
+import shutil
+import tempfile
+from typing import Dict, List, Optional
+from classes.settings import Settings
+from classes.metrics import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+class WorkspaceQuotaError(Exception):
+    """작업 공간 사용량이 할당량을 넘음"""
+
+class Workspace:
+    PREFIX = 'job_'
+    LOCK_NAME = '.lock'
+    # 잠금 파일이 없는 작업 공간을 남은 것으로 보기까지의 시간(초)
+    GRACE_SECONDS = 60
+
+    def __init__(self, root: Optional[str] = None, quota_mb: Optional[float] = None):
+        """
+        작업 하나의 중간 파일(음성, 이미지, 자막, 구간 영상)을 모아 두는 디렉토리
+
+        - 루트는 설정값(workspace.root)으로 바꿀 수 있음 (예: RAM 기반 tmpfs인 /dev/shm)
+        - 작업 공간마다 디렉토리 하나를 만들고 close()하면 통째로 삭제
+        - 사용량이 할당량(workspace.quota_mb)을 넘으면 check()에서 WorkspaceQuotaError
+        - 살아 있는 동안 잠금 파일을 잡고 있으므로, 작업 프로세스가 죽어서 남은 디렉토리는
+          sweep()이 잠금을 잡을 수 있는지로 구분해서 지움
+
+        Args:
+            root (Optional[str]): 작업 공간 루트. None이면 설정값, 설정값이 비어 있으면 시스템 임시 디렉토리 아래
+            quota_mb (Optional[float]): 할당량(MB). None이면 설정값, 0이면 제한 없음
+        """
+        settings = Settings()
+        self._root = self.resolve_root(root if root is not None else settings.workspace_root)
+        if quota_mb is None:
+            quota_mb = settings.workspace_quota_mb
+        self._quota_bytes: int = int(quota_mb * 1024 * 1024)
+        self._peak_bytes: int = 0
+        self._lock_file = None
+
+        os.makedirs(self._root, exist_ok=True)
+        self._path: Optional[str] = tempfile.mkdtemp(prefix=f"{self.PREFIX}{os.getpid()}_", dir=self._root)
+        self._lock()
+
+    @staticmethod
+    def resolve_root(root: str) -> str:
+        """작업 공간 루트 경로 (비어 있으면 시스템 임시 디렉토리 아래 mp4creator)"""
+        return os.path.abspath(root) if root else os.path.join(tempfile.gettempdir(), 'mp4creator')
+
+    @property
+    def path(self) -> str:
+        """작업 공간 디렉토리를 반환"""
+        if self._path is None:
+            raise RuntimeError("이미 정리된 작업 공간입니다")
+        return self._path
+
+    @property
+    def quota_bytes(self) -> int:
+        """할당량(바이트)을 반환 (0이면 제한 없음)"""
+        return self._quota_bytes
+
+    @property
+    def usage(self) -> int:
+        """현재 사용량(바이트)을 반환"""
+        if self._path is None:
+            return 0
+        total = 0
+        for directory, _, files in os.walk(self._path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(directory, name))
+                except OSError:
+                    pass
+        return total
+
+    @property
+    def stats(self) -> Dict:
+        """사용량, 최대 사용량, 할당량을 반환"""
+        usage = self._measure()
+        return {
+            'path': self._path,
+            'usage_bytes': usage,
+            'peak_bytes': self._peak_bytes,
+            'quota_bytes': self._quota_bytes
+        }
+
+    def file(self, suffix: str = '', prefix: str = '') -> str:
+        """
+        작업 공간 안의 새 파일 경로 (이름만 정하고 파일은 만들지 않음)
+
+        작업 공간은 이 작업만 쓰는 디렉토리이므로 이름이 겹치지 않으면 충분하다.
+        """
+        return os.path.join(self.path, f"{prefix}{uuid.uuid4().hex}{suffix}")
+
+    def _measure(self) -> int:
+        """현재 사용량을 재고 최대 사용량 갱신"""
+        usage = self.usage
+        self._peak_bytes = max(self._peak_bytes, usage)
+        return usage
+
+    def check(self) -> int:
+        """
+        사용량 확인 (단계가 끝날 때마다 호출)
+
+        Returns:
+            int: 현재 사용량(바이트)
+
+        Raises:
+            WorkspaceQuotaError: 할당량을 넘은 경우
+        """
+        usage = self._measure()
+        if self._quota_bytes and usage > self._quota_bytes:
+            raise WorkspaceQuotaError(
+                f"작업 공간 할당량 초과: {usage / 1024 / 1024:.1f}MB > {self._quota_bytes / 1024 / 1024:.1f}MB"
+            )
+        return usage
+
+    def _lock(self) -> None:
+        """살아 있는 작업 공간 표시 (프로세스가 끝나면 운영체제가 잠금을 풂)"""
+        self._lock_file = open(os.path.join(self._path, self.LOCK_NAME), 'w')
+        self._lock_file.write(str(os.getpid()))
+        self._lock_file.flush()
+        if fcntl is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def close(self) -> None:
+        """작업 공간 디렉토리 삭제 (여러 번 불러도 됨)"""
+        if self._path is None:
+            return
+        self._measure()
+        metrics.inc('workspace_peak_bytes_total', self._peak_bytes)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        shutil.rmtree(self._path, ignore_errors=True)
+        self._path = None
+
+    def __enter__(self) -> "Workspace":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @classmethod
+    def _orphaned(cls, path: str) -> bool:
+        """작업 공간을 만든 프로세스가 이미 끝났는지 확인"""
+        lock_path = os.path.join(path, cls.LOCK_NAME)
+        if not os.path.exists(lock_path):
+            # 잠금 파일을 만들기 직전일 수 있으므로 방금 만든 디렉토리는 남겨 둠
+            try:
+                return time.time() - os.path.getmtime(path) > cls.GRACE_SECONDS
+            except OSError:
+                return False
+        if fcntl is not None:
+            try:
+                with open(lock_path, 'r') as f:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                return True
+            except BlockingIOError:
+                return False
+            except OSError:
+                return True
+
+        # 잠금을 쓸 수 없으면 디렉토리 이름의 프로세스 ID로 확인
+        try:
+            pid = int(os.path.basename(path)[len(cls.PREFIX):].split('_')[0])
+            os.kill(pid, 0)
+        except (ValueError, ProcessLookupError):
+            return True
+        except OSError:
+            return False
+        return False
+
+    @classmethod
+    def sweep(cls, root: Optional[str] = None) -> List[str]:
+        """
+        비정상 종료된 작업이 남긴 작업 공간 삭제 (서버 시작 시 호출)
+
+        Returns:
+            List[str]: 삭제한 디렉토리 목록
+        """
+        root = cls.resolve_root(root if root is not None else Settings().workspace_root)
+        removed: List[str] = []
+        try:
+            entries = [entry.path for entry in os.scandir(root)
+                       if entry.is_dir() and entry.name.startswith(cls.PREFIX)]
+        except FileNotFoundError:
+            return removed
+
+        for path in entries:
+            if cls._orphaned(path):
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(path)
+        if removed:
+            print(f"🧹 남은 작업 공간 {len(removed)}개 삭제: {root}")
+        return removed
@@ -0,0 +1,17 @@
+import time
+from classes.script_parser import ScriptParser
+
+if __name__ == "__main__":
+    # 명령어가 섞인 긴 대본을 만들어 파싱 처리량 측정
+    line = "[목소리:ko-KR-SunHiNeural][속도:1.2]안녕하세요 [쉼:0.5] 오늘의 소식입니다. [검색어:고양이] 끝.\n"
+    source = line * 40000
+    size_mb = len(source.encode('utf-8')) / (1024 * 1024)
+
+    parser = ScriptParser()
+    started = time.perf_counter()
+    script = parser.parse(source)
+    elapsed = time.perf_counter() - started
+
+    print(f"대본 크기: {size_mb:.2f}MB, 줄 수: {len(script.lines)}")
+    print(f"파싱 시간: {elapsed:.3f}s ({size_mb / elapsed:.1f}MB/s)")
+    print(f"텍스트 조각: {len(script.text_runs)}, 검색어: {len(script.search_keywords)}")
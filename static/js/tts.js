@@ -12,13 +12,18 @@ document.addEventListener('DOMContentLoaded', function() {
     const resultSection = document.getElementById('result-section');
     const audioPlayer = document.getElementById('audio-player');
 
+    let estimateTimer = null;
+    let estimateRequest = 0;
+
     // 텍스트 통계 업데이트
     textInput.addEventListener('input', updateTextStats);
+    voiceSelect.addEventListener('change', scheduleEstimate);
     
     // 속도 슬라이더 업데이트
     speedInput.addEventListener('input', function() {
         const value = parseInt(this.value);
         speedValue.textContent = (value >= 0 ? '+' : '') + value + '%';
+        scheduleEstimate();
     });
 
     // 폼 제출 처리
@@ -39,6 +44,44 @@ document.addEventListener('DOMContentLoaded', function() {
         charCount.textContent = chars;
         wordCount.textContent = words;
         estimatedTime.textContent = formatTime(estimatedSeconds);
+
+        // 서버의 길이 예측 모델 값으로 교체 (입력이 멈추면 요청)
+        scheduleEstimate();
+    }
+
+    // 입력이 잠시 멈춘 뒤 예상 시간 요청
+    function scheduleEstimate() {
+        clearTimeout(estimateTimer);
+        estimateTimer = setTimeout(fetchEstimate, 400);
+    }
+
+    // 서버에서 예상 음성 길이 가져오기 (실제 합성 결과로 보정된 값)
+    async function fetchEstimate() {
+        const text = textInput.value;
+        if (!text.trim()) {
+            return;
+        }
+
+        const requestId = ++estimateRequest;
+        const speed = parseInt(speedInput.value);
+        const formData = new FormData();
+        formData.set('text', text);
+        formData.set('voice', voiceSelect.value);
+        formData.set('speed', (speed >= 0 ? '+' : '') + speed + '%');
+
+        try {
+            const response = await fetch('/api/estimate-duration', {
+                method: 'POST',
+                body: formData
+            });
+            if (!response.ok || requestId !== estimateRequest) {
+                return;
+            }
+            const estimate = await response.json();
+            estimatedTime.textContent = formatTime(Math.ceil(estimate.duration));
+        } catch (error) {
+            // 예측 실패 시 글자 수 기준 값을 그대로 둠
+        }
     }
 
     // 시간 포맷 함수
@@ -74,32 +117,31 @@ document.addEventListener('DOMContentLoaded', function() {
         addLog('음성 생성을 시작합니다...', 'info');
 
         try {
-            updateProgress(30, 'Edge-TTS로 음성 변환 중...');
+            updateProgress(20, 'Edge-TTS로 음성 변환 중...');
             addLog(`텍스트: ${formData.get('text').substring(0, 50)}...`, 'info');
             addLog(`목소리: ${voiceSelect.options[voiceSelect.selectedIndex].text}`, 'info');
             addLog(`속도: ${speedPercent}`, 'info');
 
-            const response = await fetch('/api/generate-audio', {
+            // 세그먼트가 준비되는 대로 받아서 바로 재생 (NDJSON 스트리밍)
+            const response = await fetch('/api/generate-audio-stream', {
                 method: 'POST',
                 body: formData
             });
 
-            updateProgress(80, '음성 파일 처리 중...');
-
             if (!response.ok) {
                 const errorData = await response.json();
                 throw new Error(errorData.detail || `HTTP error! status: ${response.status}`);
             }
 
-            const result = await response.json();
+            const result = await readAudioStream(response);
             
             updateProgress(100, '✅ 생성 완료!');
             addLog('음성 파일이 성공적으로 생성되었습니다!', 'success');
 
-            if (result.success) {
+            if (result && result.success) {
                 showResult(result, formData);
             } else {
-                throw new Error(result.error || '알 수 없는 오류가 발생했습니다.');
+                throw new Error('알 수 없는 오류가 발생했습니다.');
             }
 
         } catch (error) {
@@ -117,6 +159,114 @@ document.addEventListener('DOMContentLoaded', function() {
         generateBtn.textContent = '🎤 음성 생성하기';
     }
 
+    // 스트리밍 응답을 한 줄씩 읽어 이벤트 처리, done 이벤트를 반환
+    async function readAudioStream(response) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const playback = createPlaybackQueue();
+        const startedAt = performance.now();
+        let buffered = '';
+        let totalItems = 0;
+        let receivedItems = 0;
+        let firstAudioLogged = false;
+        let result = null;
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) {
+                break;
+            }
+            buffered += decoder.decode(value, { stream: true });
+
+            let newlineIndex;
+            while ((newlineIndex = buffered.indexOf('\n')) >= 0) {
+                const line = buffered.slice(0, newlineIndex).trim();
+                buffered = buffered.slice(newlineIndex + 1);
+                if (!line) {
+                    continue;
+                }
+
+                const event = JSON.parse(line);
+                if (event.type === 'start') {
+                    totalItems = event.items;
+                    addLog(`세그먼트 ${event.segments}개 합성 시작`, 'info');
+                } else if (event.type === 'pause') {
+                    receivedItems++;
+                    playback.enqueuePause(event.duration);
+                } else if (event.type === 'segment') {
+                    receivedItems++;
+                    if (!firstAudioLogged) {
+                        const elapsed = ((performance.now() - startedAt) / 1000).toFixed(2);
+                        addLog(`첫 오디오 수신: ${elapsed}초`, 'info');
+                        firstAudioLogged = true;
+                    }
+                    playback.enqueueAudio(event.audio, event.format);
+                    event.subtitles.forEach(sub => addLog(`자막: ${sub.text}`, 'info'));
+                } else if (event.type === 'done') {
+                    result = event;
+                } else if (event.type === 'error') {
+                    throw new Error(event.error);
+                }
+
+                if (totalItems > 0) {
+                    const percent = 20 + Math.round(70 * receivedItems / totalItems);
+                    updateProgress(percent, `음성 생성 중... (${receivedItems}/${totalItems})`);
+                }
+            }
+        }
+
+        return result;
+    }
+
+    // 받은 세그먼트를 순서대로 재생하는 큐
+    function createPlaybackQueue() {
+        const queue = [];
+        const player = new Audio();
+        let playing = false;
+
+        function playNext() {
+            const part = queue.shift();
+            if (!part) {
+                playing = false;
+                return;
+            }
+            playing = true;
+
+            if (part.pause) {
+                setTimeout(playNext, part.pause * 1000);
+                return;
+            }
+
+            player.src = part.url;
+            player.onended = () => {
+                URL.revokeObjectURL(part.url);
+                playNext();
+            };
+            player.play().catch(() => playNext());
+        }
+
+        function toBlobUrl(base64Audio, format) {
+            const bytes = Uint8Array.from(atob(base64Audio), c => c.charCodeAt(0));
+            const mimeType = format === 'wav' ? 'audio/wav' : 'audio/mpeg';
+            return URL.createObjectURL(new Blob([bytes], { type: mimeType }));
+        }
+
+        return {
+            enqueueAudio(base64Audio, format) {
+                queue.push({ url: toBlobUrl(base64Audio, format) });
+                if (!playing) {
+                    playNext();
+                }
+            },
+            enqueuePause(seconds) {
+                queue.push({ pause: seconds });
+                if (!playing) {
+                    playNext();
+                }
+            }
+        };
+    }
+
     // 진행 상황 업데이트
     function updateProgress(percent, message) {
         const progressFill = document.getElementById('progress-fill');
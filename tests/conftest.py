@@ -0,0 +1,10 @@
+import os
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """Settings가 config/settings.json을 상대 경로로 읽으므로 저장소 루트에서 실행"""
+    monkeypatch.chdir(ROOT)
+    return ROOT
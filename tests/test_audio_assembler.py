@@ -0,0 +1,52 @@
+import asyncio
+import shutil
+import wave
+import pytest
+from pydub import AudioSegment
+from classes.audio_assembler import AudioAssembler
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg가 없음')
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        AudioAssembler(str(tmp_path / 'out.ogg'), output_format='ogg')
+
+@requires_ffmpeg
+def test_segments_and_silence_are_written_in_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioSegment, 'converter', shutil.which('ffmpeg'))
+    monkeypatch.setattr(AudioAssembler, '_SILENCE_CHUNK_BYTES', 1000)
+    output_path = str(tmp_path / 'out.wav')
+    tone = AudioSegment(data=b'\x10\x00' * 2400, sample_width=2, frame_rate=24000, channels=1)
+    stereo = AudioSegment(data=b'\x20\x00' * 4800, sample_width=2, frame_rate=24000, channels=2)
+
+    async def assemble():
+        async with AudioAssembler(output_path, output_format='wav') as assembler:
+            assert await assembler.add_segment(tone) == pytest.approx(0.1)
+            assert await assembler.add_silence(0.25) == 0.25
+            await assembler.add_segment(stereo)
+            return assembler.duration
+
+    duration = asyncio.run(assemble())
+
+    assert duration == pytest.approx(0.45)
+    with wave.open(output_path, 'rb') as wav_file:
+        assert wav_file.getframerate() == 24000
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getnframes() == 10800
+        pcm = wav_file.readframes(wav_file.getnframes())
+    assert pcm[:4800] == b'\x10\x00' * 2400
+    assert pcm[4800:4800 + 12000] == b'\x00' * 12000
+
+@requires_ffmpeg
+def test_failed_assembly_removes_partial_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioSegment, 'converter', shutil.which('ffmpeg'))
+    output_path = tmp_path / 'out.wav'
+
+    async def assemble():
+        async with AudioAssembler(str(output_path), output_format='wav') as assembler:
+            await assembler.add_silence(0.1)
+            raise RuntimeError('중단')
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(assemble())
+    assert not output_path.exists()
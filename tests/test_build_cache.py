@@ -0,0 +1,87 @@
+import os
+from classes.build_cache import BuildCache
+from classes.lru_directory import LRUDirectory
+
+MB = 1024 * 1024
+
+def _video(tmp_path, name: str, size: int) -> str:
+    path = tmp_path / f"{name}.mp4"
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+def _age(path: str, seconds: float) -> None:
+    """최근 사용 시각을 seconds초 전으로 옮김"""
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+def _cache(tmp_path, max_size_bytes: int) -> BuildCache:
+    return BuildCache(cache_dir=str(tmp_path / 'cache'), max_size_mb=max_size_bytes / MB)
+
+def test_make_key_is_stable_and_versioned(monkeypatch):
+    inputs = {'keyword': '고양이', 'duration': 2.5, 'subtitles': [{'text': '야옹'}]}
+    assert BuildCache.make_key(inputs) == BuildCache.make_key(dict(reversed(list(inputs.items()))))
+    key = BuildCache.make_key(inputs)
+    monkeypatch.setattr(BuildCache, 'VERSION', BuildCache.VERSION + 1)
+    assert BuildCache.make_key(inputs) != key
+
+def test_hit_linked_into_a_job_survives_eviction(tmp_path):
+    cache = _cache(tmp_path, 2500)
+    cache.put('a', _video(tmp_path, 'a', 1000))
+    job_copy = str(tmp_path / 'job_a.mp4')
+    assert cache.get('a', dest=job_copy) == job_copy
+
+    # 다른 작업의 저장으로 'a'가 정리되어도 이 작업이 받은 구간은 남음
+    _age(cache.entry_path('a'), 60)
+    cache.put('b', _video(tmp_path, 'b', 1000))
+    cache.put('c', _video(tmp_path, 'c', 1000))
+    assert not os.path.exists(cache.entry_path('a'))
+    assert os.path.getsize(job_copy) == 1000
+
+def test_put_without_evict_keeps_every_segment_of_the_build(tmp_path):
+    cache = _cache(tmp_path, 1500)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, _video(tmp_path, key, 1000), evict=False)
+    assert all(os.path.exists(cache.entry_path(key)) for key in ('a', 'b', 'c'))
+    assert cache.stats['size_bytes'] == 3000
+
+def test_evict_spares_the_keys_of_the_finished_build(tmp_path):
+    cache = _cache(tmp_path, 2500)
+    for age, key in enumerate(('c', 'b', 'a')):
+        cache.put(key, _video(tmp_path, key, 1000), evict=False)
+        _age(cache.entry_path(key), 10 * (age + 1))
+
+    # 'a'가 가장 오래됐지만 이번 빌드에서 쓴 구간이므로 남기고 그다음으로 오래된 'b'를 지움
+    assert cache.evict(keep=['a', 'c']) == 1
+    assert os.path.exists(cache.entry_path('a'))
+    assert not os.path.exists(cache.entry_path('b'))
+    assert os.path.exists(cache.entry_path('c'))
+    assert cache.stats['entries'] == 2
+
+def test_get_counts_hits_and_misses(tmp_path):
+    cache = _cache(tmp_path, 10 * MB)
+    cache.put('a', _video(tmp_path, 'a', 10))
+    assert cache.get('a') == cache.entry_path('a')
+    assert cache.get('missing') is None
+    assert cache.get('missing', dest=str(tmp_path / 'x.mp4')) is None
+    assert not (tmp_path / 'x.mp4').exists()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_lru_directory_tracks_size_across_overwrites_and_clear(tmp_path):
+    directory = LRUDirectory(str(tmp_path / 'entries'), '.bin', companions=('.json',))
+    for size in (100, 40):
+        temp = tmp_path / 'entries' / 'a.bin.tmp'
+        temp.write_bytes(b'x' * size)
+        directory.commit(str(temp), directory.path('a'))
+    (tmp_path / 'entries' / 'a.json').write_text('{}')
+    assert (directory.size_bytes, directory.entries) == (40, 1)
+
+    directory.clear()
+    assert (directory.size_bytes, directory.entries) == (0, 0)
+    assert os.listdir(tmp_path / 'entries') == []
+
+def test_lru_directory_ignores_other_files(tmp_path):
+    (tmp_path / 'a.bin').write_bytes(b'x' * 10)
+    (tmp_path / 'a.bin.123.tmp').write_bytes(b'x' * 50)
+    (tmp_path / 'notes.txt').write_bytes(b'x' * 50)
+    directory = LRUDirectory(str(tmp_path), '.bin')
+    assert (directory.size_bytes, directory.entries) == (10, 1)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from classes.caption_renderer import CaptionRenderer
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    """프로세스 공용 글꼴/자막 캐시를 테스트마다 비움 (기본 글꼴 사용)"""
+    monkeypatch.setattr(CaptionRenderer, '_fonts', {})
+    monkeypatch.setattr(CaptionRenderer, '_captions', type(CaptionRenderer._captions)())
+    monkeypatch.setattr(CaptionRenderer, '_captions_bytes', [0])
+    monkeypatch.setattr(CaptionRenderer, '_default_font_warned', False)
+    monkeypatch.setattr(CaptionRenderer, '_find_font', staticmethod(lambda: ''))
+
+def _renderer(**kwargs):
+    kwargs.setdefault('font_size', 20)
+    return CaptionRenderer(font_path='', **kwargs)
+
+def test_korean_without_spaces_wraps_by_character():
+    renderer = _renderer(max_width=100, stroke_width=0)
+    text = '가나다라마바사아자차카타파하가나다라'
+
+    lines = renderer.wrap(text)
+
+    assert len(lines) > 1
+    assert ''.join(lines) == text
+    assert all(renderer.font.getlength(line) <= 100 for line in lines)
+
+def test_words_wrap_at_spaces_and_keep_paragraphs():
+    renderer = _renderer(max_width=100, stroke_width=0)
+
+    lines = renderer.wrap('hello world this is long\n둘째 줄')
+
+    assert all(renderer.font.getlength(line) <= 100 for line in lines)
+    assert ' '.join(lines[:-1]) == 'hello world this is long'
+    assert lines[-1] == '둘째 줄'
+
+def test_render_uses_cache_for_same_text_and_style():
+    renderer = _renderer()
+
+    first = renderer.render('자막')
+    second = renderer.render('자막')
+    other_style = _renderer(color='yellow').render('자막')
+
+    assert second is first
+    assert other_style is not first
+    assert renderer.stats['hits'] == 1
+    assert renderer.stats['misses'] == 1
+    assert renderer.stats['entries'] == 2
+    assert not first.flags.writeable
+    assert first.ndim == 3 and first.shape[2] == 4
+
+def test_cache_evicts_least_recently_used_by_bytes(monkeypatch):
+    renderer = _renderer()
+    sizes = {text: renderer._draw(text).nbytes for text in ('하나', '둘', '셋')}
+    monkeypatch.setattr(CaptionRenderer, 'CACHE_MAX_BYTES', sizes['하나'] + sizes['둘'] + sizes['셋'] - 1)
+
+    renderer.render('하나')
+    renderer.render('둘')
+    renderer.render('하나')  # 최근 사용으로 갱신
+    renderer.render('셋')   # 크기를 넘으므로 가장 오래 쓰지 않은 '둘'이 빠짐
+
+    cached = [key[0] for key in CaptionRenderer._captions]
+    assert cached == ['하나', '셋']
+    assert renderer.stats['bytes'] == sizes['하나'] + sizes['셋']
+
+def test_default_font_warning_is_printed_once(capsys):
+    for size in (20, 24, 32):
+        _renderer(font_size=size).font
+
+    assert capsys.readouterr().out.count('기본 글꼴') == 1
+
+def test_render_image_matches_bitmap():
+    renderer = _renderer()
+    image = renderer.render_image('자막')
+
+    assert image.mode == 'RGBA'
+    assert np.array_equal(np.asarray(image), renderer.render('자막'))
@@ -0,0 +1,75 @@
+import json
+import pytest
+from classes.duration_estimator import DurationEstimator
+
+VOICE = 'ko-KR-InJoonNeural'
+
+@pytest.fixture
+def model_path(tmp_path):
+    return str(tmp_path / 'duration_model.json')
+
+def _train(estimator: DurationEstimator, voice: str = VOICE, intercept: float = 0.2, slope: float = 0.1,
+           speed: float = 1.0) -> None:
+    """길이 = 절편 + 기울기 × 글자 수 인 표본으로 학습"""
+    for chars in range(3, 15):
+        estimator.observe('가' * chars, voice, speed, (intercept + slope * chars) / speed)
+
+def test_features_ignore_spaces_and_count_breaks():
+    assert DurationEstimator.features("안녕하세요, 반갑습니다!") == {'chars': 10, 'breaks': 2}
+    assert DurationEstimator.features(" ... ") == {'chars': 0, 'breaks': 3}
+
+def test_untrained_model_uses_defaults(model_path):
+    estimator = DurationEstimator(model_path)
+    expected = DurationEstimator.DEFAULT_INTERCEPT + DurationEstimator.DEFAULT_SECONDS_PER_CHAR * 10
+    assert estimator.predict('가' * 10, VOICE) == pytest.approx(expected)
+    assert estimator.predict('  ', VOICE) == 0.0
+
+def test_fit_recovers_a_linear_model(model_path):
+    estimator = DurationEstimator(model_path)
+    _train(estimator)
+    assert estimator.predict('가' * 20, VOICE) == pytest.approx(0.2 + 0.1 * 20, rel=1e-6)
+    stats = estimator.stats[VOICE]
+    assert stats['seconds_per_char'] == pytest.approx(0.1)
+    assert stats['intercept'] == pytest.approx(0.2)
+    assert stats['mean_error'] < 0.05
+
+def test_durations_are_normalized_by_speed(model_path):
+    estimator = DurationEstimator(model_path)
+    _train(estimator, speed=2.0)
+    assert estimator.predict('가' * 10, VOICE, speed=1.0) == pytest.approx(1.2, rel=1e-6)
+    assert estimator.predict('가' * 10, VOICE, speed=2.0) == pytest.approx(0.6, rel=1e-6)
+
+def test_voice_with_few_samples_falls_back_to_global_model(model_path):
+    estimator = DurationEstimator(model_path)
+    _train(estimator, voice='a', slope=0.1)
+    estimator.observe('가' * 10, 'b', 1.0, 5.0)
+    assert estimator.predict('가' * 10, 'b') == pytest.approx(estimator.predict('가' * 10, '*'))
+    assert estimator.predict('가' * 10, 'b') < 5.0
+
+def test_save_merges_with_other_writers(model_path):
+    first = DurationEstimator(model_path)
+    second = DurationEstimator(model_path)
+    _train(first, voice='a')
+    _train(second, voice='b')
+    first.save()
+    second.save()
+
+    with open(model_path, encoding='utf-8') as f:
+        models = json.load(f)['models']
+    assert set(models) == {'a', 'b', '*'}
+    assert models['*']['n'] > models['a']['n']
+
+    reloaded = DurationEstimator(model_path)
+    assert reloaded.predict('가' * 20, 'a') == pytest.approx(first.predict('가' * 20, 'a'), rel=1e-6)
+
+def test_save_without_observations_writes_nothing(model_path, tmp_path):
+    DurationEstimator(model_path).save()
+    assert not (tmp_path / 'duration_model.json').exists()
+
+def test_shared_instance_per_model_file(model_path, tmp_path):
+    assert DurationEstimator.shared(model_path) is DurationEstimator.shared(model_path)
+    assert DurationEstimator.shared(model_path) is not DurationEstimator.shared(str(tmp_path / 'other.json'))
+
+def test_shortest_first():
+    jobs = [{'id': 1, 'estimated_duration': 3.0}, {'id': 2, 'estimated_duration': 1.0}, {'id': 3}]
+    assert [job['id'] for job in DurationEstimator.shortest_first(jobs)] == [3, 2, 1]
@@ -0,0 +1,49 @@
+import pytest
+from classes.settings import Settings
+from classes.encode_profile import EncodeProfile
+
+@pytest.mark.parametrize('name, args', [
+    ('default', ['-preset', 'medium', '-crf', '23']),
+    ('still', ['-preset', 'veryfast', '-crf', '23', '-tune', 'stillimage',
+               '-g', '300', '-force_key_frames', 'expr:gte(t,n_forced*10)']),
+    ('fast', ['-preset', 'ultrafast', '-crf', '26', '-tune', 'stillimage',
+              '-g', '300', '-force_key_frames', 'expr:gte(t,n_forced*10)']),
+    ('quality', ['-preset', 'slow', '-crf', '18', '-tune', 'stillimage',
+                 '-g', '150', '-force_key_frames', 'expr:gte(t,n_forced*5)']),
+])
+def test_profile_codec_args(name, args):
+    profile = EncodeProfile(name, crf=0, preset='')
+
+    assert profile.name == name
+    assert profile.codec_args(30) == args
+
+@pytest.mark.parametrize('name, vfr', [('default', False), ('still', True), ('fast', True), ('quality', True)])
+def test_vfr_profiles_drop_repeated_frames(name, vfr):
+    profile = EncodeProfile(name, crf=0, preset='')
+
+    assert profile.vfr is vfr
+    assert profile.decimate_filter(25) == ('mpdecimate=max=25' if vfr else None)
+
+def test_crf_and_preset_override_profile():
+    profile = EncodeProfile('still', crf=30, preset='faster')
+
+    assert (profile.crf, profile.preset) == (30, 'faster')
+    assert profile.codec_args(30)[:4] == ['-preset', 'faster', '-crf', '30']
+
+def test_defaults_come_from_settings():
+    settings = Settings()
+    profile = EncodeProfile()
+
+    assert profile.name == settings.video_encode_profile
+    expected = EncodeProfile.PROFILES[profile.name]
+    assert profile.crf == (settings.video_encode_crf or expected['crf'])
+    assert profile.preset == (settings.video_encode_preset or expected['preset'])
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match='encode profile must be one of'):
+        EncodeProfile('ultra')
+
+    profile = EncodeProfile('default', crf=0, preset='')
+    with pytest.raises(ValueError):
+        profile.name = 'ultra'
+    assert profile.name == 'default'
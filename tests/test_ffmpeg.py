@@ -0,0 +1,57 @@
+import pytest
+from classes.ffmpeg import FFmpeg
+
+@pytest.fixture
+def ffmpeg(monkeypatch):
+    """실행하지 않고 인자만 기록하는 ffmpeg (음성 코덱은 파일 이름의 확장자로 정함)"""
+    ffmpeg = FFmpeg(binary='ffmpeg')
+    ffmpeg.calls = []
+    codecs = {'.m4a': 'aac', '.mp3': 'mp3', '.wav': 'pcm_s16le'}
+    monkeypatch.setattr(ffmpeg, 'probe', lambda path: {
+        'duration': 1.0, 'video_codec': None, 'audio_codec': codecs[path[path.rindex('.'):]]
+    })
+    monkeypatch.setattr(ffmpeg, 'run', lambda args, **kwargs: ffmpeg.calls.append(args))
+    return ffmpeg
+
+@pytest.mark.parametrize('audio_path, codec', [('voice.m4a', 'copy'), ('voice.mp3', 'aac'), ('voice.wav', 'aac')])
+def test_audio_codec_for(ffmpeg, audio_path, codec):
+    assert ffmpeg.audio_codec_for(audio_path) == codec
+
+def test_audio_args():
+    assert FFmpeg.audio_args('copy') == ['-c:a', 'copy']
+    assert FFmpeg.audio_args('aac') == ['-c:a', 'aac', '-b:a', '192k']
+
+def test_mux_copies_aac_and_cuts_to_shortest(ffmpeg):
+    assert ffmpeg.mux('video.mp4', 'voice.m4a', 'out.mp4') == 'out.mp4'
+
+    assert ffmpeg.calls == [[
+        '-i', 'video.mp4', '-i', 'voice.m4a',
+        '-map', '0:v:0', '-map', '1:a:0',
+        '-c:v', 'copy', '-c:a', 'copy',
+        '-shortest', '-movflags', '+faststart', 'out.mp4'
+    ]]
+
+def test_mux_encodes_other_audio_once_with_duration(ffmpeg):
+    ffmpeg.mux('video.mp4', 'voice.mp3', 'out.mp4', duration=12.3456)
+
+    args = ffmpeg.calls[0]
+    assert args[args.index('-c:a'):args.index('-c:a') + 4] == ['-c:a', 'aac', '-b:a', '192k']
+    assert args[args.index('-t') + 1] == '12.346'
+    assert '-shortest' not in args
+
+def test_mux_explicit_codec_skips_probe(ffmpeg, monkeypatch):
+    monkeypatch.setattr(ffmpeg, 'probe', lambda path: pytest.fail('probe를 부르면 안 됨'))
+
+    ffmpeg.mux('video.mp4', 'voice.wav', 'out.mp4', audio_codec='aac')
+    assert ffmpeg.calls[0][ffmpeg.calls[0].index('-c:a') + 1] == 'aac'
+
+def test_mux_adds_mov_text_subtitle_track(ffmpeg):
+    ffmpeg.mux('video.mp4', 'voice.m4a', 'out.mp4', subtitle_path='sub.srt', subtitle_language='eng')
+
+    assert ffmpeg.calls == [[
+        '-i', 'video.mp4', '-i', 'voice.m4a', '-i', 'sub.srt',
+        '-map', '0:v:0', '-map', '1:a:0',
+        '-c:v', 'copy', '-c:a', 'copy',
+        '-map', '2:s:0', '-c:s', 'mov_text', '-metadata:s:s:0', 'language=eng',
+        '-shortest', '-movflags', '+faststart', 'out.mp4'
+    ]]
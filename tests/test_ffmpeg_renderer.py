@@ -0,0 +1,101 @@
+import os
+import pytest
+from PIL import Image
+from classes.ffmpeg import FFmpeg
+from classes.ffmpeg_renderer import FFmpegRenderer
+from classes.encode_profile import EncodeProfile
+
+def test_renderer_requires_existing_temp_dir(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        FFmpegRenderer(str(tmp_path / 'missing'))
+
+def test_converted_images_stay_in_temp_dir(tmp_path):
+    workspace = tmp_path / 'workspace'
+    workspace.mkdir()
+    gif_path = str(tmp_path / 'still.gif')
+    Image.new('RGB', (8, 8), 'red').save(gif_path)
+    png_path = str(tmp_path / 'still.png')
+    Image.new('RGB', (8, 8), 'blue').save(png_path)
+    renderer = FFmpegRenderer(str(workspace))
+
+    converted, decoder = renderer._image_input(gif_path)
+
+    assert decoder == 'png'
+    assert os.path.dirname(converted) == str(workspace)
+    assert renderer._image_input(png_path) == (png_path, 'png')
+
+class _FFmpeg:
+    """명령만 만들고 실행하지 않는 ffmpeg (ffmpeg 5.1 이상처럼 -fps_mode 사용)"""
+    vfr_args = staticmethod(lambda: ['-fps_mode', 'vfr'])
+    audio_args = staticmethod(FFmpeg.audio_args)
+
+def _renderer(tmp_path, profile='default', **kwargs):
+    return FFmpegRenderer(str(tmp_path), 640, 360, 30, ffmpeg=_FFmpeg(),
+                          profile=EncodeProfile(profile, crf=0, preset=''), **kwargs)
+
+def _image(tmp_path, name):
+    path = str(tmp_path / name)
+    Image.new('RGB', (8, 8), 'red').save(path)
+    return path
+
+def _option(args, name):
+    return args[args.index(name) + 1]
+
+def test_still_images_are_looped_and_concatenated(tmp_path):
+    first, second = _image(tmp_path, 'a.png'), _image(tmp_path, 'b.jpg')
+    args = _renderer(tmp_path).build_command([(first, 1.0), (second, 0.52)], 1.52, 'out.mp4')
+
+    assert args[:8] == ['-c:v', 'png', '-i', first, '-c:v', 'mjpeg', '-i', second]
+    assert '-stream_loop' not in args
+    graph = _option(args, '-filter_complex').split(';')
+    cover = "scale=640:360:force_original_aspect_ratio=increase:flags=lanczos,crop=640:360,setsar=1"
+    # 누적 시간으로 프레임 수를 정함 (30프레임, 46-30=16프레임)
+    assert graph[0] == f"[0:v]{cover},format=yuv420p,loop=loop=29:size=1:start=0,settb=1/30,setpts=N[s0]"
+    assert graph[1] == f"[1:v]{cover},format=yuv420p,loop=loop=15:size=1:start=0,settb=1/30,setpts=N[s1]"
+    assert graph[2] == "[s0][s1]concat=n=2:v=1:a=0[base]"
+    assert graph[3] == "[base]null[video]"
+    assert _option(args, '-r') == '30'
+    assert _option(args, '-t') == '1.520'
+    assert args[-1] == 'out.mp4'
+    assert '-an' in args
+
+def test_video_clips_use_stream_loop_and_trim(tmp_path):
+    clip = str(tmp_path / 'clip.mp4')
+    args = _renderer(tmp_path, profile='still').build_command([(clip, 2.0)], 2.0, 'out.mp4')
+
+    assert args[:4] == ['-stream_loop', '-1', '-i', clip]
+    graph = _option(args, '-filter_complex').split(';')
+    assert graph[0].endswith(",fps=30,format=yuv420p,trim=end_frame=60,settb=1/30,setpts=N[s0]")
+    # 움직이는 배경이 있으면 같은 프레임 제거를 하지 않음
+    assert graph[-1] == "[base]null[video]"
+    assert 'mpdecimate' not in _option(args, '-filter_complex')
+
+def test_subtitles_and_decimate_for_vfr_profile(tmp_path):
+    image = _image(tmp_path, 'a.png')
+    subtitle_path = "/tmp/it's [sub]:1.ass"
+    args = _renderer(tmp_path, profile='still').build_command([(image, 1.0)], 1.0, 'out.mp4', subtitle_path)
+
+    graph = _option(args, '-filter_complex').split(';')
+    assert graph[-1] == "[base]ass=/tmp/it\\\\\\'s \\[sub\\]\\\\:1.ass,mpdecimate=max=30[video]"
+    assert args[args.index('-pix_fmt') + 2:args.index('-pix_fmt') + 4] == ['-fps_mode', 'vfr']
+    assert '-r' not in args
+
+def test_background_color_and_audio_mapping(tmp_path):
+    renderer = _renderer(tmp_path, threads=2)
+    args = renderer.build_command([], 3.0, 'out.mp4', audio_path='voice.wav', audio_codec='aac')
+
+    assert args[:4] == ['-f', 'lavfi', '-i', 'color=c=#000000:s=640x360:r=30:d=3.000']
+    assert args[4:6] == ['-i', 'voice.wav']
+    assert args[6:10] == ['-filter_complex_threads', '2', '-threads', '2']
+    map_index = args.index('-map', args.index('-map') + 1)
+    assert args[map_index:map_index + 6] == ['-map', '1:a:0', '-c:a', 'aac', '-b:a', '192k']
+    assert '-an' not in args
+
+def test_audio_follows_image_inputs(tmp_path):
+    images = [(_image(tmp_path, f'{index}.png'), 1.0) for index in range(3)]
+    args = _renderer(tmp_path).build_command(images, 3.0, 'out.mp4', audio_path='voice.m4a')
+
+    assert _option(args, '-i') == images[0][0]
+    assert args[args.index('voice.m4a') - 1] == '-i'
+    assert '3:a:0' in args
+    assert args[args.index('3:a:0') + 1:args.index('3:a:0') + 3] == ['-c:a', 'copy']
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from PIL import Image
+from classes.frame_preparer import FramePreparer
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """프로세스 공용 프레임 캐시를 테스트마다 비움"""
+    monkeypatch.setattr(FramePreparer, '_frames', type(FramePreparer._frames)())
+    monkeypatch.setattr(FramePreparer, '_frames_bytes', [0])
+
+def _bands(path, size, colors, vertical=True):
+    """같은 너비(또는 높이)의 색 띠로 된 이미지 저장"""
+    width, height = size
+    image = Image.new('RGB', size)
+    step = (width if vertical else height) // len(colors)
+    for index, color in enumerate(colors):
+        box = (index * step, 0, (index + 1) * step, height) if vertical else (0, index * step, width, (index + 1) * step)
+        image.paste(color, box)
+    image.save(path)
+    return str(path)
+
+def test_wide_image_is_cropped_to_center(tmp_path):
+    path = _bands(tmp_path / 'wide.png', (40, 10), [(255, 0, 0), (0, 255, 0), (0, 255, 0), (0, 0, 255)])
+
+    frame = FramePreparer(20, 10).prepare(str(path))
+
+    assert frame.shape == (10, 20, 3)
+    assert np.all(np.abs(frame.astype(int) - (0, 255, 0)) <= 2)
+
+def test_tall_image_is_scaled_up_and_cropped_to_center(tmp_path):
+    path = _bands(tmp_path / 'tall.png', (10, 40), [(255, 0, 0), (0, 255, 0), (0, 255, 0), (0, 0, 255)],
+                  vertical=False)
+
+    frame = FramePreparer(20, 10).prepare(str(path))
+
+    # 2배 확대 후 가운데 5줄(원본 17.5~22.5)만 보임
+    assert frame.shape == (10, 20, 3)
+    assert np.all(np.abs(frame.astype(int) - (0, 255, 0)) <= 2)
+
+def test_jpeg_draft_keeps_frame_size(tmp_path):
+    path = str(tmp_path / 'large.jpg')
+    Image.new('RGB', (800, 400), (0, 0, 255)).save(path, quality=95)
+
+    frame = FramePreparer(100, 100).prepare(path)
+
+    assert frame.shape == (100, 100, 3)
+    assert np.all(np.abs(frame.astype(int) - (0, 0, 255)) <= 4)
+
+@pytest.mark.parametrize('alpha, expected', [(0, (255, 0, 0)), (255, (0, 0, 255)), (128, (127, 0, 128))])
+def test_transparency_is_composited_over_background(tmp_path, alpha, expected):
+    path = str(tmp_path / 'overlay.png')
+    Image.new('RGBA', (8, 8), (0, 0, 255, alpha)).save(path)
+
+    frame = FramePreparer(8, 8, background_color='#ff0000').prepare(path)
+
+    assert frame.shape == (8, 8, 3)
+    assert np.all(np.abs(frame.astype(int) - expected) <= 1)
+
+def test_palette_image_with_transparency(tmp_path):
+    path = str(tmp_path / 'palette.gif')
+    image = Image.new('P', (4, 4), 0)
+    image.putpalette([0, 0, 255] + [0] * 765)
+    image.info['transparency'] = 0
+    image.save(path, transparency=0)
+
+    frame = FramePreparer(4, 4, background_color='#00ff00').prepare(path)
+
+    assert np.all(frame == (0, 255, 0))
+
+def test_cache_key_uses_content_hash(tmp_path):
+    first = str(tmp_path / 'a.png')
+    copy = str(tmp_path / 'b.png')
+    Image.new('RGB', (8, 8), (10, 20, 30)).save(first)
+    Image.new('RGB', (8, 8), (10, 20, 30)).save(copy)
+    preparer = FramePreparer(8, 8)
+
+    frame = preparer.prepare(first)
+    assert preparer.prepare(copy) is frame
+    assert not frame.flags.writeable
+
+    # 배경색이나 해상도가 다르면 다른 프레임
+    assert FramePreparer(8, 8, background_color='#ffffff').prepare(first) is not frame
+    assert FramePreparer(4, 4).prepare(first).shape == (4, 4, 3)
+
+    # 같은 경로라도 내용이 바뀌면 다시 준비
+    Image.new('RGB', (8, 8), (200, 0, 0)).save(first)
+    changed = preparer.prepare(first)
+    assert changed is not frame
+    assert tuple(changed[0, 0]) == (200, 0, 0)
+    assert (preparer.stats['hits'], preparer.stats['misses']) == (1, 2)
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(FramePreparer, 'CACHE_MAX_BYTES', 2 * 8 * 8 * 3)
+    preparer = FramePreparer(8, 8)
+    paths = []
+    for index in range(3):
+        path = str(tmp_path / f'{index}.png')
+        Image.new('RGB', (8, 8), (index, 0, 0)).save(path)
+        paths.append(path)
+
+    first = preparer.prepare(paths[0])
+    preparer.prepare(paths[1])
+    preparer.prepare(paths[0])
+    preparer.prepare(paths[2])
+
+    assert preparer.stats['entries'] == 2
+    assert preparer.prepare(paths[0]) is first
+    assert preparer.stats['misses'] == 3
+
+def test_background_frame(tmp_path):
+    frame = FramePreparer(6, 4, background_color='#102030').background()
+
+    assert frame.shape == (4, 6, 3)
+    assert np.all(frame == (16, 32, 48))
@@ -0,0 +1,74 @@
+import pytest
+from classes.giphy import GiphySearch
+
+IMAGES = {
+    'original': {'url': 'https://media.test/original.gif?cid=1', 'width': '1920', 'height': '1080', 'size': '9000000',
+                 'webp': 'https://media.test/original.webp', 'webp_size': '3000000',
+                 'mp4': 'https://media.test/original.mp4', 'mp4_size': '2000000'},
+    '480w_still': {'url': 'https://media.test/480w_s.gif', 'width': '480', 'height': '270', 'size': '40000'},
+    'original_still': {'url': 'https://media.test/original_s.gif', 'width': '1920', 'height': '1080', 'size': '800000'},
+    'fixed_height': {'url': 'https://media.test/200.gif', 'width': '356', 'height': '200', 'size': '500000',
+                     'webp': 'https://media.test/200.webp', 'webp_size': '200000',
+                     'mp4': 'https://media.test/200.mp4', 'mp4_size': '90000'},
+    'original_mp4': {'mp4': 'https://media.test/giphy.mp4', 'width': '1920', 'height': '1080', 'mp4_size': '1500000'},
+}
+
+def _giphy(width=1920, height=1080):
+    giphy = GiphySearch()
+    giphy.target_size = (width, height)
+    return giphy
+
+def test_still_picks_smallest_covering_rendition():
+    best = _giphy().select_rendition(IMAGES, 'still')
+
+    assert best['rendition'] == 'original_still'
+    assert best['format'] == 'gif'
+    assert (best['width'], best['height'], best['size']) == (1920, 1080, 800000)
+
+def test_video_picks_smallest_covering_mp4():
+    best = _giphy().select_rendition(IMAGES, 'video')
+
+    assert best['rendition'] == 'original_mp4'
+    assert best['format'] == 'mp4'
+    assert best['url'] == 'https://media.test/giphy.mp4'
+
+def test_small_target_picks_smaller_rendition():
+    giphy = _giphy(320, 180)
+
+    assert giphy.select_rendition(IMAGES, 'still')['rendition'] == '480w_still'
+    assert giphy.select_rendition(IMAGES, 'video')['rendition'] == 'fixed_height'
+
+def test_missing_renditions_fall_back_to_largest():
+    images = {
+        'fixed_height': IMAGES['fixed_height'],
+        # 크기 정보가 없는 렌디션은 같은 해상도에서 뒤로 밀림
+        'downsized': {'url': 'https://media.test/downsized.gif', 'width': '356', 'height': '200'},
+    }
+    giphy = _giphy()
+
+    still = giphy.select_rendition(images, 'still')
+    assert (still['rendition'], still['format'], still['size']) == ('fixed_height', 'webp', 200000)
+    assert giphy.select_rendition(images, 'video')['rendition'] == 'fixed_height'
+
+def test_rendition_without_size_reports_none():
+    images = {'original': {'url': 'https://media.test/a.gif', 'width': '100', 'height': '100'}}
+
+    best = _giphy().select_rendition(images, 'still')
+
+    assert best['size'] is None
+    assert best['rendition'] == 'original'
+
+def test_no_usable_rendition():
+    images = {
+        'original': {'url': 'https://media.test/a.gif', 'width': '', 'height': '100'},
+        'fixed_height': {'webp': 'https://media.test/a.webp', 'width': '100', 'height': '100'},
+    }
+    giphy = _giphy()
+
+    assert giphy.select_rendition(images, 'video') is None
+    assert giphy.select_rendition({}, 'still') is None
+    assert giphy.select_rendition(images, 'still')['format'] == 'webp'
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        _giphy().select_rendition(IMAGES, 'audio')
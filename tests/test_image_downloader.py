@@ -0,0 +1,81 @@
+import asyncio
+import functools
+import httpx
+import pytest
+from classes.image_downloader import ImageDownloader
+
+def _serve(monkeypatch, handler):
+    """ImageDownloader가 만드는 클라이언트가 네트워크 대신 handler로 응답하게 함"""
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(httpx, 'AsyncClient', functools.partial(httpx.AsyncClient, transport=transport))
+
+async def _chunks(size):
+    for _ in range(size // 100):
+        yield b'x' * 100
+
+def _handler(request):
+    path = request.url.path
+    if path == '/missing.jpg':
+        return httpx.Response(404)
+    if path == '/large.jpg':
+        return httpx.Response(200, content=b'x' * 2048)
+    if path == '/stream.jpg':
+        # content-length 없이 조각으로 보내는 응답
+        return httpx.Response(200, content=_chunks(2000))
+    if path == '/slow.jpg':
+        return httpx.Response(200, content=_slow())
+    return httpx.Response(200, content=path.encode())
+
+async def _slow():
+    yield b'part'
+    await asyncio.sleep(10)
+    yield b'rest'
+
+def _download(targets, **kwargs):
+    kwargs.setdefault('max_size_mb', 1024 / 1024 / 1024)  # 1KB
+    return asyncio.run(ImageDownloader(**kwargs).download_all(targets))
+
+def test_downloads_in_input_order_and_shares_duplicate_urls(tmp_path, monkeypatch):
+    _serve(monkeypatch, _handler)
+    a, b, c = (str(tmp_path / name) for name in ('a.jpg', 'b.jpg', 'c.jpg'))
+
+    paths = _download([('https://img.test/a.jpg', a), ('https://img.test/b.jpg', b), ('https://img.test/a.jpg', c)])
+
+    assert paths == [a, b, a]
+    assert open(a, 'rb').read() == b'/a.jpg'
+    assert open(b, 'rb').read() == b'/b.jpg'
+    assert not (tmp_path / 'c.jpg').exists()
+
+def test_empty_targets():
+    assert _download([]) == []
+
+@pytest.mark.parametrize('url', ['https://img.test/large.jpg', 'https://img.test/stream.jpg'])
+def test_size_limit(tmp_path, monkeypatch, url):
+    _serve(monkeypatch, _handler)
+    output_path = tmp_path / 'big.jpg'
+
+    with pytest.raises(ValueError, match='너무 큽니다'):
+        _download([(url, str(output_path))])
+    assert not output_path.exists()
+
+def test_size_limit_allows_files_within_limit(tmp_path, monkeypatch):
+    _serve(monkeypatch, _handler)
+    output_path = str(tmp_path / 'stream.jpg')
+
+    _download([('https://img.test/stream.jpg', output_path)], max_size_mb=4096 / 1024 / 1024)
+    assert len(open(output_path, 'rb').read()) == 2000
+
+def test_partial_failure_cancels_and_cleans_up(tmp_path, monkeypatch):
+    _serve(monkeypatch, _handler)
+    targets = [
+        ('https://img.test/ok.jpg', str(tmp_path / 'ok.jpg')),
+        ('https://img.test/slow.jpg', str(tmp_path / 'slow.jpg')),
+        ('https://img.test/missing.jpg', str(tmp_path / 'missing.jpg')),
+    ]
+
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        _download(targets)
+
+    # 원래 예외가 그대로 전달되고 받은 파일과 받다 만 파일은 모두 지워짐
+    assert error.value.response.status_code == 404
+    assert list(tmp_path.iterdir()) == []
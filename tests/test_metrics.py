@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from classes.metrics import Metrics
+from app.routes import metrics as metrics_route
+
+def test_render_counters_gauges_and_histograms():
+    metrics = Metrics()
+    metrics.describe('jobs_total', '작업 수')
+    metrics.inc('jobs_total', result='success')
+    metrics.inc('jobs_total', 2, result='success')
+    metrics.inc('jobs_total', 0.5, result='error')
+    metrics.set('queue', 3, status='queued')
+    metrics.observe('stage_seconds', 0.02, stage='a')
+    metrics.observe('stage_seconds', 400, stage='a')
+
+    lines = metrics.render().splitlines()
+
+    assert lines[:5] == [
+        '# HELP mp4creator_jobs_total 작업 수',
+        '# TYPE mp4creator_jobs_total counter',
+        'mp4creator_jobs_total{result="success"} 3',
+        'mp4creator_jobs_total{result="error"} 0.5',
+        '# TYPE mp4creator_queue gauge',
+    ]
+    assert 'mp4creator_queue{status="queued"} 3' in lines
+    assert '# TYPE mp4creator_stage_seconds histogram' in lines
+    assert 'mp4creator_stage_seconds_bucket{stage="a",le="0.01"} 0' in lines
+    assert 'mp4creator_stage_seconds_bucket{stage="a",le="0.025"} 1' in lines
+    assert 'mp4creator_stage_seconds_bucket{stage="a",le="300"} 1' in lines
+    assert 'mp4creator_stage_seconds_bucket{stage="a",le="+Inf"} 2' in lines
+    assert 'mp4creator_stage_seconds_sum{stage="a"} 400.02' in lines
+    assert 'mp4creator_stage_seconds_count{stage="a"} 2' in lines
+
+def test_render_escapes_label_values():
+    metrics = Metrics()
+    metrics.inc('errors_total', stage='a"b\\c\nd')
+    assert 'mp4creator_errors_total{stage="a\\"b\\\\c\\nd"} 1' in metrics.render()
+
+def test_span_counts_errors_but_not_cancellation():
+    metrics = Metrics()
+
+    with pytest.raises(ValueError):
+        with metrics.span('work'):
+            raise ValueError('실패')
+
+    async def cancelled():
+        with metrics.span('work'):
+            raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancelled())
+
+    def generator():
+        with metrics.span('work'):
+            yield 1
+            yield 2
+
+    items = generator()
+    next(items)
+    items.close()
+
+    text = metrics.render()
+    assert 'mp4creator_stage_errors_total{stage="work"} 1' in text
+    assert 'mp4creator_stage_seconds_count{stage="work"} 3' in text
+
+def test_timed_wraps_sync_and_async_functions():
+    metrics = Metrics()
+
+    @metrics.timed('sync')
+    def add(a, b):
+        return a + b
+
+    @metrics.timed('async')
+    async def double(value):
+        return value * 2
+
+    assert add(1, 2) == 3
+    assert asyncio.run(double(4)) == 8
+    text = metrics.render()
+    assert 'mp4creator_stage_seconds_count{stage="sync"} 1' in text
+    assert 'mp4creator_stage_seconds_count{stage="async"} 1' in text
+
+def test_metrics_route(monkeypatch):
+    metrics = Metrics()
+    metrics.inc('jobs_total')
+    monkeypatch.setattr(metrics_route, 'metrics', metrics)
+    app = FastAPI()
+    app.include_router(metrics_route.router)
+
+    response = TestClient(app).get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'text/plain; version=0.0.4; charset=utf-8'
+    assert response.text == metrics.render()
@@ -0,0 +1,93 @@
+import pytest
+from classes.mp3_frames import MP3Frames
+
+def _header(version_bits=0b10, layer_bits=0b01, bitrate_index=6, sample_rate_index=1, padding=0, channel_mode=0b11):
+    """Layer III 프레임 헤더 4바이트 (기본값: MPEG-2, 48kbps, 24kHz, 모노)"""
+    header = (0x7FF << 21) | (version_bits << 19) | (layer_bits << 17) | (1 << 16)
+    header |= (bitrate_index << 12) | (sample_rate_index << 10) | (padding << 9) | (channel_mode << 6)
+    return header.to_bytes(4, 'big')
+
+def _frame(length=144, fill=0, **kwargs):
+    return _header(**kwargs) + bytes([fill]) * (length - 4)
+
+def _xing_frame(tag=b'Xing', side_info=9, length=144, **kwargs):
+    body = b'\x00' * side_info + tag
+    return _header(**kwargs) + body + b'\x00' * (length - 4 - len(body))
+
+def _id3(payload_size):
+    size = bytes([(payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0)])
+    return b'ID3\x04\x00\x00' + size + b'\x00' * payload_size
+
+def test_mpeg2_mono_frames():
+    frames = MP3Frames(_frame() * 3)
+
+    assert frames.valid
+    assert (frames.sample_rate, frames.channels) == (24000, 1)
+    assert frames.frame_count == 3
+    assert frames.sample_count == 3 * 576
+    assert frames.duration == pytest.approx(0.072)
+
+def test_mpeg1_stereo_frame_length_and_samples():
+    # 128kbps 44.1kHz: 144 * 128000 // 44100 = 417바이트 (+ 패딩 1)
+    data = _frame(417, version_bits=0b11, bitrate_index=9, sample_rate_index=0, channel_mode=0b00)
+    data += _frame(418, version_bits=0b11, bitrate_index=9, sample_rate_index=0, padding=1, channel_mode=0b00)
+    frames = MP3Frames(data)
+
+    assert frames.valid
+    assert (frames.sample_rate, frames.channels) == (44100, 2)
+    assert frames.sample_count == 2 * 1152
+
+def test_id3v2_tag_is_skipped():
+    audio = _frame(fill=1) * 2
+    frames = MP3Frames(_id3(300) + audio)
+
+    assert frames.valid
+    assert frames.frame_count == 2
+    assert frames.audio_data == audio
+
+@pytest.mark.parametrize('tag', [b'Xing', b'Info'])
+def test_xing_info_frame_is_not_audio(tag):
+    audio = _frame(fill=1) * 2
+    frames = MP3Frames(_xing_frame(tag) + audio)
+
+    assert frames.frame_count == 2
+    assert frames.audio_data == audio
+
+def test_xing_offset_follows_side_info_size():
+    # MPEG-1 스테레오는 side info가 32바이트
+    kwargs = dict(version_bits=0b11, bitrate_index=9, sample_rate_index=0, channel_mode=0b00)
+    frames = MP3Frames(_xing_frame(side_info=32, length=417, **kwargs) + _frame(417, **kwargs))
+    assert frames.frame_count == 1
+
+    # 모노 위치에 있는 태그는 스테레오 프레임에서는 태그로 보지 않음
+    frames = MP3Frames(_xing_frame(side_info=17, length=417, **kwargs) + _frame(417, **kwargs))
+    assert frames.frame_count == 2
+
+def test_trailing_id3v1_and_truncated_frame_are_ignored():
+    frames = MP3Frames(_frame() * 2 + b'TAG' + b'\x00' * 125)
+    assert frames.frame_count == 2
+
+    frames = MP3Frames(_frame() * 2 + _frame()[:50])
+    assert frames.frame_count == 2
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'not an mp3 file',
+    _id3(20),
+    _frame()[:3],
+    _frame() + b'\x00' * 10,  # 프레임 뒤에 동기 비트가 깨짐
+    _frame(layer_bits=0b11),  # Layer I
+    _frame(bitrate_index=0),
+    _frame(bitrate_index=15),
+    _frame(sample_rate_index=3),
+    _frame(version_bits=0b01),
+    _frame() + _frame(156, sample_rate_index=0),  # 중간에 샘플레이트가 바뀜
+    _frame() + _frame(channel_mode=0b00),  # 중간에 채널 수가 바뀜
+    _xing_frame(),  # 메타 프레임만 있음
+], ids=range(13))
+def test_invalid_input(data):
+    frames = MP3Frames(data)
+
+    assert not frames.valid
+    assert frames.duration == 0.0
+    assert frames.audio_data == data
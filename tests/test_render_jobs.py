@@ -0,0 +1,123 @@
+import queue
+import asyncio
+import pytest
+from classes.render_jobs import RenderJob, RenderJobManager
+
+def _job() -> RenderJob:
+    return RenderJob({'script_text': '대본', 'script_id': '', 'output_path': '/tmp/outputs/video.mp4',
+                      'upload': False, 'filename': ''})
+
+def test_update_weights_progress_by_stage():
+    job = _job()
+    assert job.update('tts', 0.5)
+    assert job.to_dict()['progress'] == pytest.approx(0.125)
+    assert job.update('render', 0.0)
+    assert job.to_dict()['progress'] == pytest.approx(0.35)
+
+def test_update_reports_only_meaningful_changes():
+    job = _job()
+    job.update('tts', 0.5)
+    version = job.version
+    assert not job.update('tts', 0.52)
+    assert job.version == version
+    assert job.update('tts', 0.6)
+
+def test_progress_never_goes_backwards():
+    job = _job()
+    job.update('render', 0.5)
+    job.update('tts', 0.1)
+    assert job.to_dict()['progress'] == pytest.approx(0.625)
+
+def test_finish_with_result_and_with_error():
+    done = _job()
+    done.start(123)
+    done.finish({'output_path': '/tmp/outputs/video.mp4', 'subtitle_files': ['/tmp/outputs/video.vtt']})
+    data = done.to_dict()
+    assert (data['status'], data['progress']) == (RenderJob.DONE, 1.0)
+    assert data['download_url'] == '/download-video?file=video.mp4'
+    assert data['subtitle_urls'] == ['/download-video?file=video.vtt']
+    assert done.pid is None
+
+    failed = _job()
+    failed.start(123)
+    failed.finish(None, '실패')
+    assert (failed.status, failed.to_dict()['error']) == (RenderJob.ERROR, '실패')
+
+def test_cancel_queued_job_finishes_immediately():
+    job = _job()
+    job.request_cancel()
+    assert job.status == RenderJob.CANCELLED
+    assert job.finished
+
+def test_cancel_running_job_wins_over_its_result():
+    job = _job()
+    job.start(123)
+    job.request_cancel()
+    assert job.status == RenderJob.RUNNING
+    job.finish({'output_path': '/tmp/outputs/video.mp4'})
+    assert job.status == RenderJob.CANCELLED
+
+class LateQueue:
+    """기다리는 동안에는 비어 있다가 프로세스가 끝난 뒤에야 메시지가 보이는 큐"""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    def get(self, timeout=None):
+        raise queue.Empty
+
+    def get_nowait(self):
+        if not self._messages:
+            raise queue.Empty
+        return self._messages.pop(0)
+
+    def close(self):
+        pass
+
+class ExitedProcess:
+    pid = 4321
+
+    def __init__(self, exitcode: int):
+        self.exitcode = exitcode
+
+    def start(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+    def join(self):
+        pass
+
+class FakeContext:
+    def __init__(self, messages, exitcode: int = 0):
+        self._messages = messages
+        self._exitcode = exitcode
+
+    def Queue(self):
+        return LateQueue(self._messages)
+
+    def Process(self, target, args):
+        return ExitedProcess(self._exitcode)
+
+def _run(tmp_path, messages, exitcode: int = 0) -> RenderJob:
+    manager = RenderJobManager(workers=1, output_dir=str(tmp_path), max_jobs=10)
+    manager._context = FakeContext(messages, exitcode)
+    job = _job()
+    asyncio.run(manager._run(job))
+    return job
+
+def test_result_sent_just_before_exit_is_not_lost(tmp_path):
+    result = {'output_path': str(tmp_path / 'video.mp4')}
+    job = _run(tmp_path, [('progress', 'render', 1.0), ('done', result)])
+    assert job.status == RenderJob.DONE
+    assert job.to_dict()['output_path'] == result['output_path']
+
+def test_error_sent_just_before_exit_is_reported(tmp_path):
+    job = _run(tmp_path, [('error', '이미지 검색 실패')], exitcode=0)
+    assert (job.status, job.to_dict()['error']) == (RenderJob.ERROR, '이미지 검색 실패')
+
+def test_exit_without_a_message_is_an_abnormal_exit(tmp_path):
+    job = _run(tmp_path, [], exitcode=-9)
+    assert job.status == RenderJob.ERROR
+    assert 'exit code -9' in job.to_dict()['error']
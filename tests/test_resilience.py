@@ -0,0 +1,233 @@
+import asyncio
+import uuid
+import pytest
+from classes import resilience
+from classes.resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, ResilientCaller
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(resilience.time, 'monotonic', clock)
+    return clock
+
+def _fail(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.allow()
+        breaker.record_failure()
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=10)
+    _fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED
+    _fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=10)
+    _fail(breaker, 2)
+    breaker.record_success()
+    _fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 2
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    _fail(breaker, 1)
+    clock.now += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+def test_successful_probe_closes_the_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    _fail(breaker, 1)
+    clock.now += 10
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.allow()
+
+def test_failed_probe_reopens_for_another_period(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=10)
+    _fail(breaker, 5)
+    clock.now += 10
+    _fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 9
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def test_released_probe_lets_another_request_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    _fail(breaker, 1)
+    clock.now += 10
+    breaker.allow()
+    breaker.release_probe()
+    breaker.allow()
+
+def test_latency_percentile_is_per_unit_size():
+    tracker = LatencyTracker(window=3)
+    assert tracker.percentile(95) is None
+    for latency in (1.0, 2.0, 3.0, 100.0):
+        tracker.record(latency, size=2.0)
+    assert tracker.count == 3
+    assert tracker.percentile(0) == 1.0
+    assert tracker.percentile(100) == 50.0
+
+def _caller(**kwargs) -> ResilientCaller:
+    options = {'timeout': 1.0, 'max_retries': 2, 'hedge_enabled': False, 'failure_threshold': 3, 'reset_seconds': 60}
+    options.update(kwargs)
+    return ResilientCaller(f"test-{uuid.uuid4().hex}", **options)
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(resilience.random, 'uniform', lambda low, high: 0.0)
+
+def test_caller_retries_until_success(no_backoff):
+    caller = _caller()
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("일시적 오류")
+        return 'ok'
+
+    assert asyncio.run(caller.call(flaky)) == 'ok'
+    assert caller.stats['retries'] == 2
+    assert caller.breaker.state == CircuitBreaker.CLOSED
+
+def test_caller_opens_the_breaker_and_rejects(no_backoff):
+    caller = _caller(max_retries=5)
+
+    async def broken():
+        raise ConnectionError("서비스 장애")
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(caller.call(broken))
+    assert caller.stats['breaker'] == CircuitBreaker.OPEN
+    assert caller.stats['rejected'] == 1
+
+def test_caller_does_not_retry_invalid_input(no_backoff):
+    caller = _caller()
+    attempts = []
+
+    async def invalid():
+        attempts.append(1)
+        raise ValueError("잘못된 음성")
+
+    with pytest.raises(ValueError):
+        asyncio.run(caller.call(invalid))
+    assert len(attempts) == 1
+    assert caller.breaker.failures == 0
+
+def _primed(latency: float = 0.01, **kwargs) -> ResilientCaller:
+    """헤징을 시작할 만큼 지연 시간 표본이 쌓인 호출자"""
+    caller = _caller(hedge_enabled=True, hedge_percentile=95, max_retries=0, **kwargs)
+    for _ in range(ResilientCaller.MIN_HEDGE_SAMPLES):
+        caller.latency.record(latency, 1.0)
+    return caller
+
+def _requests(*delays):
+    """호출마다 정해진 시간 뒤에 몇 번째 요청인지 돌려주는 factory (취소된 요청 기록)"""
+    state = {'started': 0, 'cancelled': []}
+
+    async def request():
+        index = state['started']
+        state['started'] += 1
+        try:
+            await asyncio.sleep(delays[index])
+        except asyncio.CancelledError:
+            state['cancelled'].append(index)
+            raise
+        return index
+
+    return request, state
+
+def test_no_hedge_without_enough_samples():
+    caller = _caller(hedge_enabled=True, hedge_percentile=95)
+    request, state = _requests(0.05)
+
+    assert asyncio.run(caller.call(request)) == 0
+    assert state['started'] == 1
+    assert caller.stats['hedges'] == 0
+
+def test_slow_request_is_hedged_and_the_faster_one_wins():
+    caller = _primed()
+    request, state = _requests(5.0, 0.0)
+
+    async def run():
+        started = asyncio.get_running_loop().time()
+        result = await caller.call(request)
+        return result, asyncio.get_running_loop().time() - started
+
+    result, elapsed = asyncio.run(run())
+
+    assert result == 1
+    assert elapsed < 1.0
+    assert (caller.stats['hedges'], caller.stats['hedge_wins']) == (1, 1)
+    # 느린 첫 요청은 취소됨
+    assert state['cancelled'] == [0]
+
+def test_hedge_delay_scales_with_request_size():
+    caller = _primed(latency=0.01)
+    request, state = _requests(0.05)
+
+    # 크기 10이면 기준 지연은 0.1초라서 0.05초 요청은 헤징하지 않음
+    assert asyncio.run(caller.call(request, size=10.0)) == 0
+    assert state['started'] == 1
+    assert caller.stats['hedges'] == 0
+
+def test_primary_still_wins_when_it_finishes_first():
+    caller = _primed()
+    request, state = _requests(0.05, 5.0)
+
+    assert asyncio.run(caller.call(request)) == 0
+    assert (caller.stats['hedges'], caller.stats['hedge_wins']) == (1, 0)
+    assert state['cancelled'] == [1]
+
+def test_hedge_uses_the_request_that_succeeds():
+    caller = _primed()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise ConnectionError("첫 요청 실패")
+        await asyncio.sleep(0.1)
+        return 'hedged'
+
+    assert asyncio.run(caller.call(request)) == 'hedged'
+    assert caller.stats['hedge_wins'] == 1
+    assert caller.breaker.failures == 0
+
+def test_hedge_raises_when_every_request_fails():
+    caller = _primed()
+
+    async def request():
+        await asyncio.sleep(0.05)
+        raise ConnectionError("서비스 장애")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(caller.call(request))
+    assert caller.stats['hedges'] == 1
+    assert caller.breaker.failures == 1
+
+def test_timeout_is_counted_and_retried(no_backoff):
+    caller = _caller(timeout=0.05, max_retries=1)
+    request, state = _requests(1.0, 0.0)
+
+    assert asyncio.run(caller.call(request)) == 1
+    assert (caller.stats['timeouts'], caller.stats['retries']) == (1, 1)
@@ -0,0 +1,65 @@
+from classes.script_parser import ScriptParser, TextRun, Pause, SearchMarker
+
+def _parse(source: str):
+    return ScriptParser().parse(source)
+
+def test_voice_and_speed_apply_to_the_whole_line():
+    script = _parse("[목소리:남자1][속도:-20%]안녕하세요\n두 번째 줄")
+    first, second = script.lines
+    assert (first.voice, first.speed) == ('남자1', '-20%')
+    assert first.items == (TextRun('안녕하세요', 0, len("[목소리:남자1][속도:-20%]안녕하세요")),)
+    assert (second.voice, second.speed) == (None, None)
+    assert second.index == 1
+
+def test_first_voice_and_speed_on_a_line_win():
+    line = _parse("[VOICE:여자1]가나[목소리:남자2][SPEED:+10%][속도:-10%]다라").lines[0]
+    assert (line.voice, line.speed) == ('여자1', '+10%')
+    assert [item.text for item in line.items] == ['가나다라']
+
+def test_pause_splits_text_in_order():
+    source = "안녕하세요 [쉼:1.5] 반갑습니다"
+    line = _parse(source).lines[0]
+    pause_start = source.index('[쉼')
+    assert line.items == (
+        TextRun('안녕하세요', 0, pause_start),
+        Pause(1.5, pause_start, pause_start + len('[쉼:1.5]')),
+        TextRun('반갑습니다', pause_start + len('[쉼:1.5]'), len(source)),
+    )
+
+def test_non_numeric_pause_is_ignored():
+    line = _parse("앞 [쉼:길게] 뒤").lines[0]
+    assert [type(item) for item in line.items] == [TextRun, TextRun]
+
+def test_search_markers_are_collected_and_removed_from_text():
+    script = _parse("[검색어:고양이]고양이는 귀엽다 [GIPHY:cat]\n[GOOGLE_URL:http://x/y.png]강아지")
+    assert script.markers == [
+        SearchMarker('검색어', '고양이', 0, len('[검색어:고양이]')),
+        SearchMarker('GIPHY', 'cat', script.source.index('[GIPHY'), script.source.index('\n')),
+        SearchMarker('GOOGLE_URL', 'http://x/y.png', script.source.index('[GOOGLE_URL'),
+                     script.source.index('강아지')),
+    ]
+    assert script.search_keywords == ['고양이']
+    assert [run.text for run in script.text_runs] == ['고양이는 귀엽다', '강아지']
+
+def test_blank_lines_are_skipped_but_keep_line_indexes():
+    script = _parse("첫 줄\n\n   \n넷째 줄\n")
+    assert [line.index for line in script.lines] == [0, 3]
+    assert [run.text for run in script.text_runs] == ['첫 줄', '넷째 줄']
+
+def test_text_positions_cover_the_source_span():
+    source = "[목소리:남자1]하나\n[쉼:0.5]둘 [검색어:숫자] 셋"
+    first, second = _parse(source).text_runs
+    assert source[first.start:first.end] == "[목소리:남자1]하나"
+    # 검색어 명령어는 텍스트에서 빠지지만 위치 범위는 원문 그대로
+    assert second.text == "둘  셋"
+    assert source[second.start:second.end] == "둘 [검색어:숫자] 셋"
+
+def test_unknown_tags_stay_in_the_text():
+    line = _parse("[메모:나중에] 읽기").lines[0]
+    assert line.items[0].text == '[메모:나중에] 읽기'
+    assert line.markers == ()
+
+def test_empty_script():
+    script = _parse("")
+    assert script.lines == ()
+    assert script.markers == []
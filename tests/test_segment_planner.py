@@ -0,0 +1,97 @@
+import os
+import pytest
+from classes.segment_planner import SegmentPlanner
+from classes.mp4_merger import MP4Merger
+
+def _slides(count: int, seconds: float, extension: str = '.png'):
+    return [(f"slide{index}{extension}", seconds) for index in range(count)]
+
+def _cuts(segments):
+    return [round(segment['start'], 6) for segment in segments[1:]]
+
+def test_count_is_limited_by_workers_and_minimum_length():
+    planner = SegmentPlanner(fps=30, segments=4, min_seconds=30)
+    assert planner.count(20) == 1
+    assert planner.count(100) == 3
+    assert planner.count(600) == 4
+
+def test_cuts_fall_on_slide_boundaries_near_even_targets():
+    planner = SegmentPlanner(fps=30, segments=4, min_seconds=30)
+    segments = planner.plan(_slides(12, 10.0), [], 120.0)
+    assert _cuts(segments) == [30.0, 60.0, 90.0]
+    assert sum(segment['duration'] for segment in segments) == pytest.approx(120.0)
+    assert [len(segment['slides']) for segment in segments] == [3, 3, 3, 3]
+
+def test_cuts_avoid_the_middle_of_a_subtitle():
+    planner = SegmentPlanner(fps=30, segments=2, min_seconds=30)
+    subtitles = [{'start_time': 58.0, 'end_time': 62.0, 'text': '가운데 자막'}]
+    segments = planner.plan(_slides(12, 10.0), subtitles, 120.0)
+    cut = _cuts(segments)[0]
+    assert not 58.0 < cut < 62.0
+    assert cut in (58.0, 62.0)
+
+def test_cuts_never_split_a_video_clip():
+    planner = SegmentPlanner(fps=30, segments=2, min_seconds=30)
+    slides = [('clip.mp4', 70.0), ('still.png', 50.0)]
+    segments = planner.plan(slides, [], 120.0)
+    assert _cuts(segments) == [70.0]
+    assert segments[0]['slides'] == [('clip.mp4', 70.0)]
+
+def test_cuts_are_snapped_to_frames():
+    planner = SegmentPlanner(fps=30, segments=2, min_seconds=30)
+    segments = planner.plan([('a.png', 60.01), ('b.png', 59.99)], [], 120.0)
+    cut = segments[1]['start']
+    assert cut * 30 == pytest.approx(round(cut * 30))
+
+def test_subtitles_crossing_a_cut_are_split_and_rebased():
+    planner = SegmentPlanner(fps=30, segments=2, min_seconds=30)
+    subtitles = [{'start_time': 55.0, 'end_time': 65.0, 'text': '긴 자막'}]
+    slides = [('a.mp4', 60.0), ('b.mp4', 60.0)]
+    first, second = planner.plan(slides, subtitles, 120.0)
+    assert second['start'] == 60.0
+    assert first['subtitles'] == [{'start_time': 55.0, 'end_time': 60.0, 'text': '긴 자막'}]
+    assert second['subtitles'] == [{'start_time': 0.0, 'end_time': 5.0, 'text': '긴 자막'}]
+
+def test_short_timeline_is_one_segment():
+    segments = SegmentPlanner(fps=30, segments=8, min_seconds=30).plan(_slides(2, 5.0), [], 10.0)
+    assert len(segments) == 1
+    assert segments[0]['duration'] == 10.0
+
+def test_merger_list_escapes_quotes_and_writes_durations(tmp_path):
+    paths = []
+    for name in ("it's one.mp4", "plain.mp4"):
+        path = tmp_path / name
+        path.write_bytes(b'')
+        paths.append(str(path))
+
+    merger = MP4Merger(str(tmp_path))
+    merger.mp4_files = paths
+    merger.durations = [1.5, 2.25]
+    list_path = merger._create_ffmpeg_input_file()
+    try:
+        with open(list_path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    finally:
+        os.remove(list_path)
+
+    assert os.path.dirname(list_path) == str(tmp_path)
+    escaped = os.path.abspath(paths[0]).replace("'", "'\\''")
+    assert lines == [
+        f"file '{escaped}'",
+        "duration 1.500000",
+        f"file '{os.path.abspath(paths[1])}'",
+        "duration 2.250000",
+    ]
+    assert "it'\\''s one.mp4'" in lines[0]
+
+def test_merger_rejects_mismatched_durations(tmp_path):
+    path = tmp_path / 'a.mp4'
+    path.write_bytes(b'')
+    merger = MP4Merger(str(tmp_path))
+    merger.mp4_files = [str(path)]
+    with pytest.raises(ValueError):
+        merger.durations = [1.0, 2.0]
+
+def test_merger_requires_existing_temp_dir(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        MP4Merger(str(tmp_path / 'missing'))
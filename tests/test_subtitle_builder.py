@@ -0,0 +1,113 @@
+import pytest
+from classes.subtitle_builder import SubtitleBuilder
+
+TEXT = "안녕하세요, 반갑습니다. 오늘은 날씨가 좋네요."
+BOUNDARIES = [
+    {'offset': 0.0, 'duration': 0.5, 'text': '안녕하세요'},
+    {'offset': 0.7, 'duration': 0.5, 'text': '반갑습니다'},
+    {'offset': 1.4, 'duration': 0.3, 'text': '오늘은'},
+    {'offset': 1.8, 'duration': 0.3, 'text': '날씨가'},
+    {'offset': 2.2, 'duration': 0.4, 'text': '좋네요'},
+]
+
+def _builder(mode: str = 'phrase', max_chars: int = 20, max_duration: float = 3.0) -> SubtitleBuilder:
+    return SubtitleBuilder(mode=mode, max_chars=max_chars, max_duration=max_duration)
+
+def _cues(cues):
+    return [(round(cue['start_time'], 3), round(cue['end_time'], 3), cue['text']) for cue in cues]
+
+def test_phrase_mode_splits_at_punctuation_and_keeps_it():
+    cues = _builder().build(TEXT, BOUNDARIES, 10.0, 13.0)
+    assert _cues(cues) == [
+        (10.0, 10.7, '안녕하세요,'),
+        (10.7, 11.4, '반갑습니다.'),
+        (11.4, 13.0, '오늘은 날씨가 좋네요.'),
+    ]
+
+def test_cues_are_contiguous_and_cover_the_segment():
+    cues = _builder(mode='word').build(TEXT, BOUNDARIES, 5.0, 8.0)
+    assert cues[0]['start_time'] == 5.0
+    assert cues[-1]['end_time'] == 8.0
+    for current, following in zip(cues, cues[1:]):
+        assert current['end_time'] == following['start_time']
+
+def test_phrase_mode_respects_max_chars():
+    cues = _builder(max_chars=5).build(TEXT, BOUNDARIES, 0.0, 3.0)
+    assert [cue['text'] for cue in cues] == ['안녕하세요,', '반갑습니다.', '오늘은', '날씨가', '좋네요.']
+
+def test_phrase_mode_respects_max_duration():
+    cues = _builder(max_duration=0.6).build("오늘은 날씨가 좋네요", BOUNDARIES[2:], 0.0, 3.0)
+    assert [cue['text'] for cue in cues] == ['오늘은', '날씨가', '좋네요']
+
+def test_word_mode_gives_one_cue_per_boundary():
+    cues = _builder(mode='word').build(TEXT, BOUNDARIES, 0.0, 3.0)
+    assert len(cues) == len(BOUNDARIES)
+    assert cues[2]['text'] == '오늘은'
+
+def test_segment_mode_and_missing_boundaries_give_one_cue():
+    expected = [{'start_time': 1.0, 'end_time': 2.0, 'text': TEXT}]
+    assert _builder(mode='segment').build(TEXT, BOUNDARIES, 1.0, 2.0) == expected
+    assert _builder().build(TEXT, [], 1.0, 2.0) == expected
+
+def test_words_missing_from_text_fall_back_to_boundary_text():
+    boundaries = [
+        {'offset': 0.0, 'duration': 0.4, 'text': '하나'},
+        {'offset': 0.5, 'duration': 0.4, 'text': 'two'},
+    ]
+    cues = _builder().build("하나 둘", boundaries, 0.0, 1.0)
+    assert [cue['text'] for cue in cues] == ['하나 two']
+
+def test_cue_end_never_precedes_start():
+    boundaries = [{'offset': 0.0, 'duration': 0.2, 'text': '끝'}, {'offset': 5.0, 'duration': 0.2, 'text': '말'}]
+    cues = _builder(mode='word').build("끝 말", boundaries, 0.0, 1.0)
+    assert all(cue['end_time'] >= cue['start_time'] for cue in cues)
+    assert cues[0]['end_time'] == 1.0
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        _builder(mode='sentence')
+    with pytest.raises(ValueError):
+        _builder(max_chars=0)
+    with pytest.raises(ValueError):
+        _builder(max_duration=0)
+
+PARTS = [
+    {'type': 'text', 'content': '안녕하세요.'},
+    {'type': 'pause', 'duration': 1.0},
+    {'type': 'text', 'content': '반갑습니다.'},
+]
+
+def test_build_parts_leaves_pauses_without_subtitles():
+    boundaries = [
+        {'offset': 0.0, 'duration': 0.5, 'text': '안녕하세요'},
+        {'offset': 1.6, 'duration': 0.5, 'text': '반갑습니다'},
+    ]
+    cues = _builder().build_parts(PARTS, boundaries, 2.0, 4.5)
+    assert _cues(cues) == [
+        (2.0, 2.5, '안녕하세요.'),
+        (3.6, 4.5, '반갑습니다.'),
+    ]
+
+def test_build_parts_splits_each_part_like_a_separate_segment():
+    parts = [
+        {'type': 'text', 'content': '하나, 둘.'},
+        {'type': 'pause', 'duration': 0.5},
+        {'type': 'text', 'content': '셋, 넷.'},
+    ]
+    boundaries = [
+        {'offset': 0.0, 'duration': 0.3, 'text': '하나'},
+        {'offset': 0.4, 'duration': 0.3, 'text': '둘'},
+        {'offset': 1.3, 'duration': 0.3, 'text': '셋'},
+        {'offset': 1.7, 'duration': 0.3, 'text': '넷'},
+    ]
+    cues = _builder().build_parts(parts, boundaries, 0.0, 2.2)
+    assert _cues(cues) == [
+        (0.0, 0.4, '하나,'),
+        (0.4, 0.7, '둘.'),
+        (1.3, 1.7, '셋,'),
+        (1.7, 2.2, '넷.'),
+    ]
+
+def test_build_parts_without_boundaries_gives_one_cue():
+    cues = _builder().build_parts(PARTS, [], 1.0, 3.0)
+    assert cues == [{'start_time': 1.0, 'end_time': 3.0, 'text': '안녕하세요. 반갑습니다.'}]
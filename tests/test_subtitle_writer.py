@@ -0,0 +1,64 @@
+import pytest
+from classes.subtitle_writer import SubtitleWriter
+
+SUBTITLES = [
+    {'start_time': 0.0, 'end_time': 1.25, 'text': '첫 줄'},
+    {'start': 3599.5, 'end': 3723.4567, 'text': '한 시간 넘게\n\n이어지는 자막'},
+    {'start_time': 5.0, 'end_time': 5.0, 'text': '길이 없음'},
+    {'start_time': 6.0, 'end_time': 7.0, 'text': '   '},
+]
+
+@pytest.mark.parametrize('seconds, srt, vtt, ass', [
+    (0.0, '00:00:00,000', '00:00:00.000', '0:00:00.00'),
+    (1.2344, '00:00:01,234', '00:00:01.234', '0:00:01.23'),
+    (59.9995, '00:01:00,000', '00:01:00.000', '0:01:00.00'),
+    (59.996, '00:00:59,996', '00:00:59.996', '0:01:00.00'),
+    (3599.9996, '01:00:00,000', '01:00:00.000', '1:00:00.00'),
+    (3723.4567, '01:02:03,457', '01:02:03.457', '1:02:03.46'),
+    (360000.0, '100:00:00,000', '100:00:00.000', '100:00:00.00'),
+    (-0.5, '00:00:00,000', '00:00:00.000', '0:00:00.00'),
+])
+def test_timestamps(seconds, srt, vtt, ass):
+    assert SubtitleWriter.srt_time(seconds) == srt
+    assert SubtitleWriter._clock_time(seconds, '.') == vtt
+    assert SubtitleWriter._ass_time(seconds) == ass
+
+def test_srt_uses_comma_and_skips_empty_cues():
+    assert SubtitleWriter().to_srt(SUBTITLES) == (
+        "1\n00:00:00,000 --> 00:00:01,250\n첫 줄\n"
+        "\n"
+        "2\n00:59:59,500 --> 01:02:03,457\n한 시간 넘게\n이어지는 자막\n"
+    )
+
+def test_vtt_uses_dot_and_escapes_markup():
+    subtitles = SUBTITLES + [{'start_time': 8.0, 'end_time': 9.0, 'text': 'a --> b & <i>c</i>'}]
+    vtt = SubtitleWriter(position_ratio=0.75).to_vtt(subtitles)
+
+    assert vtt.startswith("WEBVTT\n\n")
+    assert "00:00:00.000 --> 00:00:01.250 line:75% align:center\n첫 줄\n" in vtt
+    assert "00:59:59.500 --> 01:02:03.457 line:75% align:center\n한 시간 넘게\n이어지는 자막\n" in vtt
+    assert "a --&gt; b &amp; &lt;i&gt;c&lt;/i&gt;\n" in vtt
+    assert all(',' not in line for line in vtt.splitlines() if ' --> ' in line and 'line:' in line)
+
+def test_ass_escapes_braces_backslashes_and_newlines():
+    subtitles = [{'start_time': 1.0, 'end_time': 2.0, 'text': '{\\b1}굵게\r\n다음 줄\n끝'}]
+    ass = SubtitleWriter().to_ass(subtitles)
+
+    dialogue = ass.splitlines()[-1]
+    assert dialogue == "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,｛＼b1｝굵게\\N다음 줄\\N끝"
+
+def test_ass_style_follows_size_and_position():
+    ass = SubtitleWriter(width=1280, height=720, font='Test Font', font_size=40, position_ratio=0.5).to_ass([])
+
+    assert "PlayResX: 1280" in ass
+    assert "PlayResY: 720" in ass
+    assert "Style: Default,Test Font,40," in ass
+    assert ass.splitlines()[-1].startswith("Format: Layer")
+    assert ",8,10,10,360,1" in ass
+
+def test_write_files_as_utf8(tmp_path):
+    writer = SubtitleWriter()
+    for write, suffix in ((writer.write_srt, '.srt'), (writer.write_vtt, '.vtt'), (writer.write_ass, '.ass')):
+        path = write(SUBTITLES, str(tmp_path / f'sub{suffix}'))
+        with open(path, encoding='utf-8') as f:
+            assert '첫 줄' in f.read()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from classes.time_stretch import TimeStretcher
+
+SAMPLE_RATE = 24000
+
+def _sine(seconds: float, frequency: float = 220.0, channels: int = 1) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    wave = 8000 * np.sin(2 * np.pi * frequency * t)
+    return wave if channels == 1 else np.stack([wave] * channels, axis=1)
+
+def _dominant_frequency(samples: np.ndarray) -> float:
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    return np.fft.rfftfreq(len(samples), 1 / SAMPLE_RATE)[np.argmax(spectrum)]
+
+@pytest.mark.parametrize('speed', [0.5, 0.8, 1.25, 1.5, 2.0, 2.5])
+def test_output_length_matches_speed(speed):
+    samples = _sine(1.3)
+    stretched = TimeStretcher().stretch(samples, SAMPLE_RATE, speed)
+    assert len(stretched) == int(round(len(samples) / speed))
+
+def test_channels_are_preserved():
+    stretched = TimeStretcher().stretch(_sine(0.5, channels=2), SAMPLE_RATE, 1.5)
+    assert stretched.shape == (int(round(SAMPLE_RATE * 0.5 / 1.5)), 2)
+
+def test_pitch_is_preserved():
+    stretched = TimeStretcher().stretch(_sine(1.0, 440.0), SAMPLE_RATE, 1.6)
+    assert abs(_dominant_frequency(stretched) - 440.0) < 5.0
+
+def test_unit_speed_and_empty_input_return_copies():
+    stretcher = TimeStretcher()
+    samples = _sine(0.1)
+    same = stretcher.stretch(samples, SAMPLE_RATE, 1.0)
+    assert np.array_equal(same, samples.astype(np.float32))
+    assert stretcher.stretch(np.zeros(0), SAMPLE_RATE, 2.0).shape == (0,)
+
+def test_stretch_segment_keeps_format():
+    data = np.rint(_sine(1.0, channels=2)).astype(np.int16).tobytes()
+    segment = AudioSegment(data=data, sample_width=2, frame_rate=SAMPLE_RATE, channels=2)
+    stretched = TimeStretcher().stretch_segment(segment, 2.0)
+    assert (stretched.frame_rate, stretched.channels, stretched.sample_width) == (SAMPLE_RATE, 2, 2)
+    assert int(stretched.frame_count()) == SAMPLE_RATE // 2
+    assert TimeStretcher().stretch_segment(segment, 1.0) is segment
+
+def test_invalid_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        TimeStretcher().stretch(_sine(0.1), SAMPLE_RATE, 0)
+    with pytest.raises(ValueError):
+        TimeStretcher(frame_ms=0)
+    with pytest.raises(ValueError):
+        TimeStretcher(tolerance_ms=-1)
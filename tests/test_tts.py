@@ -0,0 +1,235 @@
+import os
+import shutil
+import wave
+import asyncio
+import pytest
+from pydub import AudioSegment
+from classes.tts import TextToSpeech
+from classes.duration_estimator import DurationEstimator
+
+@pytest.fixture
+def tts(tmp_path):
+    tts = TextToSpeech(output_dir=str(tmp_path / 'outputs'))
+    tts.cache = None
+    tts.duration_estimator = DurationEstimator(str(tmp_path / 'duration_model.json'))
+    return tts
+
+@pytest.mark.parametrize('speed', ['0', '-1', '0.0'])
+def test_legacy_non_positive_speed_is_clamped(tts, speed):
+    plan = tts._build_plan(tts.parser.parse(f"[속도:{speed}]천천히 읽기"))
+    assert plan[0]['rate'] == '-50%'
+    assert plan[0]['speed_multiplier'] == pytest.approx(0.2)
+
+def test_finalize_segment_with_legacy_zero_speed(tts):
+    item = tts._build_plan(tts.parser.parse("[속도:0]천천히"))[0]
+    fetched = {'boundaries': [{'offset': 0.1, 'duration': 0.2, 'text': '천천히'}], 'cache_key': 'unused'}
+    audio = AudioSegment.silent(duration=400, frame_rate=24000)
+
+    asyncio.run(tts._finalize_segment(item, fetched, audio))
+
+    assert len(fetched['audio']) == pytest.approx(2000, abs=5)
+    assert fetched['boundaries'][0]['offset'] == pytest.approx(0.5)
+    assert fetched['boundaries'][0]['duration'] == pytest.approx(1.0)
+
+def test_fast_speed_beyond_edge_rate_is_stretched(tts):
+    item = tts._build_plan(tts.parser.parse("[속도:5]빠르게"))[0]
+    assert item['rate'] == '+100%'
+    assert item['speed_multiplier'] == pytest.approx(1.5)
+
+# MPEG-2 Layer III, 48kbps, 24kHz, 모노 프레임 (576샘플, 144바이트)
+_FRAME = b'\xff\xf3\x64\xc0' + b'\x00' * 140
+
+def _fake_decoder(calls):
+    """디코더 지연(529샘플)만큼 밀린 PCM을 돌려주는 가짜 ffmpeg 디코딩 (프레임마다 프레임 번호를 값으로 씀)"""
+    async def decode(mp3_data, sample_rate, channels):
+        calls.append(len(mp3_data) // len(_FRAME))
+        frame_values = list(mp3_data[4::len(_FRAME)])
+        pcm = b''.join(bytes([value, 0]) * 576 for value in frame_values)
+        pcm = (b'\x00\x00' * 529 + pcm)[:len(pcm)]
+        return AudioSegment(data=pcm, sample_width=2, frame_rate=sample_rate, channels=channels)
+    return decode
+
+def _frames(*values):
+    return b''.join(_FRAME[:4] + bytes([value]) + _FRAME[5:] for value in values)
+
+def test_decode_batch_removes_decoder_delay(tts, monkeypatch):
+    calls = []
+    monkeypatch.setattr(tts, '_run_ffmpeg_decode', _fake_decoder(calls))
+
+    decoded = asyncio.run(tts._decode_batch([_frames(1, 2), _frames(3)]))
+
+    assert calls == [3]
+    assert decoded[0].raw_data == b'\x01\x00' * 576 + b'\x02\x00' * 576
+    # 마지막 세그먼트는 디코더 지연만큼 모자란 끝을 무음으로 채움
+    assert decoded[1].raw_data == b'\x03\x00' * (576 - 529) + b'\x00\x00' * 529
+
+def test_finalize_in_order_bounds_decode_batches(tts, monkeypatch):
+    calls = []
+    monkeypatch.setattr(tts, '_run_ffmpeg_decode', _fake_decoder(calls))
+    monkeypatch.setattr('classes.tts._DECODE_BATCH_SECONDS', 0.05)
+    items = tts._build_plan(tts.parser.parse("하나\n둘\n셋"))
+    cached = AudioSegment.silent(duration=10, frame_rate=24000)
+
+    async def run():
+        async def done(result):
+            return result
+        tasks = [
+            asyncio.ensure_future(done({'mp3': _frames(1, 2), 'boundaries': [], 'cache_key': 'a'})),
+            asyncio.ensure_future(done({'audio': cached, 'boundaries': []})),
+            asyncio.ensure_future(done({'mp3': _frames(3, 4), 'boundaries': [], 'cache_key': 'c'})),
+        ]
+        segments = [segment async for segment in tts._finalize_in_order(items, tasks)]
+        return segments, [task.result() for task in tasks]
+
+    segments, results = asyncio.run(run())
+
+    # 48ms 묶음 제한이라 새 세그먼트는 각각 따로 디코딩되고 캐시 적중은 디코딩하지 않음
+    assert calls == [2, 2]
+    assert [len(segment['audio']) for segment in segments] == [48, 10, 48]
+    assert segments[0]['audio'].raw_data[:2] == b'\x01\x00'
+    assert segments[2]['audio'].raw_data[:2] == b'\x03\x00'
+    # 내보낸 세그먼트는 작업 결과에서 해제됨
+    assert results == [{}, {}, {}]
+
+def _fake_fetch(tts, lines, delays, fail=None):
+    """
+    Edge-TTS 대신 delays초 뒤에 줄 번호(1부터)를 프레임 값으로 담은 MP3를 돌려주는 가짜 합성
+
+    동시 실행 수, 시작 순서, 취소된 항목을 기록한다.
+    """
+    log = {'running': 0, 'peak': 0, 'started': [], 'cancelled': []}
+
+    async def fetch(item, semaphore):
+        content = item['content']
+        async with semaphore:
+            log['started'].append(content)
+            log['running'] += 1
+            log['peak'] = max(log['peak'], log['running'])
+            try:
+                await asyncio.sleep(delays[content])
+                if content == fail:
+                    raise RuntimeError(f"{content} 합성 실패")
+            except asyncio.CancelledError:
+                log['cancelled'].append(content)
+                raise
+            finally:
+                log['running'] -= 1
+        return {'mp3': _frames(lines.index(content) + 1), 'boundaries': [], 'cache_key': content}
+
+    tts._fetch_segment = fetch
+    return log
+
+def _text_items(tts, lines):
+    return [item for item in tts._build_plan(tts.parser.parse('\n'.join(lines))) if item['type'] == 'text']
+
+def test_synthesize_all_keeps_input_order_under_max_concurrency(tts, monkeypatch):
+    monkeypatch.setattr(tts, '_run_ffmpeg_decode', _fake_decoder([]))
+    lines = ['짧음', '조금 더 긴 문장입니다', '중간 길이 문장', '가장 길게 읽어야 하는 아주 긴 문장입니다']
+    items = _text_items(tts, lines)
+    tts.set_concurrency(2)
+    # 앞 줄일수록 늦게 끝남
+    log = _fake_fetch(tts, lines, {line: 0.04 - 0.01 * index for index, line in enumerate(lines)})
+
+    async def run():
+        return [segment async for segment in tts._synthesize_all(items)]
+
+    segments = asyncio.run(run())
+
+    assert log['peak'] == 2
+    # 예상 길이가 긴 항목부터 요청
+    assert log['started'][:2] == [lines[3], lines[1]]
+    assert [segment['audio'].raw_data[0] for segment in segments] == [1, 2, 3, 4]
+    assert log['cancelled'] == []
+
+def test_synthesize_all_cancels_remaining_tasks_on_failure(tts, monkeypatch):
+    monkeypatch.setattr(tts, '_run_ffmpeg_decode', _fake_decoder([]))
+    lines = ['첫째 줄은 오래 걸림', '둘째', '셋째', '넷째']
+    items = _text_items(tts, lines)
+    tts.set_concurrency(4)
+    log = _fake_fetch(tts, lines, {lines[0]: 10.0, lines[1]: 10.0, lines[2]: 0.01, lines[3]: 10.0}, fail=lines[2])
+
+    async def run():
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(RuntimeError, match='셋째 합성 실패'):
+            async for _ in tts._synthesize_all(items):
+                pass
+        return asyncio.get_running_loop().time() - started
+
+    elapsed = asyncio.run(run())
+
+    # 앞 항목이 끝나기를 기다리지 않고 바로 실패하고 나머지는 취소됨
+    assert elapsed < 1.0
+    assert sorted(log['cancelled']) == sorted([lines[0], lines[1], lines[3]])
+    assert log['running'] == 0
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg가 없음')
+
+@pytest.fixture
+def offline_tts(tts, monkeypatch):
+    """가짜 합성/디코딩과 실제 ffmpeg 인코더로 조립하는 변환기 (wav 출력)"""
+    monkeypatch.setattr(AudioSegment, 'converter', shutil.which('ffmpeg') or 'ffmpeg')
+    monkeypatch.setattr(tts, '_run_ffmpeg_decode', _fake_decoder([]))
+    tts.set_output_format('wav')
+    return tts
+
+SCRIPT_LINES = ['첫 번째 문장', '[쉼:0.5]', '두 번째 문장']
+
+@requires_ffmpeg
+def test_convert_stream_event_order(offline_tts):
+    lines = [SCRIPT_LINES[0], SCRIPT_LINES[2]]
+    _fake_fetch(offline_tts, lines, {lines[0]: 0.02, lines[1]: 0.0})
+
+    async def run():
+        return [event async for event in offline_tts.convert_stream('\n'.join(SCRIPT_LINES))]
+
+    events = asyncio.run(run())
+
+    assert [event['type'] for event in events] == ['start', 'segment', 'pause', 'segment', 'done']
+    assert (events[0]['segments'], events[0]['items']) == (2, 3)
+    first, pause, second = events[1:4]
+    assert (first['index'], first['start_time'], first['format']) == (0, 0.0, 'mp3')
+    assert first['duration'] == pytest.approx(0.024)
+    assert (pause['index'], pause['start_time'], pause['duration']) == (1, pytest.approx(0.024), 0.5)
+    assert (second['index'], second['start_time']) == (2, pytest.approx(0.524))
+    done = events[-1]
+    assert done['success'] and done['duration'] == pytest.approx(0.548)
+    assert os.path.exists(done['audio_path'])
+
+def test_convert_stream_reports_single_error(tts):
+    lines = [SCRIPT_LINES[0], SCRIPT_LINES[2]]
+    log = _fake_fetch(tts, lines, {lines[0]: 10.0, lines[1]: 0.0}, fail=lines[1])
+
+    async def run():
+        events = []
+        async for event in tts.convert_stream('\n'.join(lines)):
+            events.append(event)
+        return events
+
+    events = asyncio.run(run())
+
+    assert [event['type'] for event in events] == ['start', 'error']
+    assert '두 번째 문장 합성 실패' in events[-1]['error']
+    assert log['cancelled'] == [lines[0]]
+
+def test_convert_stream_rejects_empty_text(tts):
+    async def run():
+        return [event async for event in tts.convert_stream('   ')]
+
+    assert [event['type'] for event in asyncio.run(run())] == ['error']
+
+@requires_ffmpeg
+def test_convert_assembles_segments_and_pauses(offline_tts):
+    lines = [SCRIPT_LINES[0], SCRIPT_LINES[2]]
+    _fake_fetch(offline_tts, lines, {lines[0]: 0.02, lines[1]: 0.0})
+
+    result = asyncio.run(offline_tts.convert('\n'.join(SCRIPT_LINES)))
+
+    assert result['success'], result.get('error')
+    assert result['duration'] == pytest.approx(0.548)
+    with wave.open(result['audio_path'], 'rb') as wav_file:
+        assert wav_file.getnframes() == 576 + 12000 + 576
+        pcm = wav_file.readframes(wav_file.getnframes())
+    # 첫 세그먼트(1), 쉼(무음), 두 번째 세그먼트(2) 순서, 마지막은 디코더 지연만큼 무음
+    assert pcm[:2] == b'\x01\x00'
+    assert pcm[1152:1152 + 24000] == b'\x00' * 24000
+    assert pcm[1152 + 24000:1152 + 24002] == b'\x02\x00'
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from classes.tts_batch import TTSBatchJob, TTSBatchManager
+
+@pytest.fixture
+def runs(monkeypatch):
+    """합성 대신 실행 순서만 기록하는 가짜 변환 (텍스트에 '실패'가 있으면 실패)"""
+    order = []
+
+    async def run(job):
+        order.append(job._text)
+        await asyncio.sleep(0)
+        if '실패' in job._text:
+            return {'success': False, 'error': '합성 실패'}
+        return {'success': True, 'audio_path': f'outputs/{job.id}.mp3', 'audio_format': 'mp3',
+                'duration': 1.0, 'subtitles': []}
+
+    monkeypatch.setattr(TTSBatchJob, 'run', run)
+    return order
+
+def _manager(tmp_path, workers=1, max_jobs=100):
+    return TTSBatchManager(workers=workers, output_dir=str(tmp_path / 'outputs'), max_jobs=max_jobs)
+
+async def _wait(manager, batch_id):
+    jobs = manager.get_batch(batch_id)
+    async for _ in manager.subscribe([job.id for job in jobs], keepalive=1.0):
+        pass
+
+def test_batch_runs_shortest_first_and_keeps_input_order(tmp_path, runs):
+    texts = ['가' * 200, '가' * 5, '가' * 50]
+
+    async def scenario():
+        manager = _manager(tmp_path)
+        batch = await manager.submit([{'text': text} for text in texts])
+        await _wait(manager, batch['batch_id'])
+        await manager.shutdown()
+        return batch, manager.batch_status(batch['batch_id'])
+
+    batch, status = asyncio.run(scenario())
+
+    estimates = [job['estimated_duration'] for job in batch['jobs']]
+    assert estimates[1] < estimates[2] < estimates[0]
+    assert runs == [texts[1], texts[2], texts[0]]
+    assert [job['job_id'] for job in status['jobs']] == [job['job_id'] for job in batch['jobs']]
+    assert (status['total'], status['finished'], status['failed']) == (3, 3, 0)
+
+@pytest.mark.parametrize('items', [
+    [],
+    [{'text': '  '}],
+    [{'text': '정상'}, 'not a dict'],
+    [{'text': '정상', 'output_format': 'ogg'}],
+    [{'text': '정상', 'pause': 'long'}],
+])
+def test_invalid_items_are_rejected_before_creating_jobs(tmp_path, items, monkeypatch):
+    monkeypatch.setattr(TTSBatchManager, '_create_job', lambda *args: pytest.fail('작업을 만들면 안 됨'))
+    manager = _manager(tmp_path)
+
+    with pytest.raises((ValueError, TypeError)):
+        asyncio.run(manager.submit(items))
+    assert manager.stats[TTSBatchJob.QUEUED] == 0
+
+def test_evict_removes_oldest_finished_batches(tmp_path, runs):
+    async def scenario():
+        manager = _manager(tmp_path, max_jobs=3)
+        first = await manager.submit([{'text': '하나'}, {'text': '둘'}])
+        await _wait(manager, first['batch_id'])
+        second = await manager.submit([{'text': '셋'}])
+        await _wait(manager, second['batch_id'])
+        # 보관 수(3)를 넘으면 끝난 첫 일괄 요청이 지워짐
+        third = await manager.submit([{'text': '넷'}])
+        evicted = manager.get_batch(first['batch_id']) is None
+        kept = manager.get_batch(second['batch_id']) is not None and manager.get_batch(third['batch_id']) is not None
+        await manager.shutdown()
+        return evicted, kept
+
+    assert asyncio.run(scenario()) == (True, True)
+
+def test_evict_keeps_unfinished_batches(tmp_path, monkeypatch):
+    async def blocked(job):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(TTSBatchJob, 'run', blocked)
+
+    async def scenario():
+        manager = _manager(tmp_path, max_jobs=1)
+        first = await manager.submit([{'text': '하나'}])
+        second = await manager.submit([{'text': '둘'}])
+        kept = [manager.get_batch(first['batch_id']), manager.get_batch(second['batch_id'])]
+        await manager.shutdown()
+        return kept
+
+    assert all(jobs is not None for jobs in asyncio.run(scenario()))
+
+def test_subscribe_sends_each_state_change(tmp_path, runs):
+    async def scenario():
+        manager = _manager(tmp_path)
+        batch = await manager.submit([{'text': '성공'}, {'text': '실패'}])
+        job_ids = [job['job_id'] for job in batch['jobs']]
+        events = [event async for event in manager.subscribe(job_ids, keepalive=1.0) if event]
+        await manager.shutdown()
+        return job_ids, events
+
+    job_ids, events = asyncio.run(scenario())
+
+    for job_id, final in zip(job_ids, (TTSBatchJob.DONE, TTSBatchJob.ERROR)):
+        statuses = [event['status'] for event in events if event['job_id'] == job_id]
+        assert statuses[0] == TTSBatchJob.QUEUED
+        assert statuses[-1] == final
+        assert statuses == sorted(statuses, key=[TTSBatchJob.QUEUED, TTSBatchJob.RUNNING, final].index)
+    failed = [event for event in events if event['status'] == TTSBatchJob.ERROR]
+    assert failed[0]['error'] == '합성 실패'
+    assert 'download_url' in [event for event in events if event['status'] == TTSBatchJob.DONE][0]
+
+def test_shutdown_stops_workers(tmp_path, runs):
+    async def scenario():
+        manager = _manager(tmp_path, workers=2)
+        await manager.submit([{'text': '하나'}])
+        tasks = list(manager._tasks)
+        await manager.shutdown()
+        return tasks, manager._tasks
+
+    tasks, remaining = asyncio.run(scenario())
+    assert all(task.cancelled() for task in tasks)
+    assert remaining == []
@@ -0,0 +1,94 @@
+import os
+import threading
+from pydub import AudioSegment
+from classes.tts_cache import TTSCache
+
+def _segment(milliseconds: int) -> AudioSegment:
+    return AudioSegment.silent(duration=milliseconds, frame_rate=24000)
+
+def _age(cache: TTSCache, key: str, seconds: float) -> None:
+    """항목의 최근 사용 시각을 seconds초 전으로 옮김"""
+    path = os.path.join(cache.cache_dir, f"{key}.wav")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+def test_make_key_depends_on_inputs_and_version(monkeypatch):
+    key = TTSCache.make_key('안녕하세요', 'ko-KR-InJoonNeural', '+0%', 1.0)
+    assert key == TTSCache.make_key('안녕하세요', 'ko-KR-InJoonNeural', '+0%', 1.00001)
+    assert key != TTSCache.make_key('안녕하세요', 'ko-KR-SunHiNeural', '+0%', 1.0)
+    assert key != TTSCache.make_key('안녕하세요', 'ko-KR-InJoonNeural', '+10%', 1.0)
+
+    monkeypatch.setattr(TTSCache, 'VERSION', TTSCache.VERSION + 1)
+    assert key != TTSCache.make_key('안녕하세요', 'ko-KR-InJoonNeural', '+0%', 1.0)
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = TTSCache(cache_dir=str(tmp_path), max_size_mb=10)
+    segment = _segment(500)
+    cache.put('a', segment, {'boundaries': [{'offset': 0.1}]})
+
+    cached = cache.get('a')
+    assert cached.raw_data == segment.raw_data
+    assert cached.frame_rate == 24000
+    assert cache.get_meta('a') == {'boundaries': [{'offset': 0.1}]}
+    assert cache.get('missing') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_overwrite_does_not_double_count_size(tmp_path):
+    cache = TTSCache(cache_dir=str(tmp_path), max_size_mb=10)
+    cache.put('a', _segment(1000))
+    size = cache.stats['size_bytes']
+
+    cache.put('a', _segment(1000))
+    assert cache.stats['size_bytes'] == size
+    assert cache.stats['entries'] == 1
+
+def test_eviction_removes_oldest_entry_and_its_metadata(tmp_path):
+    one_second = len(_segment(1000).raw_data)
+    cache = TTSCache(cache_dir=str(tmp_path), max_size_mb=2.5 * one_second / 1024 / 1024)
+    cache.put('old', _segment(1000), {'text': 'old'})
+    _age(cache, 'old', 60)
+    cache.put('recent', _segment(1000), {'text': 'recent'})
+    _age(cache, 'recent', 30)
+
+    cache.put('new', _segment(1000))
+
+    assert cache.get('old') is None
+    assert not os.path.exists(tmp_path / 'old.json')
+    assert cache.get('recent') is not None
+    assert cache.get('new') is not None
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['entries'] == 2
+
+def test_entry_just_written_is_never_evicted(tmp_path):
+    cache = TTSCache(cache_dir=str(tmp_path), max_size_mb=0.001)
+    cache.put('big', _segment(1000))
+    assert cache.get('big') is not None
+
+def test_size_is_shared_between_instances(tmp_path):
+    first = TTSCache(cache_dir=str(tmp_path), max_size_mb=10)
+    first.put('a', _segment(200))
+    second = TTSCache(cache_dir=str(tmp_path), max_size_mb=10)
+    assert second.stats['size_bytes'] == first.stats['size_bytes'] > 0
+
+def test_concurrent_puts_of_same_key_do_not_collide(tmp_path):
+    cache = TTSCache(cache_dir=str(tmp_path), max_size_mb=10)
+    segments = [_segment(200 + 10 * index) for index in range(8)]
+    errors = []
+
+    def put(segment):
+        try:
+            for _ in range(20):
+                cache.put('same', segment, {'boundaries': [{'offset': len(segment)}]})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=put, args=(segment,)) for segment in segments]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+    assert cache.get('same').raw_data in [segment.raw_data for segment in segments]
+    assert cache.get_meta('same')['boundaries'][0]['offset'] in [len(segment) for segment in segments]
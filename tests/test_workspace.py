@@ -0,0 +1,81 @@
+import os
+import tempfile
+import pytest
+from classes.workspace import Workspace, WorkspaceQuotaError
+
+def _write(path: str, size: int) -> None:
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+
+def _leftover(root, name: str, locked: bool = False, age: float = 0.0) -> str:
+    """다른 프로세스가 남긴 것 같은 작업 공간 디렉토리"""
+    path = root / f"{Workspace.PREFIX}{name}"
+    path.mkdir()
+    if locked:
+        (path / Workspace.LOCK_NAME).write_text('0')
+    if age:
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime - age, stat.st_mtime - age))
+    return str(path)
+
+def test_files_live_inside_the_workspace_until_close(tmp_path):
+    workspace = Workspace(root=str(tmp_path), quota_mb=0)
+    path = workspace.file('.wav', prefix='tts_')
+    assert os.path.dirname(path) == workspace.path
+    assert os.path.basename(path).startswith('tts_') and path.endswith('.wav')
+    _write(path, 10)
+
+    directory = workspace.path
+    workspace.close()
+    workspace.close()
+    assert not os.path.exists(directory)
+    with pytest.raises(RuntimeError):
+        workspace.path
+
+def test_check_raises_when_quota_is_exceeded(tmp_path):
+    with Workspace(root=str(tmp_path), quota_mb=1 / 1024) as workspace:
+        _write(workspace.file('.bin'), 512)
+        assert workspace.check() >= 512
+        _write(workspace.file('.bin'), 1024)
+        with pytest.raises(WorkspaceQuotaError):
+            workspace.check()
+        assert workspace.stats['peak_bytes'] >= 1536
+
+def test_peak_usage_is_kept_after_files_are_removed(tmp_path):
+    with Workspace(root=str(tmp_path), quota_mb=0) as workspace:
+        path = workspace.file('.bin')
+        _write(path, 4096)
+        workspace.check()
+        os.remove(path)
+        stats = workspace.stats
+        assert stats['usage_bytes'] < 4096 <= stats['peak_bytes']
+
+def test_zero_quota_is_unlimited(tmp_path):
+    with Workspace(root=str(tmp_path), quota_mb=0) as workspace:
+        _write(workspace.file('.bin'), 64 * 1024)
+        workspace.check()
+
+def test_sweep_removes_only_orphaned_workspaces(tmp_path):
+    live = Workspace(root=str(tmp_path), quota_mb=0)
+    try:
+        crashed = _leftover(tmp_path, '1_crashed', locked=True)
+        stale = _leftover(tmp_path, '2_stale', age=Workspace.GRACE_SECONDS + 5)
+        starting = _leftover(tmp_path, '3_starting')
+        other = tmp_path / 'not_a_workspace'
+        other.mkdir()
+
+        removed = Workspace.sweep(str(tmp_path))
+
+        assert sorted(removed) == sorted([crashed, stale])
+        assert os.path.isdir(live.path)
+        assert os.path.isdir(starting)
+        assert other.is_dir()
+    finally:
+        live.close()
+
+def test_sweep_of_missing_root_is_a_no_op(tmp_path):
+    assert Workspace.sweep(str(tmp_path / 'missing')) == []
+
+def test_empty_root_resolves_under_the_system_temp_directory():
+    assert Workspace.resolve_root('') == os.path.join(tempfile.gettempdir(), 'mp4creator')
+    assert Workspace.resolve_root('relative') == os.path.abspath('relative')